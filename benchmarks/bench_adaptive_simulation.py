@@ -0,0 +1,56 @@
+"""Trials and time saved by adaptive simulation across common configurations.
+
+For each mode and a few dice setups, runs a fixed ``--trials`` simulation
+and an adaptive one capped at the same number of trials that stops once
+every probability is within ``--epsilon`` (95% confidence).
+
+    PYTHONPATH=src python benchmarks/bench_adaptive_simulation.py --epsilon 0.005
+"""
+
+import argparse
+import time
+
+from dice_game.domain.config import GameConfig
+from dice_game.domain.models import RollContext
+from dice_game.domain.modes import GameMode
+from dice_game.services.simulation import simulate
+
+SETUPS = ((2, 6), (3, 6), (5, 10), (10, 20))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=1_000_000)
+    parser.add_argument("--epsilon", type=float, default=0.005)
+    parser.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto")
+    args = parser.parse_args()
+
+    for mode in GameMode:
+        for dice, sides in SETUPS:
+            context = RollContext("bench", mode, f"D{sides}", dice, sides)
+            timings = []
+            for epsilon in (None, args.epsilon):
+                start = time.perf_counter()
+                report = simulate(
+                    game_config=GameConfig(),
+                    context=context,
+                    trials=args.trials,
+                    engine=args.engine,
+                    seed=0,
+                    epsilon=epsilon,
+                )
+                timings.append((time.perf_counter() - start, report))
+
+            (fixed_s, fixed), (adaptive_s, adaptive) = timings
+            assert fixed.precision is not None and adaptive.precision is not None
+            print(
+                f"{mode.name.lower():<7} {dice:>2}×D{sides:<3}"
+                f" fixed {fixed.config.trials:>9,} ±{fixed.precision.half_width:.4f}"
+                f" {fixed_s:>6.2f}s"
+                f" | adaptive {adaptive.config.trials:>9,}"
+                f" ±{adaptive.precision.half_width:.4f} {adaptive_s:>6.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Request latency under concurrency: async routes vs the old sync routes.
+
+The ``sync`` app mounts the previous ``def`` handlers, which Starlette runs on
+its threadpool (40 threads) with every SQLite call blocking a thread. The
+``async`` app is the real one, whose ``async def`` handlers await the
+dedicated database thread in `dice_game.storage.aio`. Both are driven
+in-process through httpx's ASGI transport by ``--clients`` concurrent
+clients, each alternating a roll and a stats read on its own session.
+
+    PYTHONPATH=src python benchmarks/bench_async_routes.py --clients 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+from dice_game.api.app import create_app
+from dice_game.api.schemas import RollRequest, StatsResponse
+from dice_game.services.game_session_service import play_session_turn
+from dice_game.storage.aio import close_db_executor
+from dice_game.storage.connection import close_pools
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_repository import session_stats
+from dice_game.storage.session_repository import create_game_session, get_game_session
+
+connection_module = sys.modules["dice_game.storage.connection"]
+
+ROLL = {"mode": "classic", "dice_type": "D6", "num_dice": 2}
+
+
+def create_sync_app() -> FastAPI:
+    """The two benchmarked endpoints as they were before going async."""
+    app = FastAPI()
+
+    @app.post("/sessions/{game_session_id}/roll")
+    def roll(game_session_id: str, request: RollRequest):
+        outcome = play_session_turn(
+            game_session_id=game_session_id,
+            mode_name=request.mode.value,
+            dice_type=request.dice_type.value,
+            num_dice=request.num_dice,
+        )
+        return {"points_total": outcome.result.points_total}
+
+    @app.get("/sessions/{game_session_id}/stats", response_model=StatsResponse)
+    def get_stats(game_session_id: str):
+        session = get_game_session(game_session_id)
+        assert session is not None
+        return StatsResponse(
+            game_session_id=game_session_id,
+            player_points=session["player_points"],
+            **session_stats(game_session_id),
+        )
+
+    return app
+
+
+async def drive(app: FastAPI, clients: int, requests: int) -> tuple[list[float], float]:
+    sessions = [create_game_session()["id"] for _ in range(clients)]
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async def client(http: httpx.AsyncClient, session_id: str) -> None:
+        for index in range(requests):
+            start = time.perf_counter()
+            if index % 2 == 0:
+                response = await http.post(f"/sessions/{session_id}/roll", json=ROLL)
+            else:
+                response = await http.get(f"/sessions/{session_id}/stats")
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(http, session_id) for session_id in sessions))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def run(name: str, app: FastAPI, clients: int, requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        connection_module.DB_PATH = Path(tmp) / f"{name}.db"
+        init_db()
+        latencies, elapsed = asyncio.run(drive(app, clients, requests))
+        close_db_executor()
+        close_pools()
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<6} req/s={len(latencies) / elapsed:>7,.0f}"
+        f"  p50={cuts[49] * 1000:>7.2f} ms  p99={cuts[98] * 1000:>7.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20, help="per client")
+    args = parser.parse_args()
+
+    run("sync", create_sync_app(), args.clients, args.requests)
+    run("async", create_app(), args.clients, args.requests)
+
+
+if __name__ == "__main__":
+    main()
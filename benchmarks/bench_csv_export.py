@@ -0,0 +1,88 @@
+"""CSV export throughput and peak memory against table size.
+
+Fills a throwaway database with ``--rows`` rolls, then exports it in a fresh
+child process (so the parent's fill does not count towards peak RSS) and
+reports rows/sec and the child's peak resident set size. With the streaming
+exporter peak RSS stays flat as ``--rows`` grows. Under the ``performance``
+storage profile RSS also includes up to ``mmap_size`` of memory-mapped
+database pages (clean, reclaimable page cache); run with
+``DICE_GAME_DB_PROFILE=default`` to see the Python heap alone.
+
+    PYTHONPATH=src python benchmarks/bench_csv_export.py --rows 2000000
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from dice_game.storage.connection import close_pools, connection
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_repository import export_rolls_to_csv
+from dice_game.storage.session_repository import create_game_session
+
+connection_module = sys.modules["dice_game.storage.connection"]
+
+
+def fill(rows: int) -> None:
+    session_id = create_game_session()["id"]
+    row = (session_id, "2026-03-08T10:00:00+00:00", "classic", 2, "D6", 6)
+    with connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO rolls (
+                game_session_id, time, mode, dice, dice_type, sides, rolls,
+                total, has_match, outcome, points_delta, points_total
+            )
+            VALUES (?, ?, ?, ?, ?, ?, '[3, 4]', 7, 0, 'lose', -3, -3)
+            """,
+            (row for _ in range(rows)),
+        )
+
+
+def export(db_path: str, csv_path: str) -> None:
+    connection_module.DB_PATH = Path(db_path)
+    start = time.perf_counter()
+    exported = export_rolls_to_csv(csv_path)
+    elapsed = time.perf_counter() - start
+    close_pools()
+
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"rows={exported:>10,}  {exported / elapsed:>10,.0f} rows/s"
+        f"  peak RSS={peak_mib:>7.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--export", nargs=2, metavar=("DB", "CSV"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.export:
+        export(*args.export)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sorted({args.rows // 10, args.rows}):
+            db_path = Path(tmp) / f"export_{rows}.db"
+            connection_module.DB_PATH = db_path
+            init_db()
+            fill(rows)
+            close_pools()
+
+            subprocess.run(
+                [sys.executable, __file__, "--export", str(db_path), os.devnull],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
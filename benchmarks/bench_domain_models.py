@@ -0,0 +1,86 @@
+"""Memory and throughput of `RollResult`: slotted vs the previous dataclass.
+
+``legacy`` is the old shape: a plain frozen dataclass with a per-instance
+``__dict__``, rolls kept as a list, and ``total``/``has_match`` as
+properties that re-sum and rebuild a set on every access. ``slotted`` is
+the current `dice_game.domain.models.RollResult`. For each, the benchmark
+builds ``--count`` results and keeps them alive, reporting bytes per
+result (tracemalloc) and constructions per second. It then reads
+``total`` and ``has_match`` four times per result, the way one turn's
+save, stats and printing do.
+
+    PYTHONPATH=src python benchmarks/bench_domain_models.py --count 2000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from dice_game.domain.models import RollContext, RollResult
+from dice_game.domain.modes import GameMode
+
+ACCESSES_PER_RESULT = 4
+
+
+@dataclass(frozen=True)
+class LegacyRollResult:
+    context: RollContext
+    rolls: list[int]
+    outcome: str
+    points_delta: int
+    points_total: int
+
+    @property
+    def total(self) -> int:
+        return sum(self.rolls)
+
+    @property
+    def has_match(self) -> bool:
+        return bool(self.rolls) and len(set(self.rolls)) == 1
+
+
+def run(name: str, cls: type, rolls: list[list[int]], context: RollContext) -> None:
+    start = time.perf_counter()
+    results = [cls(context, list(values), "draw", 0, 0) for values in rolls]
+    build_seconds = time.perf_counter() - start
+    del results
+
+    # Measured separately: tracemalloc slows allocation down several times.
+    tracemalloc.start()
+    results = [cls(context, list(values), "draw", 0, 0) for values in rolls]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    checksum = 0
+    for result in results:
+        for _ in range(ACCESSES_PER_RESULT):
+            checksum += result.total + result.has_match
+    read_seconds = time.perf_counter() - start
+
+    print(
+        f"{name:<8} {held / len(results):>6.1f} B/result"
+        f"  build={len(results) / build_seconds / 1e6:>5.2f} M/s"
+        f"  reads={len(results) * ACCESSES_PER_RESULT / read_seconds / 1e6:>5.2f} M/s"
+        f"  (checksum {checksum})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2_000_000)
+    parser.add_argument("--dice", type=int, default=2)
+    args = parser.parse_args()
+
+    context = RollContext("bench", GameMode.CLASSIC, "D6", args.dice, 6)
+    rng = random.Random(0)
+    rolls = [[rng.randint(1, 6) for _ in range(args.dice)] for _ in range(args.count)]
+
+    run("legacy", LegacyRollResult, rolls, context)
+    run("slotted", RollResult, rolls, context)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Page latency at increasing depth: OFFSET paging vs keyset (before_id).
+
+Fills a throwaway database with ``--rows`` rolls for one session, then times
+fetching a page at several depths both ways. OFFSET latency grows with the
+depth; keyset latency stays flat because the id index seeks straight to it.
+
+    PYTHONPATH=src python benchmarks/bench_keyset_pagination.py --rows 1100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from dice_game.storage.connection import close_pools, connection
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_repository import paginated_rolls_by_session
+from dice_game.storage.session_repository import create_game_session
+
+connection_module = sys.modules["dice_game.storage.connection"]
+
+
+def fill(session_id: str, rows: int) -> None:
+    row = (
+        session_id,
+        "2026-03-08T10:00:00+00:00",
+        "classic",
+        2,
+        "D6",
+        6,
+        "[3, 4]",
+        7,
+        0,
+        "lose",
+        -3,
+        -3,
+    )
+    with connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO rolls (
+                game_session_id, time, mode, dice, dice_type, sides, rolls,
+                total, has_match, outcome, points_delta, points_total
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (row for _ in range(rows)),
+        )
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_100_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connection_module.DB_PATH = Path(tmp) / "keyset.db"
+        init_db()
+        session_id = create_game_session()["id"]
+        fill(session_id, args.rows)
+
+        with connection() as conn:
+            newest_id = conn.execute("SELECT MAX(id) FROM rolls").fetchone()[0]
+
+        depths = [d for d in (0, 100_000, 1_000_000) if d < args.rows]
+        for depth in depths:
+            offset_ms = best_of(
+                args.repeat,
+                lambda depth=depth: paginated_rolls_by_session(
+                    session_id, limit=args.page_size, offset=depth
+                ),
+            )
+            # The cursor a client would hold after paging down to ``depth``.
+            before_id = newest_id - depth + 1
+            keyset_ms = best_of(
+                args.repeat,
+                lambda before_id=before_id: paginated_rolls_by_session(
+                    session_id, limit=args.page_size, before_id=before_id
+                ),
+            )
+            print(
+                f"depth={depth:>9,}  offset={offset_ms:>8.2f} ms"
+                f"  keyset={keyset_ms:>6.2f} ms"
+            )
+
+        close_pools()
+
+
+if __name__ == "__main__":
+    main()
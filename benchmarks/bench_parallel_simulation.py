@@ -0,0 +1,75 @@
+"""Scaling benchmark for process-pool Monte Carlo simulation.
+
+Runs the same seeded simulation with 1, 2, 4, ... workers (up to the CPU
+count or ``--max-workers``), prints wall time and speedup relative to one
+worker, and checks every run produced the identical report.
+
+    PYTHONPATH=src python benchmarks/bench_parallel_simulation.py --trials 20000000
+"""
+
+import argparse
+import os
+import time
+
+from dice_game.domain.config import GameConfig
+from dice_game.domain.models import RollContext
+from dice_game.domain.modes import GameMode
+from dice_game.services.simulation import simulate
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=10_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto")
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+
+    context = RollContext(
+        game_session_id="benchmark",
+        mode=GameMode.LUCKY,
+        dice_type="D6",
+        num_dice=5,
+        sides=6,
+    )
+
+    baseline_seconds = None
+    baseline_report = None
+
+    print(f"trials={args.trials:,} engine={args.engine} seed={args.seed}")
+    print(f"{'workers':>7}  {'seconds':>8}  {'trials/s':>12}  {'speedup':>7}")
+
+    for workers in worker_counts(args.max_workers):
+        start = time.perf_counter()
+        report = simulate(
+            game_config=GameConfig(),
+            context=context,
+            trials=args.trials,
+            engine=args.engine,
+            seed=args.seed,
+            workers=workers,
+        )
+        seconds = time.perf_counter() - start
+
+        if baseline_seconds is None:
+            baseline_seconds, baseline_report = seconds, report
+        elif report != baseline_report:
+            raise SystemExit(f"Report with {workers} workers differs from 1 worker")
+
+        print(
+            f"{workers:>7}  {seconds:>8.2f}  {args.trials / seconds:>12,.0f}"
+            f"  {baseline_seconds / seconds:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
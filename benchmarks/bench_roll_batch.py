@@ -0,0 +1,61 @@
+"""Micro-benchmark: per-die ``roll_dice`` versus batched ``roll_dice_batch``.
+
+PYTHONPATH=src python benchmarks/bench_roll_batch.py --rolls 1000000 --dice 5
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from dice_game.domain.models import RollContext
+from dice_game.domain.modes import GameMode
+from dice_game.services.logic import roll_dice, roll_dice_batch
+from dice_game.services.rng import NumpyRollBackend, StdlibRollBackend, np
+
+
+def timed(label: str, rolls: int, func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<28} {seconds:>8.3f}s  {rolls / seconds:>14,.0f} rolls/s")
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rolls", type=int, default=1_000_000)
+    parser.add_argument("--dice", type=int, default=5)
+    parser.add_argument("--sides", type=int, default=6)
+    args = parser.parse_args()
+
+    context = RollContext(
+        game_session_id="benchmark",
+        mode=GameMode.CLASSIC,
+        dice_type=f"D{args.sides}",
+        num_dice=args.dice,
+        sides=args.sides,
+    )
+    n = args.rolls
+
+    print(f"{n:,} rolls of {args.dice}×D{args.sides}")
+    baseline = timed(
+        "roll_dice (per die)", n, lambda: [roll_dice(context) for _ in range(n)]
+    )
+    stdlib = timed(
+        "roll_dice_batch (stdlib)",
+        n,
+        lambda: roll_dice_batch(context, n, backend=StdlibRollBackend()),
+    )
+    print(f"  stdlib batch speedup: {baseline / stdlib:.1f}x")
+
+    if np is not None:
+        numpy = timed(
+            "roll_dice_batch (numpy)",
+            n,
+            lambda: roll_dice_batch(context, n, backend=NumpyRollBackend()),
+        )
+        print(f"  numpy batch speedup:  {baseline / numpy:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
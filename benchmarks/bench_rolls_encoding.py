@@ -0,0 +1,89 @@
+"""Storage size and read speed: JSON text rolls vs roll_codec BLOBs.
+
+Writes the same ``--rows`` random rolls (2–20 dice, D6 or D20) into two
+throwaway databases, one with legacy JSON text and one with the binary
+encoding, then reports bytes per ``rolls`` value, database file size and the
+time to read every row back through the repository (which decodes ``rolls``).
+
+    PYTHONPATH=src python benchmarks/bench_rolls_encoding.py --rows 200000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from dice_game.storage.connection import close_pools, connection
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_codec import encode_rolls
+from dice_game.storage.roll_repository import paginated_rolls
+from dice_game.storage.session_repository import create_game_session
+
+connection_module = sys.modules["dice_game.storage.connection"]
+
+
+def random_rolls(rows: int) -> list[tuple[int, list[int]]]:
+    rng = random.Random(42)
+    samples = []
+    for _ in range(rows):
+        sides = rng.choice((6, 20))
+        samples.append((sides, rng.choices(range(1, sides + 1), k=rng.randint(2, 20))))
+    return samples
+
+
+def run(
+    name: str,
+    path: Path,
+    samples: list[tuple[int, list[int]]],
+    encode: Callable[[list[int]], object],
+) -> None:
+    connection_module.DB_PATH = path
+    init_db()
+    session_id = create_game_session()["id"]
+    with connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO rolls (
+                game_session_id, time, mode, dice, dice_type, sides, rolls,
+                total, has_match, outcome, points_delta, points_total
+            )
+            VALUES (?, '2026-03-08T10:00:00+00:00', 'classic', ?, ?, ?, ?, ?,
+                    0, 'lose', -3, -3)
+            """,
+            ((session_id, len(r), f"D{s}", s, encode(r), sum(r)) for s, r in samples),
+        )
+    with connection() as conn:
+        conn.execute("VACUUM")
+        value_bytes = conn.execute("SELECT AVG(length(rolls)) FROM rolls").fetchone()[0]
+
+    start = time.perf_counter()
+    before_id = None
+    while page := paginated_rolls(limit=100, before_id=before_id):
+        before_id = page[-1]["id"]
+    elapsed = time.perf_counter() - start
+    close_pools()
+
+    print(
+        f"{name:<6} rolls={value_bytes:>5.1f} B/row"
+        f"  db={path.stat().st_size / 2**20:>7.1f} MiB"
+        f"  read={len(samples) / elapsed:>10,.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    samples = random_rolls(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        run("json", Path(tmp) / "json.db", samples, json.dumps)
+        run("binary", Path(tmp) / "binary.db", samples, encode_rolls)
+
+
+if __name__ == "__main__":
+    main()
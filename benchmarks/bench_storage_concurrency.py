@@ -0,0 +1,97 @@
+"""Reader throughput while a writer keeps committing rolls, per profile.
+
+For each storage profile a writer thread inserts rolls in short transactions
+while reader threads page through history. Under the ``default`` rollback
+journal readers stall while commits hold the database lock; under
+``performance`` (WAL) they keep reading.
+
+    PYTHONPATH=src python benchmarks/bench_storage_concurrency.py --seconds 3
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from dice_game.domain.models import RollContext, RollResult
+from dice_game.domain.modes import GameMode
+from dice_game.storage.connection import STORAGE_PROFILES, close_pools
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_repository import paginated_rolls_by_session, save_roll
+from dice_game.storage.session_repository import create_game_session
+
+connection_module = sys.modules["dice_game.storage.connection"]
+
+
+def run_profile(name: str, seconds: float, readers: int) -> None:
+    os.environ["DICE_GAME_DB_PROFILE"] = name
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connection_module.DB_PATH = Path(tmp) / f"{name}.db"
+        init_db()
+        session_id = create_game_session()["id"]
+        result = RollResult(
+            context=RollContext(session_id, GameMode.CLASSIC, "D6", 2, 6),
+            rolls=[3, 4],
+            outcome="draw",
+            points_delta=0,
+            points_total=0,
+        )
+
+        stop = threading.Event()
+        writes = 0
+        read_latencies: list[float] = []
+        errors: list[Exception] = []
+
+        def writer() -> None:
+            nonlocal writes
+            while not stop.is_set():
+                try:
+                    save_roll(result)
+                    writes += 1
+                except Exception as exc:  # noqa: BLE001 - reported below
+                    errors.append(exc)
+
+        def reader() -> None:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    paginated_rolls_by_session(session_id, limit=10, offset=0)
+                except Exception as exc:  # noqa: BLE001 - reported below
+                    errors.append(exc)
+                read_latencies.append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=writer)]
+        threads += [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        close_pools()
+
+    p99 = statistics.quantiles(read_latencies, n=100)[98] * 1000
+    print(
+        f"{name:<12} writes/s={writes / seconds:>8,.0f}"
+        f"  reads/s={len(read_latencies) / seconds:>8,.0f}"
+        f"  read p99={p99:>7.2f} ms  errors={len(errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    for name in STORAGE_PROFILES:
+        run_profile(name, args.seconds, args.readers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Full parameter sweep vs one `simulate` call per cell.
+
+The sweep covers every dice type, 2-20 dice and every mode. ``per-cell``
+runs `exact_simulation` / `simulate` once per (dice type, dice count,
+mode), rolling and convolving separately for each; `sweep` shares one
+convolution chain or roll matrix per dice type across dice counts and
+modes.
+
+    PYTHONPATH=src python benchmarks/bench_sweep.py --trials 100000
+"""
+
+import argparse
+import time
+
+from dice_game.domain.config import GameConfig
+from dice_game.domain.models import RollContext
+from dice_game.services.simulation import exact_simulation, simulate
+from dice_game.services.sweep import SweepCell, sweep
+
+
+def per_cell(cells: list[SweepCell], method: str, trials: int, engine: str) -> float:
+    start = time.perf_counter()
+    for cell in cells:
+        context = RollContext("bench", cell.mode, cell.dice_type, cell.dice, cell.sides)
+        if method == "exact":
+            exact_simulation(game_config=GameConfig(), context=context)
+        else:
+            simulate(
+                game_config=GameConfig(),
+                context=context,
+                trials=trials,
+                engine=engine,  # type: ignore[arg-type]
+                seed=0,
+            )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=100_000)
+    parser.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    for method in ("exact", "monte_carlo"):
+        start = time.perf_counter()
+        cells = sweep(
+            game_config=GameConfig(),
+            method=method,  # type: ignore[arg-type]
+            trials=args.trials,
+            engine=args.engine,  # type: ignore[arg-type]
+            seed=0,
+            workers=args.workers,
+        )
+        sweep_s = time.perf_counter() - start
+        cell_s = per_cell(cells, method, args.trials, args.engine)
+        print(
+            f"{method:<12} {len(cells)} cells"
+            f"  sweep {sweep_s:>6.2f}s  per-cell {cell_s:>6.2f}s"
+            f"  ({cell_s / sweep_s:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
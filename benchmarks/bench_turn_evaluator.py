@@ -0,0 +1,82 @@
+"""Turns per second: four-step turn pipeline vs the single-pass evaluator.
+
+``pipeline`` is the previous path: `build_temp_result`, `resolve_turn`,
+`apply_turn_effects` and `finalize_result`, which builds two `RollResult`s.
+``take_turn`` scores the rolls once and builds only the final result, and
+``evaluate`` scores without building any result (what a caller that only
+needs the outcome and delta pays). Dice are pre-rolled so that only the
+turn logic is timed.
+
+    PYTHONPATH=src python benchmarks/bench_turn_evaluator.py --turns 1000000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Sequence
+
+from dice_game.domain.config import GameConfig
+from dice_game.domain.models import RollContext, TurnState
+from dice_game.domain.modes import GameMode
+from dice_game.domain.stats import Stats
+from dice_game.services.logic import (
+    apply_turn_effects,
+    build_temp_result,
+    evaluate_turn,
+    finalize_result,
+    resolve_turn,
+    take_turn,
+)
+
+
+def pipeline(state: TurnState, context: RollContext, rolls: Sequence[int]) -> None:
+    temp_result = build_temp_result(context, list(rolls), state.player_points)
+    outcome, delta = resolve_turn(state.game_config, temp_result)
+    apply_turn_effects(state, temp_result, delta)
+    finalize_result(temp_result, outcome, delta, state.player_points)
+
+
+def evaluate(state: TurnState, context: RollContext, rolls: Sequence[int]) -> None:
+    evaluate_turn(state.game_config, context, rolls)
+
+
+def run(
+    name: str,
+    turn: Callable[[TurnState, RollContext, Sequence[int]], object],
+    context: RollContext,
+    rolls: list[tuple[int, ...]],
+) -> None:
+    state = TurnState(GameConfig(), context.game_session_id, 0, Stats())
+    start = time.perf_counter()
+    for values in rolls:
+        turn(state, context, values)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {len(rolls) / elapsed / 1e6:>6.2f} M turns/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=1_000_000)
+    parser.add_argument("--dice", type=int, default=2)
+    parser.add_argument("--sides", type=int, default=6)
+    parser.add_argument(
+        "--mode", choices=[mode.name.lower() for mode in GameMode], default="classic"
+    )
+    args = parser.parse_args()
+
+    context = RollContext(
+        "bench", GameMode[args.mode.upper()], f"D{args.sides}", args.dice, args.sides
+    )
+    rng = random.Random(0)
+    rolls = [
+        tuple(rng.randint(1, args.sides) for _ in range(args.dice))
+        for _ in range(args.turns)
+    ]
+
+    run("pipeline", pipeline, context, rolls)
+    run("take_turn", take_turn, context, rolls)
+    run("evaluate", evaluate, context, rolls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Per-roll latency: three-connection turn path versus one transaction.
+
+The legacy path reproduces the pre-transaction ``play_session_turn``: one
+connection each for the session read, the points update and the roll insert.
+The transactional path is the current ``play_session_turn``.
+
+    PYTHONPATH=src python benchmarks/bench_turn_pipeline.py --rolls 2000
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from dice_game.domain.config import GameConfig
+from dice_game.domain.constants import DICE_TYPES
+from dice_game.domain.models import RollContext, TurnState
+from dice_game.domain.modes import GameMode
+from dice_game.domain.stats import Stats
+from dice_game.services.game_session_service import play_session_turn
+from dice_game.services.logic import (
+    apply_turn_effects,
+    build_temp_result,
+    finalize_result,
+    resolve_turn,
+    roll_dice,
+)
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_repository import save_roll
+from dice_game.storage.session_repository import (
+    create_game_session,
+    get_game_session,
+    update_game_session_points,
+)
+
+
+def legacy_turn(game_session_id: str) -> None:
+    session = get_game_session(game_session_id)
+    assert session is not None
+    context = RollContext(
+        game_session_id=game_session_id,
+        mode=GameMode.CLASSIC,
+        dice_type="D6",
+        num_dice=2,
+        sides=DICE_TYPES["D6"],
+    )
+    state = TurnState(
+        game_session_id=game_session_id,
+        game_config=GameConfig(),
+        stats=Stats(),
+        player_points=session["player_points"],
+    )
+    temp_result = build_temp_result(context, roll_dice(context), state.player_points)
+    outcome, delta = resolve_turn(state.game_config, temp_result)
+    apply_turn_effects(state, temp_result, delta)
+    result = finalize_result(temp_result, outcome, delta, state.player_points)
+    update_game_session_points(game_session_id, result.points_total)
+    save_roll(result)
+
+
+def transactional_turn(game_session_id: str) -> None:
+    play_session_turn(
+        game_session_id=game_session_id,
+        mode_name="classic",
+        dice_type="D6",
+        num_dice=2,
+    )
+
+
+def measure(label: str, rolls: int, turn: Callable[[str], None]) -> float:
+    game_session_id = create_game_session()["id"]
+    latencies = []
+    for _ in range(rolls):
+        start = time.perf_counter()
+        turn(game_session_id)
+        latencies.append(time.perf_counter() - start)
+
+    mean_ms = statistics.fmean(latencies) * 1000
+    p99_ms = statistics.quantiles(latencies, n=100)[98] * 1000
+    print(f"{label:<16} mean={mean_ms:.3f} ms  p99={p99_ms:.3f} ms")
+    return mean_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rolls", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # storage/__init__ re-exports the connection() function under the
+        # module's name, so patch the module itself.
+        sys.modules["dice_game.storage.connection"].DB_PATH = Path(tmp) / "bench.db"
+        init_db()
+
+        legacy = measure("3 connections", args.rolls, legacy_turn)
+        single = measure("1 transaction", args.rolls, transactional_turn)
+        print(f"per-roll latency reduced by {(1 - single / legacy) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
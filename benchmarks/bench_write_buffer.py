@@ -0,0 +1,68 @@
+"""Roll persistence throughput: strict per-roll commits vs group commit.
+
+Writes ``--rolls`` rolls through `record_roll` for every storage profile in
+both write modes against a throwaway database. ``strict`` commits (and under
+the ``default`` profile fsyncs) once per roll; ``group`` batches rolls into
+one ``executemany`` transaction per ``DICE_GAME_WRITE_BUFFER_SIZE`` rolls.
+
+    PYTHONPATH=src python benchmarks/bench_write_buffer.py --rolls 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from dice_game.domain.models import RollContext, RollResult
+from dice_game.domain.modes import GameMode
+from dice_game.storage.connection import STORAGE_PROFILES, close_pools
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_repository import count_rolls
+from dice_game.storage.session_repository import create_game_session
+from dice_game.storage.write_buffer import close_roll_buffer, record_roll
+
+connection_module = sys.modules["dice_game.storage.connection"]
+
+
+def run(profile: str, mode: str, rolls: int) -> None:
+    os.environ["DICE_GAME_DB_PROFILE"] = profile
+    os.environ["DICE_GAME_WRITE_MODE"] = mode
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connection_module.DB_PATH = Path(tmp) / f"{profile}-{mode}.db"
+        init_db()
+        session_id = create_game_session()["id"]
+        result = RollResult(
+            context=RollContext(session_id, GameMode.CLASSIC, "D6", 2, 6),
+            rolls=[3, 4],
+            outcome="draw",
+            points_delta=0,
+            points_total=0,
+        )
+
+        start = time.perf_counter()
+        for _ in range(rolls):
+            record_roll(result)
+        close_roll_buffer()  # the durable flush is part of the cost
+        elapsed = time.perf_counter() - start
+
+        assert count_rolls() == rolls
+        close_pools()
+
+    print(f"{profile:<12} {mode:<7} {rolls / elapsed:>10,.0f} rolls/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rolls", type=int, default=5_000)
+    args = parser.parse_args()
+
+    for profile in STORAGE_PROFILES:
+        for mode in ("strict", "group"):
+            run(profile, mode, args.rolls)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 from .app import app, create_app
 from .schemas import (
+    BulkRollRequest,
+    BulkRollResponse,
     DeleteHistoryResponse,
     DeleteSessionResponse,
     ExportHistoryResponse,
     HistoryItemResponse,
+    HistoryPageResponse,
     RollRequest,
     RollResponse,
     SessionResponse,
@@ -14,10 +17,13 @@ __all__ = [
     "app",
     "create_app",
     "RollRequest",
+    "BulkRollRequest",
     "SessionResponse",
     "DeleteSessionResponse",
     "RollResponse",
+    "BulkRollResponse",
     "HistoryItemResponse",
+    "HistoryPageResponse",
     "DeleteHistoryResponse",
     "ExportHistoryResponse",
     "StatsResponse",
@@ -1,16 +1,31 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from ..storage.aio import close_db_executor
+from ..storage.connection import close_pools
 from ..storage.db_init import init_db
+from ..storage.write_buffer import close_roll_buffer
 from .routes.history import router as history_router
 from .routes.roll import router as roll_router
 from .routes.sessions import router as sessions_router
 from .routes.stats import router as stats_router
 
 
-def create_app() -> FastAPI:
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Initialise on startup rather than at import, so importing the app
+    # (e.g. during test collection) never touches the database file.
     init_db()
+    yield
+    close_db_executor()
+    close_roll_buffer()
+    close_pools()
 
-    app = FastAPI(title="Dice Game API", version="2.0.0")
+
+def create_app() -> FastAPI:
+    app = FastAPI(title="Dice Game API", version="2.0.0", lifespan=lifespan)
 
     app.include_router(sessions_router)
     app.include_router(roll_router)
@@ -1,9 +1,11 @@
 from .history import (
     delete_history,
+    download_history,
     export_history,
     get_history,
+    get_history_page,
 )
-from .roll import roll
+from .roll import roll, roll_many
 from .sessions import (
     create_session,
     delete_session,
@@ -16,8 +18,11 @@ __all__ = [
     "get_session",
     "delete_session",
     "roll",
+    "roll_many",
     "get_stats",
     "get_history",
+    "get_history_page",
     "delete_history",
     "export_history",
+    "download_history",
 ]
@@ -1,59 +1,125 @@
-from fastapi import APIRouter, HTTPException, Query
+import re
+from pathlib import Path
+from typing import Literal
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from ...services.exceptions import (
     GameSessionNotFoundError,
     HistoryExportError,
+    InvalidCursorError,
+)
+from ...services.export_service import (
+    gzip_chunks,
+    history_csv_size,
+    iter_history_csv,
+    plan_history_download,
 )
-from ...services.history_service import clear_session_history
-from ...storage.roll_repository import (
+from ...services.history_service import clear_session_history, session_history_page
+from ...storage.aio import (
+    export_rolls_columnar,
     export_rolls_to_csv_by_session,
+    flush_rolls,
+    get_game_session,
     paginated_rolls_by_session,
+    run_in_db,
+)
+from ...storage.roll_repository import columnar_export_path
+from ..schemas import (
+    DeleteHistoryResponse,
+    ExportHistoryResponse,
+    HistoryItemResponse,
+    HistoryPageResponse,
 )
-from ...storage.session_repository import get_game_session
-from ..schemas import DeleteHistoryResponse, ExportHistoryResponse, HistoryItemResponse
 
 router = APIRouter(prefix="/sessions", tags=["history"])
 
+_OPEN_RANGE = re.compile(r"bytes=(\d+)-")
+
+
+def _range_start(range_header: str | None) -> int | None:
+    """Start offset of a ``bytes=N-`` range; other forms are ignored."""
+    if range_header is None:
+        return None
+    match = _OPEN_RANGE.fullmatch(range_header.strip())
+    return int(match.group(1)) if match else None
+
 
 @router.get("/{game_session_id}/history", response_model=list[HistoryItemResponse])
-def get_history(
+async def get_history(
     game_session_id: str,
     limit: int = Query(default=10, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
 ):
-    session = get_game_session(game_session_id)
+    await flush_rolls()
+    session = await get_game_session(game_session_id)
     try:
         if session is None:
             raise GameSessionNotFoundError("Game session not found")
     except GameSessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
-    return paginated_rolls_by_session(
+    return await paginated_rolls_by_session(
         game_session_id,
         limit=limit,
         offset=offset,
     )
 
 
+@router.get("/{game_session_id}/history/page", response_model=HistoryPageResponse)
+async def get_history_page(
+    game_session_id: str,
+    limit: int = Query(default=10, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+):
+    """Cursor-paginated history; pass ``next_cursor`` back to get the next page."""
+    await flush_rolls()
+    try:
+        return await run_in_db(
+            session_history_page, game_session_id, limit=limit, cursor=cursor
+        )
+    except GameSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
 @router.delete("/{game_session_id}/history", response_model=DeleteHistoryResponse)
-def delete_history(game_session_id: str):
+async def delete_history(game_session_id: str):
+    await flush_rolls()
     try:
-        result = clear_session_history(game_session_id)
+        result = await run_in_db(clear_session_history, game_session_id)
         return result
     except GameSessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
 @router.get("/{game_session_id}/history/export", response_model=ExportHistoryResponse)
-def export_history(game_session_id: str):
-    session = get_game_session(game_session_id)
+async def export_history(
+    game_session_id: str,
+    export_format: Literal["csv", "columnar"] = Query(default="csv", alias="format"),
+):
+    await flush_rolls()
+    session = await get_game_session(game_session_id)
     try:
         if session is None:
             raise GameSessionNotFoundError("Game session not found")
     except GameSessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
-    exported = export_rolls_to_csv_by_session(game_session_id)
+    if export_format == "columnar":
+        file_path = columnar_export_path(game_session_id=game_session_id)
+        exported = await export_rolls_columnar(
+            file_path, game_session_id=game_session_id
+        )
+        file_name = Path(file_path).name
+        file_kind = "columnar"
+    else:
+        exported = await export_rolls_to_csv_by_session(game_session_id)
+        file_name = f"roll_history_{game_session_id}.csv"
+        file_kind = "CSV"
 
     try:
         if exported == 0:
@@ -62,7 +128,66 @@ def export_history(game_session_id: str):
         raise HTTPException(status_code=404, detail=str(e)) from e
 
     return ExportHistoryResponse(
-        message=f"Exported {exported} rolls to CSV file",
+        message=f"Exported {exported} rolls to {file_kind} file",
         records=exported,
-        file=f"roll_history_{game_session_id}.csv",
+        file=file_name,
+    )
+
+
+@router.get("/{game_session_id}/history/download", response_class=StreamingResponse)
+async def download_history(
+    game_session_id: str,
+    gzip: bool = Query(default=False),
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_range: str | None = Header(default=None),
+):
+    """Streams the session's rolls as CSV, oldest first.
+
+    ``gzip=true`` compresses the stream. Uncompressed downloads can be
+    resumed with ``Range: bytes=N-`` (plus ``If-Range: <etag>``). The body is
+    produced on Starlette's threadpool rather than the database thread, so a
+    slow client never holds up other requests' queries.
+    """
+    await flush_rolls()
+    try:
+        download = await run_in_db(plan_history_download, game_session_id)
+    except GameSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    headers = {
+        "ETag": download.etag,
+        "Content-Disposition": f'attachment; filename="{download.filename}"',
+    }
+
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        headers["Accept-Ranges"] = "none"
+        return StreamingResponse(
+            gzip_chunks(iter_history_csv(download)),
+            media_type="text/csv",
+            headers=headers,
+        )
+
+    headers["Accept-Ranges"] = "bytes"
+    start = _range_start(range_header)
+    if start is None or (if_range is not None and if_range != download.etag):
+        return StreamingResponse(
+            iter_history_csv(download), media_type="text/csv", headers=headers
+        )
+
+    size = await run_in_threadpool(history_csv_size, download)
+    if start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+
+    headers["Content-Range"] = f"bytes {start}-{size - 1}/{size}"
+    headers["Content-Length"] = str(size - start)
+    return StreamingResponse(
+        iter_history_csv(download, start=start),
+        status_code=206,
+        media_type="text/csv",
+        headers=headers,
     )
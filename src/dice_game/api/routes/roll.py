@@ -1,6 +1,10 @@
 from fastapi import APIRouter, HTTPException
 
-from dice_game.services.game_session_service import play_session_turn
+from dice_game.services.game_session_service import (
+    play_session_turn,
+    play_session_turns,
+)
+from dice_game.storage.aio import run_in_db
 
 from ...services.exceptions import (
     GameSessionNotFoundError,
@@ -8,15 +12,16 @@ from ...services.exceptions import (
     InvalidDiceTypeError,
     InvalidGameModeError,
 )
-from ..schemas import RollRequest, RollResponse
+from ..schemas import BulkRollRequest, BulkRollResponse, RollRequest, RollResponse
 
 router = APIRouter(prefix="/sessions", tags=["roll"])
 
 
 @router.post("/{game_session_id}/roll", response_model=RollResponse)
-def roll(game_session_id: str, request: RollRequest):
+async def roll(game_session_id: str, request: RollRequest):
     try:
-        turn_outcome = play_session_turn(
+        turn_outcome = await run_in_db(
+            play_session_turn,
             game_session_id=game_session_id,
             mode_name=request.mode.value,
             dice_type=request.dice_type.value,
@@ -24,7 +29,7 @@ def roll(game_session_id: str, request: RollRequest):
         )
         return RollResponse(
             game_session_id=turn_outcome.result.context.game_session_id,
-            rolls=turn_outcome.result.rolls,
+            rolls=list(turn_outcome.result.rolls),
             total=turn_outcome.result.total,
             outcome=turn_outcome.result.outcome,
             points_delta=turn_outcome.result.points_delta,
@@ -39,3 +44,35 @@ def roll(game_session_id: str, request: RollRequest):
         raise HTTPException(status_code=400, detail=str(e)) from e
     except InternalServerError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/{game_session_id}/rolls", response_model=BulkRollResponse)
+async def roll_many(game_session_id: str, request: BulkRollRequest):
+    """Plays ``count`` turns in one request and one database transaction."""
+    try:
+        turns = await run_in_db(
+            play_session_turns,
+            game_session_id=game_session_id,
+            mode_name=request.mode.value,
+            dice_type=request.dice_type.value,
+            num_dice=request.num_dice,
+            count=request.count,
+        )
+    except GameSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except (InvalidDiceTypeError, InvalidGameModeError) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except InternalServerError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    results = [turn.result for turn in turns]
+    return BulkRollResponse(
+        game_session_id=game_session_id,
+        turns=len(turns),
+        points_total=results[-1].points_total,
+        rolls=[list(result.rolls) for result in results],
+        totals=[result.total for result in results],
+        outcomes=[result.outcome for result in results],
+        points_deltas=[result.points_delta for result in results],
+        extra_turns=[turn.extra_turn for turn in turns],
+    )
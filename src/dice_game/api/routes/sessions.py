@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException
 
 from ...services.exceptions import GameSessionNotFoundError
-from ...storage.session_repository import (
+from ...storage.aio import (
     create_game_session,
     delete_game_session,
+    flush_rolls,
     get_game_session,
 )
 from ..schemas import DeleteSessionResponse, SessionResponse
@@ -12,8 +13,8 @@ router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 
 @router.post("", response_model=SessionResponse)
-def create_session():
-    session = create_game_session()
+async def create_session():
+    session = await create_game_session()
     return SessionResponse(
         game_session_id=session["id"],
         player_points=session["player_points"],
@@ -24,8 +25,8 @@ def create_session():
 
 
 @router.get("/{game_session_id}", response_model=SessionResponse)
-def get_session(game_session_id: str):
-    session = get_game_session(game_session_id)
+async def get_session(game_session_id: str):
+    session = await get_game_session(game_session_id)
     try:
         if session is None:
             raise GameSessionNotFoundError("Game session not found")
@@ -42,9 +43,10 @@ def get_session(game_session_id: str):
 
 
 @router.delete("/{game_session_id}", response_model=DeleteSessionResponse)
-def delete_session(game_session_id: str):
+async def delete_session(game_session_id: str):
+    await flush_rolls()
     try:
-        deleted = delete_game_session(game_session_id)
+        deleted = await delete_game_session(game_session_id)
         if deleted == 0:
             raise GameSessionNotFoundError("Game session not found")
     except GameSessionNotFoundError as e:
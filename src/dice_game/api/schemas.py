@@ -24,6 +24,14 @@ class RollRequest(BaseModel):
     num_dice: int = Field(ge=2, le=20)
 
 
+# Upper bound on turns per bulk roll request (Lucky extra turns come on top).
+MAX_BULK_TURNS = 1000
+
+
+class BulkRollRequest(RollRequest):
+    count: int = Field(ge=1, le=MAX_BULK_TURNS)
+
+
 class SessionResponse(BaseModel):
     game_session_id: str
     player_points: int
@@ -46,6 +54,19 @@ class RollResponse(BaseModel):
     extra_turn: bool
 
 
+class BulkRollResponse(BaseModel):
+    """Turns in play order, one array entry per turn (columnar)."""
+
+    game_session_id: str
+    turns: int
+    points_total: int
+    rolls: list[list[int]]
+    totals: list[int]
+    outcomes: list[str]
+    points_deltas: list[int]
+    extra_turns: list[bool]
+
+
 class HistoryItemResponse(BaseModel):
     id: int
     game_session_id: str
@@ -62,6 +83,11 @@ class HistoryItemResponse(BaseModel):
     points_total: int
 
 
+class HistoryPageResponse(BaseModel):
+    items: list[HistoryItemResponse]
+    next_cursor: str | None
+
+
 class DeleteHistoryResponse(BaseModel):
     deleted_records: int
     player_points: int
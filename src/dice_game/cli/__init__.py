@@ -6,12 +6,16 @@ from .printing import (
     print_history_page_info,
     print_overall_stats,
     print_session_stats,
+    print_simulation_progress,
     print_simulation_report,
     print_turn_result,
 )
 from .ui import (
+    ask_export_format,
     ask_int,
     ask_menu_action,
+    ask_simulation_epsilon,
+    ask_simulation_method,
     ask_simulation_trials,
     ask_yes_no,
     choose_dice_type,
@@ -26,12 +30,16 @@ __all__ = [
     "print_history",
     "print_best_roll",
     "print_simulation_report",
+    "print_simulation_progress",
     "print_distribution_sorted",
     "print_history_page_info",
     "print_overall_stats",
     "ask_yes_no",
     "ask_int",
+    "ask_export_format",
+    "ask_simulation_method",
     "ask_simulation_trials",
+    "ask_simulation_epsilon",
     "choose_mode",
     "choose_dice_type",
     "get_roll_context",
@@ -2,7 +2,7 @@ import json
 
 from ..domain.models import RollResult
 from ..domain.stats import OverallStats, Stats
-from ..services.simulation import SimulationReport
+from ..services.simulation import SimulationProgress, SimulationReport
 from ..storage.history_types import HistoryRecord
 
 
@@ -116,8 +116,25 @@ def print_simulation_report(
     lose = report.counts.outcome_counts.get("lose", 0)
 
     print("\n----- Simulation Report -----")
-    print(f"Trials: {trials}")
+    if report.config.exact:
+        print(f"Trials: exact (all {trials} equally likely rolls)")
+    else:
+        print(f"Trials: {trials}")
+    if report.partial:
+        print(f"Stopped early: partial results from the first {trials:,} trials")
     print(f"Dice: {report.config.dice} × D{report.config.sides}")
+    precision = report.precision
+    if precision is not None:
+        print(
+            f"Precision: ±{precision.half_width:.4f} "
+            f"at {precision.confidence:.0%} confidence"
+        )
+        if precision.epsilon is not None:
+            status = "reached" if precision.converged else "not reached"
+            print(
+                f"Target ±{precision.epsilon:.4f} {status} after {trials:,} "
+                f"of at most {precision.max_trials:,} trials"
+            )
     print(f"Match count: {report.counts.match_count}")
     print(
         f"Match probability: {report.match_probability:.4f} ({report.match_probability * 100:.2f}%)"
@@ -152,6 +169,18 @@ def print_simulation_report(
     print("-----------------------------\n")
 
 
+def print_simulation_progress(progress: SimulationProgress) -> None:
+    """Redraws one progress line in place; print a newline when the run ends."""
+    line = (
+        f"Simulating: {progress.trials:,} / {progress.max_trials:,} trials "
+        f"({progress.fraction:.0%})  {progress.trials_per_second:,.0f} trials/s"
+    )
+    precision = progress.report.precision
+    if precision is not None:
+        line += f"  ±{precision.half_width:.4f}"
+    print(f"\r{line:<79}", end="", flush=True)
+
+
 def print_distribution_sorted(report: SimulationReport) -> None:
     trials = report.config.trials
     dist = report.counts.total_distribution
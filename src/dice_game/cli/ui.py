@@ -27,6 +27,34 @@ def ask_int(prompt: str, *, min_value: int | None = None) -> int:
         return value
 
 
+def ask_simulation_method() -> str:
+    print("\nSimulation method:")
+    print("1) Monte Carlo (random trials)")
+    print("2) Exact (all possible rolls, no sampling)\n")
+
+    while True:
+        choice = input("Choose (1-2): ").strip()
+        if choice == "1":
+            return "monte_carlo"
+        if choice == "2":
+            return "exact"
+        print("\nInvalid choice.\n")
+
+
+def ask_export_format() -> str:
+    print("\nExport format:")
+    print("1) CSV")
+    print("2) Columnar (Parquet when pyarrow is installed)\n")
+
+    while True:
+        choice = input("Choose (1-2): ").strip()
+        if choice == "1":
+            return "csv"
+        if choice == "2":
+            return "columnar"
+        print("\nInvalid choice.\n")
+
+
 def ask_simulation_trials() -> int:
     print("\nSimulation trials options:")
     print("1) 10,000")
@@ -44,6 +72,26 @@ def ask_simulation_trials() -> int:
         print("\nInvalid choice.\n")
 
 
+def ask_simulation_epsilon() -> float | None:
+    """Target CI half-width for an adaptive run, or None to run every trial."""
+    print("\nStop early once every probability is within ± epsilon")
+    print("(95% confidence)? The chosen trials become the maximum.\n")
+
+    while True:
+        raw = input("Epsilon, e.g. 0.005 (blank = run all trials): ").strip()
+        if not raw:
+            return None
+        try:
+            epsilon = float(raw)
+        except ValueError:
+            print("\nInvalid input. Please enter a number.\n")
+            continue
+        if not 0 < epsilon < 1:
+            print("\nEpsilon must be between 0 and 1.\n")
+            continue
+        return epsilon
+
+
 def choose_mode() -> GameMode:
     while True:
         mode = input("Choose a mode (Classic/Lucky/Risk): ").strip().lower()
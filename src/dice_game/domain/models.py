@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 from .config import GameConfig
 from .modes import GameMode
 from .stats import Stats
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RollContext:
     game_session_id: str
     mode: GameMode
@@ -15,22 +16,69 @@ class RollContext:
     num_dice: int
     sides: int
 
+    def ratio_for_total(self, total: int) -> float:
+        """Returns the quality of ``total`` from 0.0 (all 1s) to 1.0 (all max)."""
+        min_possible = self.num_dice
+        max_possible = self.num_dice * self.sides
 
-@dataclass(frozen=True)
+        if max_possible == min_possible:
+            return 1.0
+
+        return (total - min_possible) / (max_possible - min_possible)
+
+
+@dataclass(frozen=True, slots=True)
 class RollResult:
+    """One resolved roll.
+
+    ``rolls`` is stored as a tuple (lists are converted), and ``total`` and
+    ``has_match`` are computed once at construction, or taken as given by
+    `scored`.
+    """
+
     context: RollContext
-    rolls: list[int]
+    rolls: Sequence[int]
     outcome: str
     points_delta: int
     points_total: int
-
-    @property
-    def total(self) -> int:
-        return sum(self.rolls)
-
-    @property
-    def has_match(self) -> bool:
-        return bool(self.rolls) and len(set(self.rolls)) == 1
+    total: int = field(init=False)
+    has_match: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        rolls = tuple(self.rolls)
+        # Frozen: derived fields are set once, bypassing __setattr__.
+        object.__setattr__(self, "rolls", rolls)
+        object.__setattr__(self, "total", sum(rolls))
+        object.__setattr__(
+            self, "has_match", bool(rolls) and rolls.count(rolls[0]) == len(rolls)
+        )
+
+    @classmethod
+    def scored(
+        cls,
+        context: RollContext,
+        rolls: tuple[int, ...],
+        outcome: str,
+        points_delta: int,
+        points_total: int,
+        *,
+        total: int,
+        has_match: bool,
+    ) -> RollResult:
+        """Builds a result whose ``total`` and ``has_match`` are already known.
+
+        Skips `__post_init__`, so the caller vouches that both match ``rolls``.
+        """
+        result = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(result, "context", context)
+        setattr_(result, "rolls", rolls)
+        setattr_(result, "outcome", outcome)
+        setattr_(result, "points_delta", points_delta)
+        setattr_(result, "points_total", points_total)
+        setattr_(result, "total", total)
+        setattr_(result, "has_match", has_match)
+        return result
 
     @property
     def is_lucky_match(self) -> bool:
@@ -43,16 +91,10 @@ class RollResult:
     @property
     def normalized_ratio(self) -> float:
         """Returns the roll quality from 0.0 (all 1s) to 1.0 (all max)."""
-        min_possible = self.context.num_dice
-        max_possible = self.context.num_dice * self.context.sides
-
-        if max_possible == min_possible:
-            return 1.0
-
-        return (self.total - min_possible) / (max_possible - min_possible)
+        return self.context.ratio_for_total(self.total)
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnState:
     game_config: GameConfig
     game_session_id: str
@@ -60,7 +102,7 @@ class TurnState:
     stats: Stats | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnOutcome:
     result: RollResult
     extra_turn: bool
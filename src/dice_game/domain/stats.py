@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     roll_count: int = 0
     total_matches: int = 0  # "all dice match"
@@ -24,7 +24,7 @@ class Stats:
         return 0.0 if self.roll_count == 0 else self.total_roll_value / self.roll_count
 
 
-@dataclass
+@dataclass(slots=True)
 class OverallStats:
     """Statistics across all game sessions in the database."""
 
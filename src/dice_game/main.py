@@ -1,3 +1,5 @@
+import signal
+import threading
 from typing import cast
 
 from .cli.printing import (
@@ -7,26 +9,24 @@ from .cli.printing import (
     print_history_page_info,
     print_overall_stats,
     print_session_stats,
+    print_simulation_progress,
     print_simulation_report,
     print_turn_result,
 )
 from .cli.ui import (
+    ask_export_format,
     ask_int,
     ask_menu_action,
+    ask_simulation_epsilon,
+    ask_simulation_method,
     ask_simulation_trials,
     get_roll_context,
 )
 from .domain.config import GameConfig
-from .domain.models import TurnOutcome, TurnState
+from .domain.models import RollContext, TurnOutcome, TurnState
 from .domain.stats import Stats
-from .services.logic import (
-    apply_turn_effects,
-    build_temp_result,
-    finalize_result,
-    resolve_turn,
-    roll_dice,
-)
-from .services.simulation import simulate
+from .services.logic import roll_dice, take_turn
+from .services.simulation import SimulationReport, exact_simulation, simulate
 from .storage.db_init import init_db
 from .storage.history_types import HistoryRecord
 from .storage.roll_repository import (
@@ -34,28 +34,53 @@ from .storage.roll_repository import (
 )
 from .storage.roll_repository import (
     clear_rolls,
+    columnar_export_path,
     count_rolls,
+    export_rolls_columnar,
     export_rolls_to_csv,
     paginated_rolls,
-    save_roll,
 )
 from .storage.roll_repository import (
     overall_stats as overall_stats_db,
 )
 from .storage.session_repository import create_game_session
+from .storage.write_buffer import close_roll_buffer, flush_rolls, record_roll
 
 
 def play_turn(state: TurnState) -> TurnOutcome:
     context = get_roll_context(state.game_session_id)
-    rolls = roll_dice(context)
-
-    temp_result = build_temp_result(context, rolls, state.player_points)
-    outcome, delta = resolve_turn(state.game_config, temp_result)
-
-    extra_turn = apply_turn_effects(state, temp_result, delta)
-    result = finalize_result(temp_result, outcome, delta, state.player_points)
-
-    return TurnOutcome(result=result, extra_turn=extra_turn)
+    return take_turn(state, context, roll_dice(context))
+
+
+def run_simulation(
+    state: TurnState, context: RollContext, trials: int, epsilon: float | None
+) -> SimulationReport:
+    """Runs a Monte Carlo simulation behind a live progress line.
+
+    The first Ctrl-C stops the run after the block in progress and keeps
+    the trials done so far; a second one aborts as usual.
+    """
+    cancel = threading.Event()
+
+    def interrupt(signum: int, frame: object) -> None:
+        if cancel.is_set():
+            raise KeyboardInterrupt
+        cancel.set()
+
+    print("Press Ctrl-C to stop early and keep the results so far.")
+    previous = signal.signal(signal.SIGINT, interrupt)
+    try:
+        return simulate(
+            game_config=state.game_config,
+            context=context,
+            trials=trials,
+            epsilon=epsilon,
+            cancel=cancel,
+            on_progress=print_simulation_progress,
+        )
+    finally:
+        signal.signal(signal.SIGINT, previous)
+        print()
 
 
 def browse_history_paginated(
@@ -71,16 +96,16 @@ def browse_history_paginated(
         return
 
     offset = 0
+    # Keyset paging: remember the id each visited page started after, so
+    # "previous" is a stack pop instead of an OFFSET scan.
+    page_starts: list[int | None] = [None]
 
     while True:
-        records = cast(
-            list[HistoryRecord],
-            paginated_rolls(
-                offset=offset,
-                limit=page_size,
-                sides=sides,
-                dice=dice,
-            ),
+        records = paginated_rolls(
+            limit=page_size,
+            sides=sides,
+            dice=dice,
+            before_id=page_starts[-1],
         )
 
         print_history_page_info(
@@ -88,7 +113,7 @@ def browse_history_paginated(
             page_size=page_size,
             total=total,
         )
-        print_history(records)
+        print_history(cast(list[HistoryRecord], records))
 
         commands: list[str] = []
         if offset + page_size < total:
@@ -101,14 +126,16 @@ def browse_history_paginated(
         choice = input("Choose: ").strip().lower()
 
         if choice == "n":
-            if offset + page_size < total:
+            if offset + page_size < total and records:
                 offset += page_size
+                page_starts.append(records[-1]["id"])
             else:
                 print("\nAlready at the last page.\n")
 
         elif choice == "p":
             if offset > 0:
                 offset = max(0, offset - page_size)
+                page_starts.pop()
             else:
                 print("\nAlready at the first page.\n")
 
@@ -167,15 +194,23 @@ def main() -> None:
     while True:
         action = ask_menu_action()
 
+        if action in ("t", "c", "h", "e"):
+            # Make buffered (group-commit) rolls visible before reading.
+            flush_rolls()
+
         if action == "s":
             context = get_roll_context(state.game_session_id)
 
-            trials = ask_simulation_trials()
-            report = simulate(
-                game_config=state.game_config,
-                context=context,
-                trials=trials,
-            )
+            method = ask_simulation_method()
+            if method == "exact":
+                report = exact_simulation(
+                    game_config=state.game_config,
+                    context=context,
+                )
+            else:
+                trials = ask_simulation_trials()
+                epsilon = ask_simulation_epsilon()
+                report = run_simulation(state, context, trials, epsilon)
             print_simulation_report(report, top_n_totals=10)
             print_distribution_sorted(report)
             continue
@@ -186,6 +221,7 @@ def main() -> None:
             continue
 
         if action == "q":
+            close_roll_buffer()
             print("\nThank you for playing! Goodbye!\n")
             if state.stats is not None:
                 print_session_stats(state.stats, state.player_points)
@@ -211,13 +247,16 @@ def main() -> None:
             continue
 
         if action == "e":
-            export = export_rolls_to_csv()
+            if ask_export_format() == "columnar":
+                export_path = columnar_export_path()
+                export = export_rolls_columnar(export_path)
+            else:
+                export_path = GameConfig().exports.export_path
+                export = export_rolls_to_csv(export_path)
 
             if export == 0:
                 print("\nNo history to export.\n")
             else:
-                config = GameConfig()
-                export_path = config.exports.export_path
                 print(f"\nHistory exported: {export} records to '{export_path}'.\n")
             continue
 
@@ -228,8 +267,8 @@ def main() -> None:
             print_turn_result(outcome.result)
             if state.stats is not None:
                 print_session_stats(state.stats, state.player_points)
-            # SAVE (every roll)
-            save_roll(outcome.result)
+            # SAVE (every roll; batched in group write mode)
+            record_roll(outcome.result)
 
             if not outcome.extra_turn:
                 break
@@ -4,24 +4,44 @@ from .exceptions import (
     InvalidDiceTypeError,
     InvalidGameModeError,
     InternalServerError,
+    InvalidCursorError,
 )
-from .game_session_service import play_session_turn
+from .game_session_service import play_session_turn, play_session_turns
 from .logic import (
+    OutcomeTable,
     apply_turn_effects,
     build_temp_result,
     determine_outcome,
+    evaluate_turn,
     finalize_result,
+    outcome_table,
     points_for_turn,
     resolve_turn,
     roll_dice,
+    roll_dice_batch,
+    score_total,
+    take_turn,
+)
+from .rng import (
+    NumpyRollBackend,
+    RollBackend,
+    RollBatch,
+    StdlibRollBackend,
+    default_roll_backend,
 )
 from .simulation import (
+    CancellationToken,
     SimulationAverages,
     SimulationCounts,
     SimulationInputs,
+    SimulationPrecision,
+    SimulationProgress,
     SimulationReport,
+    exact_simulation,
+    iter_simulation,
     simulate,
 )
+from .sweep import SWEEP_FIELDNAMES, SweepCell, sweep, sweep_output_path, write_sweep
 
 __all__ = [
     "InvalidDiceTypeError",
@@ -29,17 +49,40 @@ __all__ = [
     "GameSessionNotFoundError",
     "HistoryExportError",
     "InternalServerError",
+    "InvalidCursorError",
     "roll_dice",
+    "roll_dice_batch",
+    "RollBackend",
+    "RollBatch",
+    "StdlibRollBackend",
+    "NumpyRollBackend",
+    "default_roll_backend",
     "determine_outcome",
     "points_for_turn",
     "build_temp_result",
     "resolve_turn",
     "apply_turn_effects",
     "finalize_result",
+    "evaluate_turn",
+    "take_turn",
+    "score_total",
+    "OutcomeTable",
+    "outcome_table",
     "SimulationInputs",
     "SimulationCounts",
     "SimulationAverages",
     "SimulationReport",
+    "SimulationPrecision",
+    "SimulationProgress",
+    "CancellationToken",
     "simulate",
+    "iter_simulation",
+    "exact_simulation",
     "play_session_turn",
+    "play_session_turns",
+    "SweepCell",
+    "SWEEP_FIELDNAMES",
+    "sweep",
+    "sweep_output_path",
+    "write_sweep",
 ]
@@ -14,6 +14,10 @@ class HistoryExportError(Exception):
     """Raised when there is an error exporting history."""
 
 
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
 # "Internal server error"
 class InternalServerError(Exception):
     """Raised when an unexpected error occurs in the server."""
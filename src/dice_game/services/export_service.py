@@ -0,0 +1,194 @@
+import bisect
+import csv
+import io
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from ..storage.roll_repository import (
+    CSV_FIELDNAMES,
+    csv_export_row,
+    export_bounds,
+    iter_export_rows,
+)
+from ..storage.session_repository import get_game_session
+from .exceptions import GameSessionNotFoundError
+
+# Encoded CSV is yielded in chunks of roughly this many bytes.
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+
+# Resume indexes kept for the most recently downloaded export versions.
+DOWNLOAD_INDEX_SIZE = 32
+
+
+@dataclass(frozen=True)
+class HistoryDownload:
+    """A session's CSV export pinned to the rolls that existed when planned.
+
+    Every stream of the same download (including a resumed one) produces
+    identical bytes while ``etag`` stays the same. The etag covers the row
+    count and id range plus the last roll's time, since ids are reused once
+    history is cleared with ``reset_ids``.
+    """
+
+    game_session_id: str
+    records: int
+    up_to_id: int | None
+    first_id: int | None = None
+    last_time: str | None = None
+
+    @property
+    def etag(self) -> str:
+        last_time = zlib.crc32((self.last_time or "").encode("utf-8"))
+        return (
+            f'"{self.game_session_id}-{self.records}-{self.first_id or 0}'
+            f'-{self.up_to_id or 0}-{last_time:08x}"'
+        )
+
+    @property
+    def filename(self) -> str:
+        return f"roll_history_{self.game_session_id}.csv"
+
+
+def plan_history_download(game_session_id: str) -> HistoryDownload:
+    session = get_game_session(game_session_id)
+    if session is None:
+        raise GameSessionNotFoundError("Game session not found")
+
+    bounds = export_bounds(game_session_id)
+    return HistoryDownload(
+        game_session_id,
+        bounds["records"],
+        bounds["last_id"],
+        bounds["first_id"],
+        bounds["last_time"],
+    )
+
+
+class _DownloadIndex:
+    """What earlier streams of one export version learned about its bytes.
+
+    ``checkpoints`` maps the end offset of each streamed chunk to the id of
+    the last row in it, so a resume can restart the query after that row
+    instead of re-encoding everything before it.
+    """
+
+    def __init__(self) -> None:
+        self.size: int | None = None
+        self._offsets: list[int] = []
+        self._row_ids: list[int] = []
+        self._lock = threading.Lock()
+
+    def record(self, offset: int, row_id: int) -> None:
+        with self._lock:
+            if not self._offsets or offset > self._offsets[-1]:
+                self._offsets.append(offset)
+                self._row_ids.append(row_id)
+
+    def checkpoint(self, start: int) -> tuple[int, int | None]:
+        """Latest ``(offset, row id)`` at or before byte ``start``."""
+        with self._lock:
+            position = bisect.bisect_right(self._offsets, start)
+            if position == 0:
+                return 0, None
+            return self._offsets[position - 1], self._row_ids[position - 1]
+
+
+_download_indexes: OrderedDict[str, _DownloadIndex] = OrderedDict()
+_download_indexes_lock = threading.Lock()
+
+
+def _download_index(download: HistoryDownload) -> _DownloadIndex:
+    with _download_indexes_lock:
+        index = _download_indexes.get(download.etag)
+        if index is None:
+            index = _download_indexes[download.etag] = _DownloadIndex()
+            while len(_download_indexes) > DOWNLOAD_INDEX_SIZE:
+                _download_indexes.popitem(last=False)
+        else:
+            _download_indexes.move_to_end(download.etag)
+        return index
+
+
+def _csv_chunks(
+    download: HistoryDownload, *, start: int = 0
+) -> Iterator[tuple[int, bytes]]:
+    """Encoded chunks with their offsets, beginning at the chunk holding ``start``.
+
+    Chunks end on row boundaries. Each one streamed is recorded as a
+    checkpoint, and a stream that reaches the end records the total size.
+    """
+    index = _download_index(download)
+    offset, after_id = index.checkpoint(start)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if after_id is None:
+        writer.writerow(CSV_FIELDNAMES)
+
+    def flush(row_id: int | None) -> tuple[int, bytes]:
+        nonlocal offset
+        chunk = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        chunk_offset = offset
+        offset += len(chunk)
+        if row_id is not None:
+            index.record(offset, row_id)
+        return chunk_offset, chunk
+
+    row_id: int | None = None
+    if download.up_to_id is not None:
+        for row in iter_export_rows(
+            download.game_session_id,
+            newest_first=False,
+            up_to_id=download.up_to_id,
+            after_id=after_id,
+        ):
+            writer.writerow(csv_export_row(row))
+            row_id = row[0]
+            if buffer.tell() >= DOWNLOAD_CHUNK_BYTES:
+                yield flush(row_id)
+
+    if buffer.tell():
+        yield flush(row_id)
+    index.size = offset
+
+
+def history_csv_size(download: HistoryDownload) -> int:
+    """Byte length of the CSV stream.
+
+    Computed once per export version: the first call encodes the export
+    without storing it and also records resume checkpoints on the way.
+    """
+    index = _download_index(download)
+    if index.size is None:
+        for _ in _csv_chunks(download, start=sys.maxsize):
+            pass
+    assert index.size is not None
+    return index.size
+
+
+def iter_history_csv(download: HistoryDownload, *, start: int = 0) -> Iterator[bytes]:
+    """Streams the CSV oldest roll first, skipping the first ``start`` bytes.
+
+    Resumes from the nearest checkpoint recorded by an earlier stream, so
+    only the bytes since then are encoded again.
+    """
+    for offset, chunk in _csv_chunks(download, start=start):
+        if offset < start:
+            chunk = chunk[start - offset :]
+            if not chunk:
+                continue
+        yield chunk
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # 31 -> gzip container
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
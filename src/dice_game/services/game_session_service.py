@@ -3,18 +3,15 @@ from dice_game.domain.constants import DICE_TYPES
 from dice_game.domain.models import RollContext, TurnOutcome, TurnState
 from dice_game.domain.modes import GameMode
 from dice_game.domain.stats import Stats
-from dice_game.services.logic import (
-    apply_turn_effects,
-    build_temp_result,
-    finalize_result,
-    resolve_turn,
-    roll_dice,
-)
-from dice_game.storage.roll_repository import save_roll
+from dice_game.services.logic import roll_dice, take_turn
+from dice_game.storage.connection import transaction
+from dice_game.storage.roll_repository import save_roll, save_rolls
 from dice_game.storage.session_repository import (
     get_game_session,
+    invalidate_game_session,
     update_game_session_points,
 )
+from dice_game.storage.write_buffer import record_roll, write_mode
 
 from .exceptions import (
     GameSessionNotFoundError,
@@ -23,17 +20,9 @@ from .exceptions import (
 )
 
 
-def play_session_turn(
-    *,
-    game_session_id: str,
-    mode_name: str,
-    dice_type: str,
-    num_dice: int,
-) -> TurnOutcome:
-    session = get_game_session(game_session_id)
-    if session is None:
-        raise GameSessionNotFoundError("Game session not found")
-
+def _roll_context(
+    game_session_id: str, mode_name: str, dice_type: str, num_dice: int
+) -> RollContext:
     if dice_type not in DICE_TYPES:
         raise InvalidDiceTypeError("Invalid dice type")
 
@@ -42,7 +31,7 @@ def play_session_turn(
     except KeyError as exc:
         raise InvalidGameModeError("Invalid game mode") from exc
 
-    context = RollContext(
+    return RollContext(
         game_session_id=game_session_id,
         mode=mode,
         dice_type=dice_type,
@@ -50,23 +39,99 @@ def play_session_turn(
         sides=DICE_TYPES[dice_type],
     )
 
-    state = TurnState(
-        game_session_id=game_session_id,
-        game_config=GameConfig(),
-        stats=Stats(),
-        player_points=session["player_points"],
-    )
 
-    rolls = roll_dice(context)
-    temp_result = build_temp_result(context, rolls, state.player_points)
-    outcome, delta = resolve_turn(state.game_config, temp_result)
-    extra_turn = apply_turn_effects(state, temp_result, delta)
-    result = finalize_result(temp_result, outcome, delta, state.player_points)
+def _play_turn(state: TurnState, context: RollContext) -> TurnOutcome:
+    return take_turn(state, context, roll_dice(context))
 
-    update_game_session_points(game_session_id, result.points_total)
-    save_roll(result)
 
-    return TurnOutcome(
-        result=result,
-        extra_turn=extra_turn,
-    )
+def play_session_turn(
+    *,
+    game_session_id: str,
+    mode_name: str,
+    dice_type: str,
+    num_dice: int,
+) -> TurnOutcome:
+    """Plays one turn and persists it atomically.
+
+    The session read, points update and roll insert share one connection
+    and one ``BEGIN IMMEDIATE`` transaction, so concurrent rolls on the same
+    session serialize instead of overwriting each other's points. In
+    ``group`` write mode the roll itself is committed later by the
+    write-behind buffer.
+    """
+    group_commit = write_mode() == "group"
+
+    with transaction() as conn:
+        session = get_game_session(game_session_id, conn=conn)
+        if session is None:
+            raise GameSessionNotFoundError("Game session not found")
+
+        context = _roll_context(game_session_id, mode_name, dice_type, num_dice)
+        state = TurnState(
+            game_session_id=game_session_id,
+            game_config=GameConfig(),
+            stats=Stats(),
+            player_points=session["player_points"],
+        )
+        turn = _play_turn(state, context)
+        result = turn.result
+
+        update_game_session_points(game_session_id, result.points_total, conn=conn)
+        if not group_commit:
+            save_roll(result, conn=conn)
+
+    invalidate_game_session(game_session_id)
+    if group_commit:
+        record_roll(result)
+
+    return turn
+
+
+def play_session_turns(
+    *,
+    game_session_id: str,
+    mode_name: str,
+    dice_type: str,
+    num_dice: int,
+    count: int,
+) -> list[TurnOutcome]:
+    """Plays ``count`` turns back to back and persists them atomically.
+
+    Points accumulate from turn to turn, and a Lucky-mode match plays its
+    extra turn immediately (extra turns do not count towards ``count``).
+    The session is read and updated once, and every roll is inserted with
+    one ``executemany``, all in a single ``BEGIN IMMEDIATE`` transaction.
+    """
+    group_commit = write_mode() == "group"
+
+    with transaction() as conn:
+        session = get_game_session(game_session_id, conn=conn)
+        if session is None:
+            raise GameSessionNotFoundError("Game session not found")
+
+        context = _roll_context(game_session_id, mode_name, dice_type, num_dice)
+        state = TurnState(
+            game_session_id=game_session_id,
+            game_config=GameConfig(),
+            stats=Stats(),
+            player_points=session["player_points"],
+        )
+
+        turns: list[TurnOutcome] = []
+        for _ in range(count):
+            while True:
+                turn = _play_turn(state, context)
+                turns.append(turn)
+                if not turn.extra_turn:
+                    break
+
+        update_game_session_points(game_session_id, state.player_points, conn=conn)
+        if not group_commit:
+            save_rolls((turn.result for turn in turns), conn=conn)
+
+    invalidate_game_session(game_session_id)
+    if group_commit:
+        for turn in turns:
+            record_roll(turn.result)
+
+    return turns
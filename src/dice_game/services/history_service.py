@@ -1,10 +1,36 @@
-from ..api.schemas import DeleteHistoryResponse
-from ..storage.roll_repository import clear_rolls_by_session
+import base64
+import binascii
+
+from ..api.schemas import DeleteHistoryResponse, HistoryPageResponse
+from ..storage.roll_repository import clear_rolls_by_session, paginated_rolls_by_session
 from ..storage.session_repository import (
     get_game_session,
     reset_game_session_points,
 )
-from .exceptions import GameSessionNotFoundError
+from .exceptions import GameSessionNotFoundError, InvalidCursorError
+
+_CURSOR_PREFIX = "before:"
+
+
+def encode_cursor(before_id: int) -> str:
+    """Opaque cursor that resumes a newest-first listing after ``before_id``."""
+    raw = f"{_CURSOR_PREFIX}{before_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+    if not raw.startswith(_CURSOR_PREFIX):
+        raise InvalidCursorError("Invalid cursor")
+    try:
+        return int(raw.removeprefix(_CURSOR_PREFIX))
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
 
 
 def clear_session_history(game_session_id: str) -> DeleteHistoryResponse:
@@ -19,3 +45,25 @@ def clear_session_history(game_session_id: str) -> DeleteHistoryResponse:
         deleted_records=deleted,
         player_points=0,
     )
+
+
+def session_history_page(
+    game_session_id: str, *, limit: int, cursor: str | None = None
+) -> HistoryPageResponse:
+    """Newest-first page of a session's rolls using keyset pagination."""
+    session = get_game_session(game_session_id)
+    if session is None:
+        raise GameSessionNotFoundError("Game session not found")
+
+    before_id = decode_cursor(cursor) if cursor is not None else None
+    # One extra row tells us whether another page exists.
+    rows = paginated_rolls_by_session(
+        game_session_id, limit=limit + 1, before_id=before_id
+    )
+    items = rows[:limit]
+    has_more = len(rows) > limit
+
+    return HistoryPageResponse(
+        items=items,  # type: ignore[arg-type]
+        next_cursor=encode_cursor(items[-1]["id"]) if has_more else None,
+    )
@@ -1,37 +1,198 @@
 import random
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 
-from ..domain.config import GameConfig
-from ..domain.models import RollContext, RollResult, TurnState
+from ..domain.config import GameConfig, PointsConfig, ThresholdConfig
+from ..domain.models import RollContext, RollResult, TurnOutcome, TurnState
+from ..domain.modes import GameMode
+from .rng import RollBackend, RollBatch, default_roll_backend
 
 
-def roll_dice(context: RollContext) -> list[int]:
-    return [random.randint(1, context.sides) for _ in range(context.num_dice)]
+def roll_dice(context: RollContext, rng: random.Random | None = None) -> list[int]:
+    randint = random.randint if rng is None else rng.randint
+    return [randint(1, context.sides) for _ in range(context.num_dice)]
 
 
-def determine_outcome(game_config: GameConfig, result: RollResult) -> str:
-    ratio = result.normalized_ratio
+def roll_dice_batch(
+    context: RollContext, n: int, *, backend: RollBackend | None = None
+) -> RollBatch:
+    """Rolls ``n`` independent turns for ``context`` in a single call.
+
+    Uses `default_roll_backend` unless a backend is supplied.
+    """
+    if n < 0:
+        raise ValueError("n must not be negative")
+    if backend is None:
+        backend = default_roll_backend()
+    values = backend.roll_values(context.sides, n * context.num_dice)
+    return RollBatch(values=values, count=n, num_dice=context.num_dice)
 
-    if ratio >= game_config.thresholds.win_ratio:
+
+def _outcome_for_ratio(thresholds: ThresholdConfig, ratio: float) -> str:
+    if ratio >= thresholds.win_ratio:
         return "win"
-    if ratio >= game_config.thresholds.draw_ratio:
+    if ratio >= thresholds.draw_ratio:
         return "draw"
     return "lose"
 
 
-def points_for_turn(game_config: GameConfig, result: RollResult) -> int:
-    if result.is_lucky_match:
-        return game_config.points.lucky_match
+def _points_for_ratio(
+    points: PointsConfig,
+    thresholds: ThresholdConfig,
+    mode: GameMode,
+    ratio: float,
+    has_match: bool,
+) -> int:
+    if mode == GameMode.LUCKY and has_match:
+        return points.lucky_match
 
-    if result.is_risk:
-        if result.normalized_ratio < game_config.thresholds.risk_penalty_ratio:
-            return game_config.points.risk_penalty
+    if mode == GameMode.RISK and ratio < thresholds.risk_penalty_ratio:
+        return points.risk_penalty
 
-    outcome = determine_outcome(game_config, result)
+    outcome = _outcome_for_ratio(thresholds, ratio)
     if outcome == "win":
-        return game_config.points.win
+        return points.win
     if outcome == "lose":
-        return game_config.points.lose
-    return game_config.points.draw
+        return points.lose
+    return points.draw
+
+
+def score_total(
+    game_config: GameConfig, context: RollContext, total: int, has_match: bool
+) -> tuple[str, int]:
+    """Outcome and points delta for a roll described only by its total.
+
+    Equivalent to `resolve_turn` on any roll with this total and match flag,
+    without building a `RollResult`. Hot paths use `outcome_table` instead.
+    """
+    ratio = context.ratio_for_total(total)
+    return (
+        _outcome_for_ratio(game_config.thresholds, ratio),
+        _points_for_ratio(
+            game_config.points, game_config.thresholds, context.mode, ratio, has_match
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class OutcomeTable:
+    """Precomputed scoring for every total of one (mode, num_dice, sides).
+
+    Index ``total - min_total`` into ``outcomes`` for the outcome, and into
+    ``deltas`` or ``match_deltas`` for the points delta of a non-matching or
+    all-matching roll.
+    """
+
+    min_total: int
+    outcomes: tuple[str, ...]
+    deltas: tuple[int, ...]
+    match_deltas: tuple[int, ...]
+
+    def lookup(self, total: int, has_match: bool) -> tuple[str, int]:
+        index = total - self.min_total
+        if not 0 <= index < len(self.outcomes):
+            raise ValueError(f"Total {total} is not possible for this roll")
+        delta = self.match_deltas[index] if has_match else self.deltas[index]
+        return self.outcomes[index], delta
+
+
+@lru_cache(maxsize=1024)
+def _build_outcome_table(
+    points: PointsConfig,
+    thresholds: ThresholdConfig,
+    mode: GameMode,
+    num_dice: int,
+    sides: int,
+) -> OutcomeTable:
+    context = RollContext(
+        game_session_id="",
+        mode=mode,
+        dice_type=f"D{sides}",
+        num_dice=num_dice,
+        sides=sides,
+    )
+    totals = range(num_dice, num_dice * sides + 1)
+    ratios = [context.ratio_for_total(total) for total in totals]
+
+    return OutcomeTable(
+        min_total=num_dice,
+        outcomes=tuple(_outcome_for_ratio(thresholds, ratio) for ratio in ratios),
+        deltas=tuple(
+            _points_for_ratio(points, thresholds, mode, ratio, False)
+            for ratio in ratios
+        ),
+        match_deltas=tuple(
+            _points_for_ratio(points, thresholds, mode, ratio, True) for ratio in ratios
+        ),
+    )
+
+
+def outcome_table(game_config: GameConfig, context: RollContext) -> OutcomeTable:
+    """Memoized `OutcomeTable` for ``context`` under ``game_config``.
+
+    Keyed on the (frozen, hashable) points and threshold configs, so a
+    changed `PointsConfig` or `ThresholdConfig` gets a fresh table.
+    """
+    return _build_outcome_table(
+        game_config.points,
+        game_config.thresholds,
+        context.mode,
+        context.num_dice,
+        context.sides,
+    )
+
+
+def evaluate_turn(
+    game_config: GameConfig, context: RollContext, rolls: Sequence[int]
+) -> tuple[int, bool, str, int]:
+    """Scores raw ``rolls`` in one pass, without building a `RollResult`.
+
+    Returns ``(total, has_match, outcome, points_delta)``.
+    """
+    total = sum(rolls)
+    has_match = bool(rolls) and rolls.count(rolls[0]) == len(rolls)
+    outcome, delta = outcome_table(game_config, context).lookup(total, has_match)
+    return total, has_match, outcome, delta
+
+
+def take_turn(
+    state: TurnState, context: RollContext, rolls: Sequence[int]
+) -> TurnOutcome:
+    """Scores ``rolls``, applies them to ``state`` and builds the one result.
+
+    Single-pass equivalent of `build_temp_result`, `resolve_turn`,
+    `apply_turn_effects` and `finalize_result`: the total and match flag
+    from `evaluate_turn` go straight into the result.
+    """
+    rolls = tuple(rolls)
+    total, has_match, outcome, delta = evaluate_turn(state.game_config, context, rolls)
+    state.player_points += delta
+    if state.stats is not None:
+        state.stats.update(total, has_match)
+
+    result = RollResult.scored(
+        context,
+        rolls,
+        outcome,
+        delta,
+        state.player_points,
+        total=total,
+        has_match=has_match,
+    )
+    return TurnOutcome(
+        result=result, extra_turn=context.mode == GameMode.LUCKY and has_match
+    )
+
+
+def determine_outcome(game_config: GameConfig, result: RollResult) -> str:
+    table = outcome_table(game_config, result.context)
+    return table.lookup(result.total, result.has_match)[0]
+
+
+def points_for_turn(game_config: GameConfig, result: RollResult) -> int:
+    table = outcome_table(game_config, result.context)
+    return table.lookup(result.total, result.has_match)[1]
 
 
 def build_temp_result(
@@ -47,8 +208,9 @@ def build_temp_result(
 
 
 def resolve_turn(game_config: GameConfig, temp_result: RollResult) -> tuple[str, int]:
-    outcome = determine_outcome(game_config, temp_result)
-    delta = points_for_turn(game_config, temp_result)
+    _, _, outcome, delta = evaluate_turn(
+        game_config, temp_result.context, temp_result.rolls
+    )
     return outcome, delta
 
 
@@ -67,10 +229,13 @@ def apply_turn_effects(state: TurnState, temp_result: RollResult, delta: int) ->
 def finalize_result(
     temp_result: RollResult, outcome: str, delta: int, player_points: int
 ) -> RollResult:
-    return RollResult(
-        context=temp_result.context,
-        rolls=temp_result.rolls,
-        outcome=outcome,
-        points_delta=delta,
-        points_total=player_points,
+    """``temp_result`` with its outcome and points filled in; reuses its scoring."""
+    return RollResult.scored(
+        temp_result.context,
+        tuple(temp_result.rolls),
+        outcome,
+        delta,
+        player_points,
+        total=temp_result.total,
+        has_match=temp_result.has_match,
     )
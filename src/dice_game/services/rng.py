@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class RollBatch:
+    """``count`` roll vectors of ``num_dice`` dice in one flat byte buffer.
+
+    ``values`` is row-major: roll ``i`` occupies
+    ``values[i * num_dice:(i + 1) * num_dice]``. It is either an
+    ``array('B')`` or a 1-D ``uint8`` NumPy array; both expose the buffer
+    protocol, so `as_matrix` is a zero-copy view.
+    """
+
+    values: Any
+    count: int
+    num_dice: int
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[list[int]]:
+        step = self.num_dice
+        values = self.values
+        for start in range(0, self.count * step, step):
+            yield values[start : start + step].tolist()
+
+    def row(self, index: int) -> list[int]:
+        if not 0 <= index < self.count:
+            raise IndexError("roll index out of range")
+        start = index * self.num_dice
+        return self.values[start : start + self.num_dice].tolist()
+
+    def as_matrix(self) -> Any:
+        """Returns a ``(count, num_dice)`` NumPy view of the batch."""
+        if np is None:
+            raise RuntimeError("RollBatch.as_matrix requires NumPy")
+        return np.frombuffer(self.values, dtype=np.uint8).reshape(
+            self.count, self.num_dice
+        )
+
+
+class RollBackend(Protocol):
+    """Source of uniformly distributed die faces."""
+
+    def roll_values(self, sides: int, size: int) -> Any:
+        """Returns ``size`` faces in ``1..sides`` as a flat byte buffer."""
+        ...
+
+
+class StdlibRollBackend:
+    """Backend on `random.Random`; the default when NumPy is missing."""
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self._rng = rng if rng is not None else random.Random()
+
+    def roll_values(self, sides: int, size: int) -> array:
+        # choices() draws all faces in one C-level call instead of one
+        # randint() call per die.
+        return array("B", self._rng.choices(range(1, sides + 1), k=size))
+
+
+class NumpyRollBackend:
+    """Backend on a NumPy `Generator`."""
+
+    def __init__(self, generator: Any = None) -> None:
+        if np is None:
+            raise RuntimeError("NumpyRollBackend requires NumPy")
+        self._generator = (
+            generator if generator is not None else np.random.default_rng()
+        )
+
+    def roll_values(self, sides: int, size: int) -> Any:
+        return self._generator.integers(1, sides + 1, size=size, dtype=np.uint8)
+
+
+def default_roll_backend(seed: int | str | None = None) -> RollBackend:
+    """NumPy-backed when NumPy is installed, stdlib-backed otherwise."""
+    if np is None or isinstance(seed, str):
+        return StdlibRollBackend(random.Random(seed))
+    return NumpyRollBackend(np.random.default_rng(seed))
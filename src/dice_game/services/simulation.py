@@ -1,11 +1,42 @@
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import dataclass
+import itertools
+import math
+import random
+import secrets
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Literal, Protocol
 
 from ..domain.config import GameConfig
-from .logic import determine_outcome, roll_dice, points_for_turn
-from ..domain.models import RollContext, RollResult
+from ..domain.models import RollContext
+from .logic import OutcomeTable, outcome_table, roll_dice_batch
+from .rng import NumpyRollBackend, RollBackend, StdlibRollBackend
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+SimulationEngine = Literal["auto", "numpy", "python"]
+SimulationMethod = Literal["monte_carlo", "exact"]
+
+# Trials are split into fixed-size blocks, each rolled from its own RNG
+# stream derived from (seed, block index). Results for a given seed are
+# therefore identical no matter how many workers share the blocks, and a
+# block is small enough (≤ 2 MB of dice) to keep 10M+ trial runs bounded.
+SIMULATION_BLOCK_TRIALS = 100_000
+
+# Adaptive runs check their precision after every block, so they use smaller
+# blocks to be able to stop soon after converging.
+ADAPTIVE_BLOCK_TRIALS = 10_000
+
+# Probabilities whose confidence intervals decide when an adaptive run stops.
+_TRACKED_OUTCOMES = ("win", "draw", "lose")
 
 
 @dataclass(frozen=True)
@@ -13,6 +44,8 @@ class SimulationInputs:
     trials: int
     dice: int
     sides: int
+    # True when counts enumerate all sides**dice equally likely rolls.
+    exact: bool = False
 
 
 @dataclass(frozen=True)
@@ -28,11 +61,32 @@ class SimulationAverages:
     avg_points_delta: float
 
 
+@dataclass(frozen=True)
+class SimulationPrecision:
+    """How tightly a Monte Carlo run pins down its reported probabilities.
+
+    ``half_width`` is the largest Wilson-score confidence-interval half-width
+    across the win, draw and lose proportions and the match probability.
+    ``epsilon`` is the target of an adaptive run (None for a fixed run), and
+    ``converged`` tells whether the run met it before its trial cap.
+    """
+
+    confidence: float
+    half_width: float
+    epsilon: float | None = None
+    max_trials: int | None = None
+    converged: bool = False
+
+
 @dataclass(frozen=True)
 class SimulationReport:
     config: SimulationInputs
     counts: SimulationCounts
     averages: SimulationAverages
+    # None for exact reports, whose probabilities carry no sampling error.
+    precision: SimulationPrecision | None = None
+    # True for snapshots taken mid-run and for runs stopped by cancellation.
+    partial: bool = False
 
     @property
     def match_probability(self) -> float:
@@ -52,64 +106,491 @@ class SimulationReport:
         )
 
 
-def simulate(
-    *,
+@dataclass(frozen=True)
+class SimulationProgress:
+    """A snapshot handed to progress callbacks while a simulation runs."""
+
+    report: SimulationReport
+    max_trials: int
+    elapsed: float  # seconds since the run started
+
+    @property
+    def trials(self) -> int:
+        return self.report.config.trials
+
+    @property
+    def fraction(self) -> float:
+        return self.trials / self.max_trials if self.max_trials else 1.0
+
+    @property
+    def trials_per_second(self) -> float:
+        return self.trials / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class CancellationToken(Protocol):
+    """Anything with ``is_set()``, e.g. `threading.Event`."""
+
+    def is_set(self) -> bool: ...
+
+
+ProgressCallback = Callable[[SimulationProgress], None]
+
+
+@dataclass
+class SimulationTally:
+    """Mutable running sums that engines and `sweep` accumulate into.
+
+    Fold per-total frequencies in with `tally_total_counts` and turn the sums
+    into a `SimulationReport` with `to_report`.
+    """
+
+    trials: int = 0
+    match_count: int = 0
+    total_sum: int = 0
+    points_sum: int = 0
+    outcome_counter: Counter[str] = field(default_factory=Counter)
+    total_counter: Counter[int] = field(default_factory=Counter)
+
+    def merge(self, other: SimulationTally) -> None:
+        self.trials += other.trials
+        self.match_count += other.match_count
+        self.total_sum += other.total_sum
+        self.points_sum += other.points_sum
+        self.outcome_counter.update(other.outcome_counter)
+        self.total_counter.update(other.total_counter)
+
+    def half_width(self, z: float) -> float:
+        """Largest Wilson-score CI half-width over the tracked probabilities."""
+        n = self.trials
+        if n == 0:
+            return math.inf
+        counts = [self.outcome_counter[name] for name in _TRACKED_OUTCOMES]
+        counts.append(self.match_count)
+        return max(_wilson_half_width(count, n, z) for count in counts)
+
+    def to_report(
+        self,
+        context: RollContext,
+        *,
+        exact: bool = False,
+        precision: SimulationPrecision | None = None,
+        partial: bool = False,
+    ) -> SimulationReport:
+        trials = self.trials
+        return SimulationReport(
+            config=SimulationInputs(
+                trials=trials,
+                dice=context.num_dice,
+                sides=context.sides,
+                exact=exact,
+            ),
+            counts=SimulationCounts(
+                match_count=self.match_count,
+                outcome_counts=dict(self.outcome_counter),
+                total_distribution=dict(self.total_counter),
+            ),
+            averages=SimulationAverages(
+                avg_total=self.total_sum / trials if trials else 0.0,
+                avg_points_delta=self.points_sum / trials if trials else 0.0,
+            ),
+            precision=precision,
+            partial=partial,
+        )
+
+
+def _wilson_half_width(successes: int, n: int, z: float) -> float:
+    """Half-width of the Wilson score interval for ``successes`` out of ``n``.
+
+    Unlike the normal approximation it stays positive for proportions of 0
+    or 1, so a rare outcome that has not shown up yet cannot look converged.
+    """
+    p = successes / n
+    spread = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+    return spread / (1 + z * z / n)
+
+
+def _z_score(confidence: float) -> float:
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def tally_total_counts(
+    table: OutcomeTable,
+    total_counts: Iterable[tuple[int, int]],
+    match_counts: Iterable[tuple[int, int]],
+    tally: SimulationTally,
+) -> None:
+    """Folds per-total frequencies into ``tally`` via the outcome table."""
+    for total, count in total_counts:
+        index = total - table.min_total
+        tally.trials += count
+        tally.outcome_counter[table.outcomes[index]] += count
+        tally.total_counter[total] += count
+        tally.total_sum += total * count
+        tally.points_sum += table.deltas[index] * count
+
+    for total, count in match_counts:
+        index = total - table.min_total
+        tally.match_count += count
+        tally.points_sum += (table.match_deltas[index] - table.deltas[index]) * count
+
+
+def _tally_rolls(
+    game_config: GameConfig,
+    context: RollContext,
+    batch: Iterable[list[int]],
+    tally: SimulationTally,
+) -> None:
+    totals: Counter[int] = Counter()
+    matched_totals: Counter[int] = Counter()
+
+    for rolls in batch:
+        total = sum(rolls)
+        totals[total] += 1
+        if len(set(rolls)) == 1:
+            matched_totals[total] += 1
+
+    tally_total_counts(
+        outcome_table(game_config, context),
+        totals.items(),
+        matched_totals.items(),
+        tally,
+    )
+
+
+def _tally_roll_matrix(
+    game_config: GameConfig,
+    context: RollContext,
+    rolls: Any,
+    tally: SimulationTally,
+) -> None:
+    """Vectorized `_tally_rolls` over a ``(trials, num_dice)`` NumPy matrix."""
+    table = outcome_table(game_config, context)
+    size = len(table.outcomes)
+
+    indexes = rolls.sum(axis=1, dtype=np.int64) - table.min_total
+    matches = (rolls == rolls[:, :1]).all(axis=1)
+
+    frequencies = np.bincount(indexes, minlength=size)
+    match_frequencies = np.bincount(indexes[matches], minlength=size)
+
+    tally_total_counts(
+        table,
+        (
+            (table.min_total + int(index), int(frequencies[index]))
+            for index in np.flatnonzero(frequencies)
+        ),
+        (
+            (table.min_total + int(index), int(match_frequencies[index]))
+            for index in np.flatnonzero(match_frequencies)
+        ),
+        tally,
+    )
+
+
+@dataclass(frozen=True)
+class _SimulationBlock:
+    """One shard of a Monte Carlo run; picklable for worker processes."""
+
+    game_config: GameConfig
+    context: RollContext
+    engine: Literal["numpy", "python"]
+    seed: int
+    index: int
+    trials: int
+
+
+def _run_block(block: _SimulationBlock) -> SimulationTally:
+    tally = SimulationTally()
+    backend: RollBackend
+
+    if block.engine == "numpy":
+        seed_sequence = np.random.SeedSequence(block.seed, spawn_key=(block.index,))
+        backend = NumpyRollBackend(np.random.default_rng(seed_sequence))
+        batch = roll_dice_batch(block.context, block.trials, backend=backend)
+        _tally_roll_matrix(block.game_config, block.context, batch.as_matrix(), tally)
+    else:
+        backend = StdlibRollBackend(random.Random(f"{block.seed}:{block.index}"))
+        batch = roll_dice_batch(block.context, block.trials, backend=backend)
+        _tally_rolls(block.game_config, block.context, batch, tally)
+
+    return tally
+
+
+def _plan_blocks(
     game_config: GameConfig,
     context: RollContext,
+    engine: Literal["numpy", "python"],
+    seed: int,
     trials: int,
+    block_trials: int | None = None,
+) -> list[_SimulationBlock]:
+    if block_trials is None:
+        block_trials = SIMULATION_BLOCK_TRIALS
+    return [
+        _SimulationBlock(
+            game_config=game_config,
+            context=context,
+            engine=engine,
+            seed=seed,
+            index=index,
+            trials=min(block_trials, trials - start),
+        )
+        for index, start in enumerate(range(0, trials, block_trials))
+    ]
+
+
+def _iter_block_tallies(
+    blocks: list[_SimulationBlock], workers: int
+) -> Generator[SimulationTally, None, None]:
+    """Yields each block's tally in block order.
+
+    With ``workers > 1`` a bounded window of blocks is in flight, so a
+    consumer that stops early (converged or cancelled) wastes at most that
+    window rather than the whole run.
+    """
+    if workers == 1 or len(blocks) == 1:
+        yield from map(_run_block, blocks)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(blocks)))
+    queued = iter(blocks)
+    pending: deque[Future[SimulationTally]] = deque()
+    try:
+        for block in itertools.islice(queued, 2 * workers):
+            pending.append(executor.submit(_run_block, block))
+        while pending:
+            tally = pending.popleft().result()
+            following = next(queued, None)
+            if following is not None:
+                pending.append(executor.submit(_run_block, following))
+            yield tally
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def iter_total_ways(sides: int, max_dice: int) -> Iterator[dict[int, int]]:
+    """`total_ways` for 1, 2, ... ``max_dice`` dice of ``sides`` sides.
+
+    Each distribution is one convolution step away from the previous, so a
+    whole range of dice counts costs the same as its largest member.
+    """
+    ways = [1]  # ways[i] -> rolls so far whose total is (dice so far) + i
+    for num_dice in range(1, max_dice + 1):
+        widened = [0] * (len(ways) + sides - 1)
+        window = 0
+        for index in range(len(widened)):
+            if index < len(ways):
+                window += ways[index]
+            if index >= sides:
+                window -= ways[index - sides]
+            widened[index] = window
+        ways = widened
+        yield {num_dice + index: count for index, count in enumerate(ways)}
+
+
+def total_ways(num_dice: int, sides: int) -> dict[int, int]:
+    """Number of the ``sides**num_dice`` rolls that produce each total.
+
+    Built by convolving the single-die distribution ``num_dice`` times; each
+    step is a sliding-window sum, so even 20×D20 takes about a millisecond.
+    """
+    ways = {0: 1}
+    for ways in iter_total_ways(sides, num_dice):
+        pass
+    return ways
+
+
+def _exact_tally(game_config: GameConfig, context: RollContext) -> SimulationTally:
+    num_dice, sides = context.num_dice, context.sides
+    tally = SimulationTally()
+    ways = total_ways(num_dice, sides)
+
+    # Exactly one roll (every die showing the same face) matches per
+    # multiple of num_dice.
+    tally_total_counts(
+        outcome_table(game_config, context),
+        ways.items(),
+        ((face * num_dice, 1) for face in range(1, sides + 1)),
+        tally,
+    )
+    return tally
+
+
+def exact_simulation(
+    *, game_config: GameConfig, context: RollContext
 ) -> SimulationReport:
+    """Exact counterpart of `simulate` computed without sampling.
+
+    Counts enumerate every one of the ``sides**num_dice`` equally likely
+    rolls, so ``config.trials`` is that number and every probability derived
+    from the report is exact.
+    """
+    return _exact_tally(game_config, context).to_report(context, exact=True)
+
+
+def resolve_engine(engine: SimulationEngine) -> Literal["numpy", "python"]:
+    """The concrete engine for ``engine``; ``auto`` prefers NumPy when installed."""
+    if engine == "auto":
+        return "python" if np is None else "numpy"
+    if engine == "numpy" and np is None:
+        raise RuntimeError("The numpy simulation engine requires NumPy")
+    if engine not in ("numpy", "python"):
+        raise ValueError(f"Unknown simulation engine: {engine!r}")
+    return engine
+
+
+def iter_simulation(
+    *,
+    game_config: GameConfig,
+    context: RollContext,
+    trials: int,
+    engine: SimulationEngine = "auto",
+    method: SimulationMethod = "monte_carlo",
+    seed: int | None = None,
+    workers: int = 1,
+    epsilon: float | None = None,
+    confidence: float = 0.95,
+    report_every: int | None = None,
+    cancel: CancellationToken | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> Iterator[SimulationReport]:
+    """Runs `simulate` incrementally, yielding reports as trials complete.
+
+    A ``partial`` snapshot is yielded at the first block boundary after
+    every ``report_every`` trials (default `SIMULATION_BLOCK_TRIALS`) and
+    the last report yielded is the final one. ``cancel`` is checked between
+    blocks: once it is set the run stops and its final report covers the
+    trials done so far, flagged ``partial``. ``on_progress`` is called with
+    every report yielded.
+    """
+    if method == "exact":
+        report = exact_simulation(game_config=game_config, context=context)
+        if on_progress is not None:
+            on_progress(SimulationProgress(report, report.config.trials, 0.0))
+        yield report
+        return
+    if method != "monte_carlo":
+        raise ValueError(f"Unknown simulation method: {method!r}")
+
     # 1. Define common input metadata
     config = SimulationInputs(
         trials=max(0, trials), dice=context.num_dice, sides=context.sides
     )
+    selected = resolve_engine(engine)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if epsilon is not None and epsilon <= 0:
+        raise ValueError("epsilon must be positive")
+    if report_every is None:
+        report_every = SIMULATION_BLOCK_TRIALS
+    if report_every < 1:
+        raise ValueError("report_every must be at least 1")
+    z = _z_score(confidence)
 
     # 2. Guard Clause for zero/negative trials
     if trials <= 0:
-        return SimulationReport(
+        yield SimulationReport(
             config=config,
             counts=SimulationCounts(0, {"win": 0, "draw": 0, "lose": 0}, {}),
             averages=SimulationAverages(0.0, 0.0),
         )
+        return
 
     # 3. Simulation Logic
-    match_count = 0
-    outcome_counter: Counter[str] = Counter()
-    total_counter: Counter[int] = Counter()
-    total_sum = 0
-    points_sum = 0
+    if seed is None:
+        seed = secrets.randbits(64)
+    block_trials = SIMULATION_BLOCK_TRIALS if epsilon is None else ADAPTIVE_BLOCK_TRIALS
+    blocks = _plan_blocks(game_config, context, selected, seed, trials, block_trials)
 
-    for _ in range(trials):
-        rolls = roll_dice(context)
+    started = time.perf_counter()
+    tally = SimulationTally()
 
-        # Creating a temporary result to calculate metrics
-        temp = RollResult(
-            context=context,
-            rolls=rolls,
-            outcome="",
-            points_delta=0,
-            points_total=0,
+    def snapshot(*, partial: bool) -> SimulationReport:
+        half_width = tally.half_width(z)
+        precision = SimulationPrecision(
+            confidence=confidence,
+            half_width=half_width,
+            epsilon=epsilon,
+            max_trials=trials if epsilon is not None else None,
+            converged=epsilon is not None and half_width <= epsilon,
         )
+        report = tally.to_report(context, precision=precision, partial=partial)
+        if on_progress is not None:
+            elapsed = time.perf_counter() - started
+            on_progress(SimulationProgress(report, trials, elapsed))
+        return report
 
-        outcome = determine_outcome(game_config, temp)
-        delta = points_for_turn(game_config, temp)
+    next_report = report_every
+    cancelled = False
+    tallies = _iter_block_tallies(blocks, workers)
+    try:
+        for block_tally in tallies:
+            tally.merge(block_tally)
+            if epsilon is not None and tally.half_width(z) <= epsilon:
+                break
+            cancelled = cancel is not None and cancel.is_set()
+            if cancelled or tally.trials >= trials:
+                break
+            if tally.trials >= next_report:
+                yield snapshot(partial=True)
+                next_report = tally.trials + report_every
+    finally:
+        tallies.close()
 
-        outcome_counter[outcome] += 1
-        total_counter[temp.total] += 1
-        total_sum += temp.total
-        points_sum += delta
+    # 4. Final Assembly
+    yield snapshot(partial=cancelled)
 
-        if temp.has_match:
-            match_count += 1
 
-    # 4. Final Assembly
-    return SimulationReport(
-        config=config,
-        counts=SimulationCounts(
-            match_count=match_count,
-            outcome_counts=dict(outcome_counter),
-            total_distribution=dict(total_counter),
-        ),
-        averages=SimulationAverages(
-            avg_total=total_sum / trials, avg_points_delta=points_sum / trials
-        ),
-    )
+def simulate(
+    *,
+    game_config: GameConfig,
+    context: RollContext,
+    trials: int,
+    engine: SimulationEngine = "auto",
+    method: SimulationMethod = "monte_carlo",
+    seed: int | None = None,
+    workers: int = 1,
+    epsilon: float | None = None,
+    confidence: float = 0.95,
+    cancel: CancellationToken | None = None,
+    on_progress: ProgressCallback | None = None,
+    report_every: int | None = None,
+) -> SimulationReport:
+    """Monte Carlo estimate of outcomes, totals and points for ``context``.
+
+    ``engine="auto"`` uses the vectorized NumPy engine when NumPy is
+    installed and falls back to the pure-Python loop otherwise.
+    ``method="exact"`` ignores ``trials`` and returns `exact_simulation`.
+
+    ``workers > 1`` shards the trials across a process pool. With a fixed
+    ``seed`` the report is reproducible for a given engine regardless of
+    ``workers``.
+
+    With ``epsilon`` set the run is adaptive: ``trials`` becomes a cap, and
+    trials run in blocks of `ADAPTIVE_BLOCK_TRIALS` until every outcome and
+    match probability has a ``confidence`` interval half-width of at most
+    ``epsilon``. Every Monte Carlo report records its achieved precision.
+
+    ``cancel``, ``on_progress`` and ``report_every`` behave as in
+    `iter_simulation`, whose final report this returns.
+    """
+    report: SimulationReport | None = None
+    for report in iter_simulation(
+        game_config=game_config,
+        context=context,
+        trials=trials,
+        engine=engine,
+        method=method,
+        seed=seed,
+        workers=workers,
+        epsilon=epsilon,
+        confidence=confidence,
+        report_every=report_every,
+        cancel=cancel,
+        on_progress=on_progress,
+    ):
+        pass
+    assert report is not None
+    return report
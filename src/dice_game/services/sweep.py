@@ -0,0 +1,376 @@
+"""Parameter sweep: expected points for every dice type × dice count × mode.
+
+python -m dice_game.services.sweep                        # exact, CSV
+python -m dice_game.services.sweep --method monte_carlo --trials 200000
+python -m dice_game.services.sweep --format columnar --out sweep.parquet
+
+Work is shared across the grid. Per dice type, one convolution chain (exact)
+or one block of roll vectors (Monte Carlo) yields the totals for every dice
+count at once: ``n`` dice are the first ``n`` columns of each roll. Those
+counts are then scored against each mode's memoized outcome table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import secrets
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final, Literal
+
+from ..domain.config import GameConfig
+from ..domain.constants import DICE_TYPES, MIN_DICE
+from ..domain.models import RollContext
+from ..domain.modes import GameMode
+from ..storage.columnar import (
+    COLUMNAR_EXTENSIONS,
+    ColumnarFormat,
+    resolve_columnar_format,
+    write_columnar,
+)
+from .logic import outcome_table
+from .rng import NumpyRollBackend, RollBackend, RollBatch, StdlibRollBackend
+from .simulation import (
+    SIMULATION_BLOCK_TRIALS,
+    SimulationEngine,
+    SimulationMethod,
+    SimulationReport,
+    SimulationTally,
+    iter_total_ways,
+    resolve_engine,
+    tally_total_counts,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+SweepFormat = Literal["csv", "columnar"]
+
+SWEEP_MAX_DICE = 20
+
+SWEEP_SCHEMA: Final[tuple[tuple[str, str], ...]] = (
+    ("dice_type", "string"),
+    ("sides", "int64"),
+    ("dice", "int64"),
+    ("mode", "string"),
+    ("exact", "int64"),
+    ("trials", "int64"),  # 0 for exact cells, whose counts can exceed int64
+    ("expected_points", "float64"),
+    ("avg_total", "float64"),
+    ("p_win", "float64"),
+    ("p_draw", "float64"),
+    ("p_lose", "float64"),
+    ("p_match", "float64"),
+)
+
+SWEEP_FIELDNAMES: Final[list[str]] = [name for name, _ in SWEEP_SCHEMA]
+
+
+@dataclass(frozen=True)
+class SweepCell:
+    """Scoring summary for one (dice type, dice count, mode) combination."""
+
+    dice_type: str
+    dice: int
+    mode: GameMode
+    report: SimulationReport
+
+    @property
+    def sides(self) -> int:
+        return self.report.config.sides
+
+    @property
+    def expected_points(self) -> float:
+        return self.report.averages.avg_points_delta
+
+    def probability(self, outcome: str) -> float:
+        trials = self.report.config.trials
+        return self.report.counts.outcome_counts.get(outcome, 0) / trials
+
+    def row(self) -> tuple[Any, ...]:
+        """Values in `SWEEP_FIELDNAMES` order."""
+        exact = self.report.config.exact
+        return (
+            self.dice_type,
+            self.sides,
+            self.dice,
+            self.mode.name.lower(),
+            int(exact),
+            0 if exact else self.report.config.trials,
+            self.expected_points,
+            self.report.averages.avg_total,
+            self.probability("win"),
+            self.probability("draw"),
+            self.probability("lose"),
+            self.report.match_probability,
+        )
+
+
+# Per dice count: ({total: frequency}, {total: all-match frequency}).
+_DiceCounts = dict[int, tuple[Counter[int], Counter[int]]]
+
+
+@dataclass(frozen=True)
+class _SweepJob:
+    """Every cell of one dice type; picklable for worker processes."""
+
+    game_config: GameConfig
+    dice_type: str
+    dice_counts: tuple[int, ...]
+    modes: tuple[GameMode, ...]
+    method: SimulationMethod
+    engine: Literal["numpy", "python"]
+    trials: int
+    seed: int
+
+
+def _exact_counts(sides: int, dice_counts: Sequence[int]) -> _DiceCounts:
+    wanted = set(dice_counts)
+    counts: _DiceCounts = {}
+    for num_dice, ways in enumerate(iter_total_ways(sides, max(wanted)), start=1):
+        if num_dice in wanted:
+            # Exactly one roll per face has every die showing that face.
+            matches = Counter({face * num_dice: 1 for face in range(1, sides + 1)})
+            counts[num_dice] = (Counter(ways), matches)
+    return counts
+
+
+def _count_block_numpy(
+    batch: RollBatch, sides: int, dice_counts: Sequence[int], counts: _DiceCounts
+) -> None:
+    rolls = batch.as_matrix()
+    totals = rolls.cumsum(axis=1, dtype=np.int32)
+    # matched[:, n - 1]: the first n dice all show the same face.
+    matched = np.logical_and.accumulate(rolls == rolls[:, :1], axis=1)
+
+    for num_dice in dice_counts:
+        size = num_dice * (sides - 1) + 1
+        indexes = totals[:, num_dice - 1] - num_dice
+        frequencies = np.bincount(indexes, minlength=size)
+        match_frequencies = np.bincount(
+            indexes[matched[:, num_dice - 1]], minlength=size
+        )
+        total_counter, match_counter = counts[num_dice]
+        for index in np.flatnonzero(frequencies):
+            total_counter[num_dice + int(index)] += int(frequencies[index])
+        for index in np.flatnonzero(match_frequencies):
+            match_counter[num_dice + int(index)] += int(match_frequencies[index])
+
+
+def _count_block_python(
+    batch: RollBatch, dice_counts: Sequence[int], counts: _DiceCounts
+) -> None:
+    wanted = set(dice_counts)
+    for rolls in batch:
+        first = rolls[0]
+        total = 0
+        match = True
+        for num_dice, face in enumerate(rolls, start=1):
+            total += face
+            match = match and face == first
+            if num_dice in wanted:
+                total_counter, match_counter = counts[num_dice]
+                total_counter[total] += 1
+                if match:
+                    match_counter[total] += 1
+
+
+def _sampled_counts(
+    sides: int,
+    dice_counts: Sequence[int],
+    engine: Literal["numpy", "python"],
+    trials: int,
+    seed: int,
+) -> _DiceCounts:
+    """Rolls ``trials`` vectors of the largest dice count, shared by all."""
+    max_dice = max(dice_counts)
+    counts: _DiceCounts = {n: (Counter(), Counter()) for n in dice_counts}
+
+    for index, start in enumerate(range(0, trials, SIMULATION_BLOCK_TRIALS)):
+        block_trials = min(SIMULATION_BLOCK_TRIALS, trials - start)
+        backend: RollBackend
+        if engine == "numpy":
+            seed_sequence = np.random.SeedSequence(seed, spawn_key=(sides, index))
+            backend = NumpyRollBackend(np.random.default_rng(seed_sequence))
+        else:
+            backend = StdlibRollBackend(random.Random(f"{seed}:{sides}:{index}"))
+        values = backend.roll_values(sides, block_trials * max_dice)
+        batch = RollBatch(values=values, count=block_trials, num_dice=max_dice)
+
+        if engine == "numpy":
+            _count_block_numpy(batch, sides, dice_counts, counts)
+        else:
+            _count_block_python(batch, dice_counts, counts)
+
+    return counts
+
+
+def _run_job(job: _SweepJob) -> list[SweepCell]:
+    sides = DICE_TYPES[job.dice_type]
+    exact = job.method == "exact"
+    counts = (
+        _exact_counts(sides, job.dice_counts)
+        if exact
+        else _sampled_counts(sides, job.dice_counts, job.engine, job.trials, job.seed)
+    )
+
+    cells: list[SweepCell] = []
+    for num_dice in job.dice_counts:
+        total_counter, match_counter = counts[num_dice]
+        for mode in job.modes:
+            context = RollContext("sweep", mode, job.dice_type, num_dice, sides)
+            tally = SimulationTally()
+            tally_total_counts(
+                outcome_table(job.game_config, context),
+                total_counter.items(),
+                match_counter.items(),
+                tally,
+            )
+            report = tally.to_report(context, exact=exact)
+            cells.append(SweepCell(job.dice_type, num_dice, mode, report))
+    return cells
+
+
+def sweep(
+    *,
+    game_config: GameConfig,
+    method: SimulationMethod = "exact",
+    trials: int = 100_000,
+    engine: SimulationEngine = "auto",
+    seed: int | None = None,
+    workers: int = 1,
+    dice_types: Iterable[str] | None = None,
+    dice_counts: Iterable[int] | None = None,
+    modes: Iterable[GameMode] | None = None,
+) -> list[SweepCell]:
+    """Scores every combination of dice type, dice count and game mode.
+
+    Defaults to the full grid: all `DICE_TYPES`, ``MIN_DICE..20`` dice and
+    every `GameMode`, ordered by dice type, then dice count, then mode.
+    ``method="exact"`` enumerates outcomes without sampling; Monte Carlo
+    rolls ``trials`` vectors per dice type, reused for every dice count (so
+    cells of one dice type are correlated, each one unbiased). ``workers > 1``
+    spreads dice types across a process pool.
+    """
+    if method not in ("exact", "monte_carlo"):
+        raise ValueError(f"Unknown simulation method: {method!r}")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    # Duplicates are dropped (first occurrence kept): Monte Carlo counts are
+    # keyed by dice count, so a repeated count would be tallied twice.
+    types = tuple(dict.fromkeys(DICE_TYPES if dice_types is None else dice_types))
+    counts = tuple(
+        dict.fromkeys(
+            range(MIN_DICE, SWEEP_MAX_DICE + 1) if dice_counts is None else dice_counts
+        )
+    )
+    selected_modes = tuple(dict.fromkeys(GameMode if modes is None else modes))
+    if unknown := [name for name in types if name not in DICE_TYPES]:
+        raise ValueError(f"Unknown dice types: {unknown}")
+    if not types or not counts or not selected_modes:
+        raise ValueError("Every sweep dimension needs at least one value")
+    if min(counts) < 1:
+        raise ValueError("Dice counts must be at least 1")
+    if method == "monte_carlo" and trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    selected_engine = resolve_engine(engine)
+
+    # One seed for the whole sweep; RNG streams are split per dice type.
+    if seed is None:
+        seed = secrets.randbits(64)
+    jobs = [
+        _SweepJob(
+            game_config=game_config,
+            dice_type=dice_type,
+            dice_counts=counts,
+            modes=selected_modes,
+            method=method,
+            engine=selected_engine,
+            trials=trials,
+            seed=seed,
+        )
+        for dice_type in types
+    ]
+
+    if workers == 1 or len(jobs) == 1:
+        return [cell for job in jobs for cell in _run_job(job)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        return [cell for cells in executor.map(_run_job, jobs) for cell in cells]
+
+
+def sweep_output_path(fmt: SweepFormat = "csv") -> str:
+    """Default sweep file: next to the CSV export, named ``simulation_sweep``."""
+    base_path = Path(GameConfig().exports.export_path).with_name("simulation_sweep.csv")
+    if fmt == "csv":
+        return str(base_path)
+    return str(
+        base_path.with_suffix(COLUMNAR_EXTENSIONS[resolve_columnar_format("auto")])
+    )
+
+
+def write_sweep(
+    cells: Iterable[SweepCell], file_path: str, fmt: SweepFormat = "csv"
+) -> int:
+    """Writes one row per cell as CSV or columnar.
+
+    Columnar files are Parquet or ``dcol`` by extension, else whichever
+    format is available.
+    """
+    rows = (cell.row() for cell in cells)
+    if fmt == "columnar":
+        suffix = Path(file_path).suffix
+        columnar_format: ColumnarFormat = "auto"
+        if suffix == COLUMNAR_EXTENSIONS["parquet"]:
+            columnar_format = "parquet"
+        elif suffix == COLUMNAR_EXTENSIONS["dcol"]:
+            columnar_format = "dcol"
+        return write_columnar(rows, file_path, columnar_format, schema=SWEEP_SCHEMA)
+    if fmt != "csv":
+        raise ValueError(f"Unknown sweep format: {fmt!r}")
+
+    count = 0
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(SWEEP_FIELDNAMES)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--method", choices=["exact", "monte_carlo"], default="exact")
+    parser.add_argument("--trials", type=int, default=100_000)
+    parser.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--format", choices=["csv", "columnar"], default="csv")
+    parser.add_argument("--out", default=None, help="output file path")
+    args = parser.parse_args(argv)
+
+    cells = sweep(
+        game_config=GameConfig(),
+        method=args.method,
+        trials=args.trials,
+        engine=args.engine,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    file_path = args.out or sweep_output_path(args.format)
+    written = write_sweep(cells, file_path, args.format)
+    print(f"Wrote {written} sweep cells to {file_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
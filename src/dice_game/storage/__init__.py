@@ -1,37 +1,92 @@
-from .connection import connection, utc_now_iso
+from .aio import AsyncStorageConfig, close_db_executor, run_in_db
+from .connection import (
+    STORAGE_PROFILES,
+    ConnectionPool,
+    PoolConfig,
+    StorageProfile,
+    close_pools,
+    connection,
+    optional_connection,
+    storage_profile,
+    transaction,
+    utc_now_iso,
+)
 from .db_init import init_db
+from .maintenance import (
+    check_roll_summary,
+    check_session_stats,
+    rebuild_roll_summary,
+    rebuild_session_stats,
+)
+from .roll_codec import decode_rolls, encode_rolls
 from .roll_repository import (
+    ExportBoundsRecord,
     OverallStatsRecord,
     SessionStatsRecord,
     best_roll,
     clear_rolls,
     clear_rolls_by_session,
+    columnar_export_path,
     count_rolls,
+    export_bounds,
+    export_rolls_columnar,
     export_rolls_to_csv,
     export_rolls_to_csv_by_session,
     filter_rolls,
+    iter_export_rows,
     last_rolls,
     overall_stats,
     paginated_rolls,
     paginated_rolls_by_session,
+    roll_row,
     save_roll,
+    save_roll_rows,
+    save_rolls,
     session_stats,
 )
 from .session_repository import (
     GameSessionRecord,
+    SessionCache,
+    SessionCacheConfig,
+    SessionCacheStats,
+    clear_session_cache,
     create_game_session,
     delete_game_session,
     get_game_session,
+    invalidate_game_session,
     reset_game_session_points,
+    session_cache_stats,
     update_game_session_points,
 )
+from .write_buffer import (
+    RollWriteBuffer,
+    WriteBufferConfig,
+    close_roll_buffer,
+    flush_rolls,
+    record_roll,
+    write_mode,
+)
 
 __all__ = [
     "init_db",
+    "check_session_stats",
+    "rebuild_session_stats",
+    "check_roll_summary",
+    "rebuild_roll_summary",
     "OverallStatsRecord",
     "SessionStatsRecord",
+    "ExportBoundsRecord",
     "GameSessionRecord",
     "save_roll",
+    "save_rolls",
+    "save_roll_rows",
+    "roll_row",
+    "RollWriteBuffer",
+    "WriteBufferConfig",
+    "record_roll",
+    "flush_rolls",
+    "close_roll_buffer",
+    "write_mode",
     "last_rolls",
     "best_roll",
     "filter_rolls",
@@ -44,11 +99,34 @@ __all__ = [
     "overall_stats",
     "export_rolls_to_csv",
     "export_rolls_to_csv_by_session",
+    "iter_export_rows",
+    "encode_rolls",
+    "decode_rolls",
+    "export_bounds",
+    "export_rolls_columnar",
+    "columnar_export_path",
     "create_game_session",
     "get_game_session",
     "update_game_session_points",
     "reset_game_session_points",
     "delete_game_session",
+    "SessionCache",
+    "SessionCacheConfig",
+    "SessionCacheStats",
+    "session_cache_stats",
+    "clear_session_cache",
+    "invalidate_game_session",
     "connection",
+    "transaction",
+    "optional_connection",
+    "ConnectionPool",
+    "PoolConfig",
+    "close_pools",
+    "StorageProfile",
+    "STORAGE_PROFILES",
+    "storage_profile",
     "utc_now_iso",
+    "AsyncStorageConfig",
+    "run_in_db",
+    "close_db_executor",
 ]
@@ -0,0 +1,212 @@
+"""Async front end to the storage layer for ``async def`` API routes.
+
+Every call is queued to a dedicated database executor (one thread by default)
+and awaited, so the event loop never blocks on SQLite and request handling
+no longer competes for Starlette's sync threadpool. The repository functions
+themselves are unchanged: each coroutine here runs its sync counterpart on
+the database thread, which checks a connection out of the usual pool.
+
+Long-running work stays off the database thread so it cannot hold up
+every other request's queries: file exports run on the event loop's default
+executor (their reads are keyset-paged and borrow pooled connections per
+batch), and streaming downloads are driven by Starlette's threadpool.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import ParamSpec, TypeVar
+
+from ..domain.models import RollResult
+from ..domain.stats import OverallStats
+from . import roll_repository, session_repository, write_buffer
+from .columnar import ColumnarFormat
+from .history_types import DatabaseRecord
+from .roll_repository import ExportBoundsRecord, SessionStatsRecord
+from .session_repository import GameSessionRecord
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class AsyncStorageConfig:
+    """Configuration for the async storage executor.
+
+    Attributes:
+        threads: Database threads serving async callers. ``1`` serializes all
+                 access through one thread; more threads let WAL readers run
+                 side by side. Overridable with ``DICE_GAME_DB_THREADS``.
+    """
+
+    threads: int = field(
+        default_factory=lambda: int(os.getenv("DICE_GAME_DB_THREADS", "1"))
+    )
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_pid: int | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _executor_pid
+    with _executor_lock:
+        # A forked child inherits the object but not its threads.
+        if _executor is None or _executor_pid != os.getpid():
+            config = AsyncStorageConfig()
+            if config.threads < 1:
+                raise ValueError("DICE_GAME_DB_THREADS must be at least 1")
+            _executor = ThreadPoolExecutor(
+                max_workers=config.threads, thread_name_prefix="dice-game-db"
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def close_db_executor() -> None:
+    """Waits for queued calls and stops the database threads; call on shutdown."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def run_in_db(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Runs ``func(*args, **kwargs)`` on the database thread and awaits it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+async def create_game_session() -> GameSessionRecord:
+    return await run_in_db(session_repository.create_game_session)
+
+
+async def get_game_session(session_id: str) -> GameSessionRecord | None:
+    return await run_in_db(session_repository.get_game_session, session_id)
+
+
+async def update_game_session_points(session_id: str, player_points: int) -> None:
+    await run_in_db(
+        session_repository.update_game_session_points, session_id, player_points
+    )
+
+
+async def reset_game_session_points(session_id: str) -> None:
+    await run_in_db(session_repository.reset_game_session_points, session_id)
+
+
+async def delete_game_session(session_id: str) -> int:
+    return await run_in_db(session_repository.delete_game_session, session_id)
+
+
+async def save_roll(result: RollResult) -> None:
+    await run_in_db(roll_repository.save_roll, result)
+
+
+async def save_rolls(results: list[RollResult]) -> int:
+    return await run_in_db(roll_repository.save_rolls, results)
+
+
+async def last_rolls(n: int) -> list[DatabaseRecord]:
+    return await run_in_db(roll_repository.last_rolls, n)
+
+
+async def best_roll() -> DatabaseRecord | None:
+    return await run_in_db(roll_repository.best_roll)
+
+
+async def count_rolls(*, sides: int | None = None, dice: int | None = None) -> int:
+    return await run_in_db(roll_repository.count_rolls, sides=sides, dice=dice)
+
+
+async def paginated_rolls(
+    *,
+    limit: int,
+    offset: int = 0,
+    sides: int | None = None,
+    dice: int | None = None,
+    before_id: int | None = None,
+    after_id: int | None = None,
+) -> list[DatabaseRecord]:
+    return await run_in_db(
+        roll_repository.paginated_rolls,
+        limit=limit,
+        offset=offset,
+        sides=sides,
+        dice=dice,
+        before_id=before_id,
+        after_id=after_id,
+    )
+
+
+async def paginated_rolls_by_session(
+    game_session_id: str,
+    *,
+    limit: int,
+    offset: int = 0,
+    before_id: int | None = None,
+    after_id: int | None = None,
+) -> list[DatabaseRecord]:
+    return await run_in_db(
+        roll_repository.paginated_rolls_by_session,
+        game_session_id,
+        limit=limit,
+        offset=offset,
+        before_id=before_id,
+        after_id=after_id,
+    )
+
+
+async def clear_rolls_by_session(game_session_id: str) -> int:
+    return await run_in_db(roll_repository.clear_rolls_by_session, game_session_id)
+
+
+async def session_stats(game_session_id: str) -> SessionStatsRecord:
+    return await run_in_db(roll_repository.session_stats, game_session_id)
+
+
+async def overall_stats() -> OverallStats:
+    return await run_in_db(roll_repository.overall_stats)
+
+
+async def flush_rolls() -> int:
+    """Commits rolls still held by the group-mode write buffer.
+
+    Await this before reading, deleting or exporting roll history; otherwise
+    a roll the client was already told about can be missing from the result.
+    """
+    return await run_in_db(write_buffer.flush_rolls)
+
+
+async def export_bounds(game_session_id: str) -> ExportBoundsRecord:
+    return await run_in_db(roll_repository.export_bounds, game_session_id)
+
+
+async def export_rolls_to_csv_by_session(
+    game_session_id: str, file_path: str | None = None
+) -> int:
+    return await asyncio.to_thread(
+        roll_repository.export_rolls_to_csv_by_session, game_session_id, file_path
+    )
+
+
+async def export_rolls_columnar(
+    file_path: str | None = None,
+    *,
+    game_session_id: str | None = None,
+    fmt: ColumnarFormat = "auto",
+) -> int:
+    return await asyncio.to_thread(
+        roll_repository.export_rolls_columnar,
+        file_path,
+        game_session_id=game_session_id,
+        fmt=fmt,
+    )
@@ -0,0 +1,226 @@
+"""Typed columnar export of roll history.
+
+Parquet is written when pyarrow is installed (``pip install -e ".[columnar]"``).
+Without it the exporter falls back to ``dcol``, a small stdlib-only format:
+
+    b"DCOL1\\n"
+    <u32 length> <JSON schema>
+    repeated row groups: <u32 rows> then, per column, <u32 length> <zlib payload>
+    <u32 0> terminator
+
+Payloads are little-endian: ``int64`` columns are packed ``q`` arrays and
+``float64`` columns packed ``d`` arrays; ``string`` columns are ``rows + 1``
+``u32`` offsets followed by UTF-8 bytes; ``list<uint8>`` columns are
+``rows + 1`` ``u32`` offsets followed by the flattened ``u8`` values. Row
+groups are written as rows stream in, so neither format holds more than one
+group in memory.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, BinaryIO, Final, Literal
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+    pq = None
+
+ColumnarFormat = Literal["auto", "parquet", "dcol"]
+
+COLUMNAR_ROW_GROUP_ROWS = 50_000
+
+# Same column order as CSV_FIELDNAMES; ``rolls`` is a real list column.
+COLUMNAR_SCHEMA: Final[tuple[tuple[str, str], ...]] = (
+    ("id", "int64"),
+    ("game_session_id", "string"),
+    ("time", "string"),
+    ("mode", "string"),
+    ("dice", "int64"),
+    ("dice_type", "string"),
+    ("sides", "int64"),
+    ("rolls", "list<uint8>"),
+    ("total", "int64"),
+    ("has_match", "int64"),
+    ("outcome", "string"),
+    ("points_delta", "int64"),
+    ("points_total", "int64"),
+)
+
+ColumnarSchema = Sequence[tuple[str, str]]
+
+COLUMNAR_EXTENSIONS: Final[dict[str, str]] = {"parquet": ".parquet", "dcol": ".dcol"}
+
+_MAGIC = b"DCOL1\n"
+_U32 = struct.Struct("<I")
+
+
+def resolve_columnar_format(fmt: ColumnarFormat) -> Literal["parquet", "dcol"]:
+    if fmt == "auto":
+        return "dcol" if pa is None else "parquet"
+    if fmt == "parquet" and pa is None:
+        raise RuntimeError("Parquet export requires pyarrow")
+    if fmt not in ("parquet", "dcol"):
+        raise ValueError(f"Unknown columnar format: {fmt!r}")
+    return fmt
+
+
+def _row_groups(
+    rows: Iterable[Sequence[Any]], group_rows: int, width: int
+) -> Iterator[list[list[Any]]]:
+    """Transposes rows into ``width`` per-column lists, ``group_rows`` at a time."""
+    columns: list[list[Any]] = [[] for _ in range(width)]
+    for row in rows:
+        for index, value in enumerate(row):
+            columns[index].append(value)
+        if len(columns[0]) == group_rows:
+            yield columns
+            columns = [[] for _ in range(width)]
+    if columns[0]:
+        yield columns
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - little-endian CI only
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode_column(kind: str, values: list[Any]) -> bytes:
+    if kind == "int64":
+        return _little_endian(array("q", values))
+    if kind == "float64":
+        return _little_endian(array("d", values))
+
+    offsets = array("I", [0])
+    if kind == "string":
+        data = bytearray()
+        for value in values:
+            data += value.encode("utf-8")
+            offsets.append(len(data))
+        return _little_endian(offsets) + bytes(data)
+
+    flat = array("B")
+    for rolls in values:
+        flat.extend(rolls)
+        offsets.append(len(flat))
+    return _little_endian(offsets) + flat.tobytes()
+
+
+def _write_dcol(
+    rows: Iterable[Sequence[Any]], out: BinaryIO, schema: ColumnarSchema
+) -> int:
+    header = json.dumps([{"name": n, "type": t} for n, t in schema])
+    out.write(_MAGIC)
+    out.write(_U32.pack(len(header)) + header.encode())
+
+    count = 0
+    for columns in _row_groups(rows, COLUMNAR_ROW_GROUP_ROWS, len(schema)):
+        out.write(_U32.pack(len(columns[0])))
+        for (_, kind), values in zip(schema, columns, strict=True):
+            payload = zlib.compress(_encode_column(kind, values))
+            out.write(_U32.pack(len(payload)) + payload)
+        count += len(columns[0])
+
+    out.write(_U32.pack(0))
+    return count
+
+
+def _write_parquet(
+    rows: Iterable[Sequence[Any]], file_path: str, schema: ColumnarSchema
+) -> int:
+    types = {"int64": pa.int64(), "float64": pa.float64(), "string": pa.string()}
+    arrow_schema = pa.schema(
+        [
+            (name, pa.list_(pa.uint8()) if kind == "list<uint8>" else types[kind])
+            for name, kind in schema
+        ]
+    )
+
+    count = 0
+    with pq.ParquetWriter(file_path, arrow_schema, compression="zstd") as writer:
+        for columns in _row_groups(rows, COLUMNAR_ROW_GROUP_ROWS, len(schema)):
+            writer.write_table(pa.table(columns, schema=arrow_schema))
+            count += len(columns[0])
+    return count
+
+
+def write_columnar(
+    rows: Iterable[Sequence[Any]],
+    file_path: str,
+    fmt: ColumnarFormat = "auto",
+    *,
+    schema: ColumnarSchema = COLUMNAR_SCHEMA,
+) -> int:
+    """Writes rows matching ``schema`` (export rows by default) columnar."""
+    if resolve_columnar_format(fmt) == "parquet":
+        return _write_parquet(rows, file_path, schema)
+    with open(file_path, "wb") as out:
+        return _write_dcol(rows, out, schema)
+
+
+def _read_exact(src: BinaryIO, size: int) -> bytes:
+    data = src.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated dcol file")
+    return data
+
+
+def _decode_column(kind: str, payload: bytes, rows: int) -> list[Any]:
+    if kind in ("int64", "float64"):
+        values = array("q" if kind == "int64" else "d")
+        values.frombytes(payload)
+        if sys.byteorder == "big":  # pragma: no cover - little-endian CI only
+            values.byteswap()
+        return values.tolist()
+
+    offsets = array("I")
+    offsets.frombytes(payload[: (rows + 1) * offsets.itemsize])
+    if sys.byteorder == "big":  # pragma: no cover - little-endian CI only
+        offsets.byteswap()
+    data = payload[(rows + 1) * offsets.itemsize :]
+
+    if kind == "string":
+        return [data[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(rows)]
+    return [list(data[offsets[i] : offsets[i + 1]]) for i in range(rows)]
+
+
+def _read_dcol_header(src: BinaryIO) -> list[dict[str, str]]:
+    if _read_exact(src, len(_MAGIC)) != _MAGIC:
+        raise ValueError("Not a dcol file")
+    (schema_size,) = _U32.unpack(_read_exact(src, _U32.size))
+    return json.loads(_read_exact(src, schema_size))
+
+
+def iter_dcol_row_groups(file_path: str) -> Iterator[dict[str, list[Any]]]:
+    """Yields each row group of a ``dcol`` file as ``{column: values}``."""
+    with open(file_path, "rb") as src:
+        schema = _read_dcol_header(src)
+
+        while True:
+            (rows,) = _U32.unpack(_read_exact(src, _U32.size))
+            if rows == 0:
+                return
+            group: dict[str, list[Any]] = {}
+            for column in schema:
+                (size,) = _U32.unpack(_read_exact(src, _U32.size))
+                payload = zlib.decompress(_read_exact(src, size))
+                group[column["name"]] = _decode_column(column["type"], payload, rows)
+            yield group
+
+
+def read_dcol(file_path: str) -> dict[str, list[Any]]:
+    """Loads a whole ``dcol`` file as ``{column: values}``."""
+    with open(file_path, "rb") as src:
+        table: dict[str, list[Any]] = {
+            column["name"]: [] for column in _read_dcol_header(src)
+        }
+    for group in iter_dcol_row_groups(file_path):
+        for name, values in group.items():
+            table[name].extend(values)
+    return table
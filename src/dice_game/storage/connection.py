@@ -1,8 +1,11 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator
-import sqlite3
 
 DB_PATH = Path(__file__).resolve().parent / "rolls.db"
 
@@ -11,13 +14,244 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@contextmanager
-def connection() -> Iterator[sqlite3.Connection]:
-    conn = sqlite3.connect(DB_PATH)
+@dataclass(frozen=True)
+class PoolConfig:
+    """Configuration for the SQLite connection pool.
+
+    Attributes:
+        size: Maximum open connections per database file. ``0`` disables
+              pooling and opens a fresh connection per `connection()` call.
+              Overridable with ``DICE_GAME_DB_POOL_SIZE``.
+        timeout: Seconds to wait for a free connection before raising
+                 `TimeoutError`. Overridable with
+                 ``DICE_GAME_DB_POOL_TIMEOUT``.
+    """
+
+    size: int = field(
+        default_factory=lambda: int(os.getenv("DICE_GAME_DB_POOL_SIZE", "8"))
+    )
+    timeout: float = field(
+        default_factory=lambda: float(os.getenv("DICE_GAME_DB_POOL_TIMEOUT", "30"))
+    )
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """SQLite tuning applied to every connection (journal mode at init).
+
+    Attributes:
+        journal_mode: Persistent journal mode, set by `init_db`.
+        synchronous: ``FULL`` fsyncs every commit; ``NORMAL`` is durable in
+                     WAL mode except for the last commits on power loss.
+        busy_timeout_ms: How long a connection waits on a lock before
+                         raising ``database is locked``.
+        cache_size: Page cache size; negative values are in KiB.
+        mmap_size: Bytes of the file to memory-map for reads (0 = off).
+        temp_store: Where temporary tables and indexes live.
+    """
+
+    journal_mode: str
+    synchronous: str
+    busy_timeout_ms: int
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+
+
+STORAGE_PROFILES: dict[str, StorageProfile] = {
+    # SQLite's stock settings: rollback journal, fsync on every commit.
+    "default": StorageProfile(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        busy_timeout_ms=5_000,
+        cache_size=-2_000,
+        mmap_size=0,
+        temp_store="DEFAULT",
+    ),
+    # WAL lets readers proceed while a write is in progress.
+    "performance": StorageProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        busy_timeout_ms=10_000,
+        cache_size=-16_000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+    ),
+}
+
+
+def storage_profile() -> StorageProfile:
+    """Profile named by ``DICE_GAME_DB_PROFILE`` (default ``performance``)."""
+    name = os.getenv("DICE_GAME_DB_PROFILE", "performance")
+    try:
+        return STORAGE_PROFILES[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown storage profile: {name!r}") from exc
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    profile = storage_profile()
+    # check_same_thread=False: pooled connections are handed between threads,
+    # but only ever used by one thread at a time.
+    conn = sqlite3.connect(
+        db_path,
+        timeout=profile.busy_timeout_ms / 1000,
+        check_same_thread=False,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(f"PRAGMA synchronous = {profile.synchronous}")
+    conn.execute(f"PRAGMA busy_timeout = {int(profile.busy_timeout_ms)}")
+    conn.execute(f"PRAGMA cache_size = {int(profile.cache_size)}")
+    conn.execute(f"PRAGMA mmap_size = {int(profile.mmap_size)}")
+    conn.execute(f"PRAGMA temp_store = {profile.temp_store}")
+    return conn
+
+
+class ConnectionPool:
+    """Bounded pool of reusable connections to one database file."""
+
+    def __init__(self, db_path: Path, *, size: int, timeout: float) -> None:
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.pid = os.getpid()
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def acquire(self) -> sqlite3.Connection:
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"No free database connection after {self.timeout}s")
+
+        try:
+            while True:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    conn = self._idle.pop() if self._idle else None
+
+                if conn is None:
+                    return _open_connection(self.db_path)
+                if self._is_healthy(conn):
+                    return conn
+                conn.close()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(conn)
+                    return
+            conn.close()
+        except sqlite3.Error:
+            conn.close()
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Closes idle connections; checked-out ones close on release."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pools: dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool | None:
+    config = PoolConfig()
+    if config.size <= 0:
+        return None
+
+    db_path = Path(DB_PATH)
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        # A forked child must not reuse its parent's connections.
+        if pool is None or pool.pid != os.getpid():
+            pool = ConnectionPool(db_path, size=config.size, timeout=config.timeout)
+            _pools[db_path] = pool
+        return pool
+
+
+def close_pools() -> None:
+    """Closes every pool; call on application shutdown."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+@contextmanager
+def connection() -> Iterator[sqlite3.Connection]:
+    pool = _get_pool()
+    if pool is None:
+        conn = _open_connection(Path(DB_PATH))
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+        return
+
+    conn = pool.acquire()
     try:
         yield conn
         conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Single connection running one ``BEGIN IMMEDIATE`` transaction.
+
+    The write lock is taken up front, so a read-modify-write inside the block
+    cannot interleave with another writer. Commits on success and rolls back
+    on any exception.
+    """
+    with connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+
+
+@contextmanager
+def optional_connection(
+    conn: sqlite3.Connection | None,
+) -> Iterator[sqlite3.Connection]:
+    """Yields ``conn`` untouched, or a fresh `connection` when it is None.
+
+    Lets repository functions join a caller's `transaction`; committing and
+    closing stay with whoever opened the connection.
+    """
+    if conn is not None:
+        yield conn
+        return
+
+    with connection() as new_conn:
+        yield new_conn
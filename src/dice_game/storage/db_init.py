@@ -1,6 +1,250 @@
 import sqlite3
+from collections.abc import Callable
+from typing import NamedTuple
 
-from .connection import connection
+from .connection import connection, storage_profile, utc_now_iso
+from .roll_codec import decode_rolls, encode_rolls
+
+# Rows converted per statement batch by data migrations.
+MIGRATION_BATCH_ROWS = 10_000
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+def _create_roll_indexes(conn: sqlite3.Connection) -> None:
+    # Session history pages, per-session stats/exports/deletes and the
+    # ON DELETE CASCADE from game_sessions.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_rolls_session_id "
+        "ON rolls (game_session_id, id)"
+    )
+    # count_rolls/paginated_rolls filtered by sides and dice, by sides alone
+    # (still ordered by id without a temp sort), and by dice alone.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_rolls_sides_dice_id "
+        "ON rolls (sides, dice, id)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rolls_sides_id ON rolls (sides, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rolls_dice_id ON rolls (dice, id)")
+    # best_roll (ORDER BY total DESC) and MIN/MAX(total).
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rolls_total ON rolls (total)")
+
+
+def _encode_legacy_rolls(conn: sqlite3.Connection) -> None:
+    # Rewrites JSON text rolls as roll_codec BLOBs, committing each batch so
+    # a large table never holds one huge write transaction. Re-running after
+    # an interruption resumes: converted rows are no longer 'text'. Older
+    # tables keep their TEXT column declaration; SQLite never coerces BLOB
+    # values through column affinity, so no table rebuild is needed.
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            "SELECT id, rolls FROM rolls "
+            "WHERE id > ? AND typeof(rolls) = 'text' ORDER BY id LIMIT ?",
+            (last_id, MIGRATION_BATCH_ROWS),
+        ).fetchall()
+        if not rows:
+            return
+        conn.executemany(
+            "UPDATE rolls SET rolls = ? WHERE id = ?",
+            [(encode_rolls(decode_rolls(row["rolls"])), row["id"]) for row in rows],
+        )
+        conn.commit()
+        last_id = rows[-1]["id"]
+
+
+# Recomputes session_stats rows from raw rolls; ``{where}`` filters rolls.
+REBUILD_SESSION_STATS_SQL = """
+    INSERT INTO session_stats (
+        game_session_id,
+        total_rolls,
+        total_roll_value,
+        highest_roll,
+        lowest_roll,
+        total_matches
+    )
+    SELECT
+        game_session_id,
+        COUNT(*),
+        SUM(total),
+        MAX(total),
+        MIN(total),
+        SUM(has_match)
+    FROM rolls
+    WHERE {where}
+    GROUP BY game_session_id
+"""
+
+
+def _create_session_stats(conn: sqlite3.Connection) -> None:
+    # Per-session aggregates kept current by a trigger, so the stats route is
+    # a primary-key lookup. Rolls are only ever deleted a whole session at a
+    # time (clear_rolls*, session cascade); those paths reset the row instead
+    # of a per-row delete trigger. maintenance.rebuild_session_stats()
+    # recomputes everything from raw rolls.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS session_stats (
+            game_session_id TEXT PRIMARY KEY,
+            total_rolls INTEGER NOT NULL DEFAULT 0,
+            total_roll_value INTEGER NOT NULL DEFAULT 0,
+            highest_roll INTEGER,
+            lowest_roll INTEGER,
+            total_matches INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (game_session_id) REFERENCES game_sessions(id) ON DELETE CASCADE
+        )
+        """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_rolls_session_stats_insert
+        AFTER INSERT ON rolls
+        BEGIN
+            INSERT INTO session_stats (
+                game_session_id,
+                total_rolls,
+                total_roll_value,
+                highest_roll,
+                lowest_roll,
+                total_matches
+            )
+            VALUES (NEW.game_session_id, 1, NEW.total, NEW.total, NEW.total,
+                    NEW.has_match)
+            ON CONFLICT (game_session_id) DO UPDATE SET
+                total_rolls = total_rolls + 1,
+                total_roll_value = total_roll_value + excluded.total_roll_value,
+                highest_roll = MAX(
+                    COALESCE(highest_roll, excluded.highest_roll),
+                    excluded.highest_roll
+                ),
+                lowest_roll = MIN(
+                    COALESCE(lowest_roll, excluded.lowest_roll),
+                    excluded.lowest_roll
+                ),
+                total_matches = total_matches + excluded.total_matches;
+        END
+        """)
+    conn.execute("DELETE FROM session_stats")
+    conn.execute(REBUILD_SESSION_STATS_SQL.format(where="1=1"))
+
+
+# The single roll_summary row recomputed from raw rolls. The best roll is
+# the highest total, newest first on ties (the idx_rolls_total order).
+ROLL_SUMMARY_SELECT_SQL = """
+    SELECT
+        1,
+        COUNT(*),
+        COALESCE(SUM(total), 0),
+        COALESCE(SUM(has_match), 0),
+        MIN(total),
+        MAX(total),
+        (SELECT id FROM rolls ORDER BY total DESC, id DESC LIMIT 1)
+    FROM rolls
+"""
+
+REBUILD_ROLL_SUMMARY_SQL = """
+    INSERT OR REPLACE INTO roll_summary (
+        id,
+        total_rolls,
+        total_sum,
+        total_matches,
+        lowest_total,
+        highest_total,
+        best_roll_id
+    )
+""" + ROLL_SUMMARY_SELECT_SQL
+
+
+def _create_roll_summary(conn: sqlite3.Connection) -> None:
+    # One global aggregate row for overall_stats/best_roll. Inserts fold in
+    # directly; deletes only re-query MIN/MAX/best (via idx_rolls_total) when
+    # the deleted roll was the current extreme.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS roll_summary (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_rolls INTEGER NOT NULL,
+            total_sum INTEGER NOT NULL,
+            total_matches INTEGER NOT NULL,
+            lowest_total INTEGER,
+            highest_total INTEGER,
+            best_roll_id INTEGER
+        )
+        """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_rolls_summary_insert
+        AFTER INSERT ON rolls
+        BEGIN
+            UPDATE roll_summary SET
+                total_rolls = total_rolls + 1,
+                total_sum = total_sum + NEW.total,
+                total_matches = total_matches + NEW.has_match,
+                lowest_total = MIN(COALESCE(lowest_total, NEW.total), NEW.total),
+                highest_total = MAX(COALESCE(highest_total, NEW.total), NEW.total),
+                best_roll_id = CASE
+                    WHEN highest_total IS NULL OR NEW.total >= highest_total
+                    THEN NEW.id
+                    ELSE best_roll_id
+                END
+            WHERE id = 1;
+        END
+        """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_rolls_summary_delete
+        AFTER DELETE ON rolls
+        BEGIN
+            UPDATE roll_summary SET
+                total_rolls = total_rolls - 1,
+                total_sum = total_sum - OLD.total,
+                total_matches = total_matches - OLD.has_match,
+                lowest_total = CASE
+                    WHEN OLD.total > lowest_total THEN lowest_total
+                    ELSE (SELECT MIN(total) FROM rolls)
+                END,
+                highest_total = CASE
+                    WHEN OLD.total < highest_total THEN highest_total
+                    ELSE (SELECT MAX(total) FROM rolls)
+                END,
+                best_roll_id = CASE
+                    WHEN OLD.id != best_roll_id THEN best_roll_id
+                    ELSE (SELECT id FROM rolls ORDER BY total DESC, id DESC LIMIT 1)
+                END
+            WHERE id = 1;
+        END
+        """)
+    conn.execute(REBUILD_ROLL_SUMMARY_SQL)
+
+
+# Append-only: each migration runs once per database, in version order.
+MIGRATIONS: list[Migration] = [
+    Migration(1, "rolls secondary indexes", _create_roll_indexes),
+    Migration(2, "rolls binary encoding", _encode_legacy_rolls),
+    Migration(3, "session stats aggregates", _create_session_stats),
+    Migration(4, "global roll summary", _create_roll_summary),
+]
+
+
+def _apply_migrations(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """)
+    applied = {
+        row["version"] for row in conn.execute("SELECT version FROM schema_migrations")
+    }
+
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+        migration.apply(conn)
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations (version, name, applied_at) "
+            "VALUES (?, ?, ?)",
+            (migration.version, migration.name, utc_now_iso()),
+        )
 
 
 def _column_exists(conn: sqlite3.Connection, table_name: str, column_name: str) -> bool:
@@ -10,6 +254,9 @@ def _column_exists(conn: sqlite3.Connection, table_name: str, column_name: str)
 
 def init_db() -> None:
     with connection() as conn:
+        # Persistent per database file; must run outside a transaction.
+        conn.execute(f"PRAGMA journal_mode = {storage_profile().journal_mode}")
+
         conn.execute("""
             CREATE TABLE IF NOT EXISTS game_sessions (
                 id TEXT PRIMARY KEY,
@@ -29,7 +276,7 @@ def init_db() -> None:
                 dice INTEGER NOT NULL,
                 dice_type TEXT NOT NULL,
                 sides INTEGER NOT NULL,
-                rolls TEXT NOT NULL,
+                rolls BLOB NOT NULL,
                 total INTEGER NOT NULL,
                 has_match INTEGER NOT NULL DEFAULT 0,
                 outcome TEXT NOT NULL,
@@ -44,3 +291,5 @@ def init_db() -> None:
             conn.execute(
                 "ALTER TABLE rolls ADD COLUMN has_match INTEGER NOT NULL DEFAULT 0"
             )
+
+        _apply_migrations(conn)
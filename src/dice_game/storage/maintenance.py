@@ -0,0 +1,110 @@
+"""Consistency checks and repairs for aggregate tables derived from ``rolls``.
+
+python -m dice_game.storage.maintenance           # report drift
+python -m dice_game.storage.maintenance --repair  # rebuild from raw rolls
+"""
+
+import argparse
+
+from .connection import connection, transaction
+from .db_init import (
+    REBUILD_ROLL_SUMMARY_SQL,
+    REBUILD_SESSION_STATS_SQL,
+    ROLL_SUMMARY_SELECT_SQL,
+    init_db,
+)
+
+_SESSION_STATS_DRIFT_SQL = """
+    WITH actual AS (
+        SELECT
+            game_session_id,
+            COUNT(*) AS total_rolls,
+            SUM(total) AS total_roll_value,
+            MAX(total) AS highest_roll,
+            MIN(total) AS lowest_roll,
+            SUM(has_match) AS total_matches
+        FROM rolls
+        GROUP BY game_session_id
+    )
+    SELECT actual.game_session_id
+    FROM actual
+    LEFT JOIN session_stats AS stored USING (game_session_id)
+    WHERE stored.total_rolls IS NOT actual.total_rolls
+       OR stored.total_roll_value IS NOT actual.total_roll_value
+       OR stored.highest_roll IS NOT actual.highest_roll
+       OR stored.lowest_roll IS NOT actual.lowest_roll
+       OR stored.total_matches IS NOT actual.total_matches
+    UNION
+    SELECT stored.game_session_id
+    FROM session_stats AS stored
+    LEFT JOIN actual USING (game_session_id)
+    WHERE actual.game_session_id IS NULL AND stored.total_rolls != 0
+    ORDER BY 1
+"""
+
+
+def check_session_stats() -> list[str]:
+    """Ids of sessions whose ``session_stats`` row disagrees with their rolls."""
+    with connection() as conn:
+        return [row[0] for row in conn.execute(_SESSION_STATS_DRIFT_SQL)]
+
+
+def rebuild_session_stats(game_session_id: str | None = None) -> int:
+    """Recomputes ``session_stats`` from raw rolls; returns rows written."""
+    with transaction() as conn:
+        if game_session_id is None:
+            conn.execute("DELETE FROM session_stats")
+            cur = conn.execute(REBUILD_SESSION_STATS_SQL.format(where="1=1"))
+        else:
+            conn.execute(
+                "DELETE FROM session_stats WHERE game_session_id = ?",
+                (game_session_id,),
+            )
+            cur = conn.execute(
+                REBUILD_SESSION_STATS_SQL.format(where="game_session_id = ?"),
+                (game_session_id,),
+            )
+        return cur.rowcount
+
+
+def check_roll_summary() -> bool:
+    """True when the global ``roll_summary`` row matches the raw rolls."""
+    with connection() as conn:
+        stored = conn.execute("SELECT * FROM roll_summary WHERE id = 1").fetchone()
+        actual = conn.execute(ROLL_SUMMARY_SELECT_SQL).fetchone()
+    return stored is not None and tuple(stored) == tuple(actual)
+
+
+def rebuild_roll_summary() -> None:
+    """Recomputes the global ``roll_summary`` row from raw rolls."""
+    with transaction() as conn:
+        conn.execute(REBUILD_ROLL_SUMMARY_SQL)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repair", action="store_true", help="rebuild aggregates that drifted"
+    )
+    args = parser.parse_args(argv)
+
+    init_db()
+    drifted = check_session_stats()
+    summary_ok = check_roll_summary()
+    print(f"session_stats: {len(drifted)} session(s) out of date")
+    print(f"roll_summary: {'ok' if summary_ok else 'out of date'}")
+
+    if not args.repair:
+        return 0 if summary_ok and not drifted else 1
+
+    if drifted:
+        rebuilt = rebuild_session_stats()
+        print(f"session_stats: rebuilt {rebuilt} row(s)")
+    if not summary_ok:
+        rebuild_roll_summary()
+        print("roll_summary: rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+"""Compact BLOB encoding for the ``rolls`` column.
+
+The first byte is a tag, followed by the dice:
+
+- ``NIBBLES``: two dice per byte, high nibble first, when every die is at
+  most 15 (D4–D12). A trailing ``0`` nibble pads odd counts; ``0`` is never
+  a die face, so no count is needed.
+- ``BYTES``: one byte per die (faces up to 255, e.g. D20).
+
+Rows written before the encoding existed hold JSON text such as ``"[3, 4]"``;
+`decode_rolls` accepts both.
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Final
+
+NIBBLES: Final[int] = 0x01
+BYTES: Final[int] = 0x02
+
+
+def encode_rolls(rolls: Sequence[int]) -> bytes:
+    if rolls and max(rolls) <= 0x0F:
+        packed = bytearray([NIBBLES])
+        for index in range(0, len(rolls), 2):
+            low = rolls[index + 1] if index + 1 < len(rolls) else 0
+            packed.append(rolls[index] << 4 | low)
+        return bytes(packed)
+
+    return bytes([BYTES, *rolls])
+
+
+def decode_rolls(value: bytes | str) -> list[int]:
+    if isinstance(value, str):
+        return json.loads(value)
+
+    tag, payload = value[0], value[1:]
+    if tag == BYTES:
+        return list(payload)
+    if tag != NIBBLES:
+        raise ValueError(f"Unknown rolls encoding tag: {tag:#x}")
+
+    rolls: list[int] = []
+    for byte in payload:
+        rolls.append(byte >> 4)
+        if byte & 0x0F:
+            rolls.append(byte & 0x0F)
+    return rolls
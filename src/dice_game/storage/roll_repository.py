@@ -1,14 +1,22 @@
 import csv
 import json
 import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import Any, TypedDict, cast
 
 from ..domain.config import GameConfig
 from ..domain.models import RollResult
 from ..domain.stats import OverallStats
-from .connection import connection, utc_now_iso
+from .columnar import (
+    COLUMNAR_EXTENSIONS,
+    ColumnarFormat,
+    resolve_columnar_format,
+    write_columnar,
+)
+from .connection import connection, optional_connection, utc_now_iso
 from .history_types import DatabaseRecord
+from .roll_codec import decode_rolls, encode_rolls
 
 
 class SessionStatsRecord(TypedDict):
@@ -28,6 +36,13 @@ class OverallStatsRecord(TypedDict):
     lowest_total: int | None
 
 
+class ExportBoundsRecord(TypedDict):
+    records: int
+    first_id: int | None
+    last_id: int | None
+    last_time: str | None
+
+
 CSV_FIELDNAMES = [
     "id",
     "game_session_id",
@@ -45,57 +60,176 @@ CSV_FIELDNAMES = [
 ]
 
 
-def _write_rows_to_csv(rows: list[sqlite3.Row], file_path: str) -> int:
-    with open(file_path, mode="w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
-        writer.writeheader()
+_ROLLS_INDEX = CSV_FIELDNAMES.index("rolls")
+
+# Rows fetched per cursor round trip while exporting; memory stays bounded
+# by one batch however large the table is.
+EXPORT_BATCH_ROWS = 1_000
 
-        for row in rows:
-            writer.writerow(dict(row))
 
-    return len(rows)
+def iter_export_rows(
+    game_session_id: str | None = None,
+    *,
+    newest_first: bool = True,
+    up_to_id: int | None = None,
+    after_id: int | None = None,
+    batch_size: int | None = None,
+) -> Iterator[Sequence[Any]]:
+    """Yields export rows (in `CSV_FIELDNAMES` order), keyset-paged by id.
+
+    ``rolls`` is decoded to a list of ints; `csv_export_row` turns a row back
+    into CSV cells. ``up_to_id`` pins the export to rows that existed when it
+    was planned; ``after_id`` resumes after that row, in export order. Each
+    batch borrows a pooled connection only for its own
+    query, so a slow consumer holds neither a connection nor a read snapshot
+    between batches.
+    """
+    limit = batch_size or EXPORT_BATCH_ROWS
+    filters = ""
+    params: list[str | int] = []
+    if game_session_id is not None:
+        filters += " AND game_session_id = ?"
+        params.append(game_session_id)
+    if up_to_id is not None:
+        filters += " AND id <= ?"
+        params.append(up_to_id)
+    order, after = ("DESC", "<") if newest_first else ("ASC", ">")
+
+    last_id = after_id
+    while True:
+        query = f"SELECT {', '.join(CSV_FIELDNAMES)} FROM rolls WHERE 1=1{filters}"
+        page_params = list(params)
+        if last_id is not None:
+            query += f" AND id {after} ?"
+            page_params.append(last_id)
+        query += f" ORDER BY id {order} LIMIT ?"
+        page_params.append(limit)
+
+        with connection() as conn:
+            batch = conn.execute(query, page_params).fetchall()
 
+        for row in batch:
+            values = list(row)
+            values[_ROLLS_INDEX] = decode_rolls(values[_ROLLS_INDEX])
+            yield values
+        if len(batch) < limit:
+            return
+        last_id = batch[-1]["id"]
 
-def save_roll(result: RollResult) -> None:
+
+def csv_export_row(row: Sequence[Any]) -> list[Any]:
+    """CSV cells for an export row; ``rolls`` is written as JSON, e.g. ``[3, 4]``."""
+    cells = list(row)
+    cells[_ROLLS_INDEX] = json.dumps(cells[_ROLLS_INDEX])
+    return cells
+
+
+def export_bounds(game_session_id: str) -> ExportBoundsRecord:
+    """Row count, id range and last roll time of a session, for pinning an export.
+
+    Ids can be reused after ``clear_rolls(reset_ids=True)``, so the last roll's
+    time tells apart two histories with the same count and ids.
+    """
     with connection() as conn:
-        conn.execute(
+        row = conn.execute(
             """
-            INSERT INTO rolls (
-                game_session_id,
-                time,
-                mode,
-                dice,
-                dice_type,
-                sides,
-                rolls,
-                total,
-                has_match,
-                outcome,
-                points_delta,
-                points_total
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            SELECT
+                COUNT(*) AS records,
+                MIN(id) AS first_id,
+                MAX(id) AS last_id,
+                (
+                    SELECT time FROM rolls
+                    WHERE game_session_id = :game_session_id
+                    ORDER BY id DESC
+                    LIMIT 1
+                ) AS last_time
+            FROM rolls
+            WHERE game_session_id = :game_session_id
             """,
-            (
-                result.context.game_session_id,
-                utc_now_iso(),
-                result.context.mode.name.lower(),
-                result.context.num_dice,
-                result.context.dice_type,
-                result.context.sides,
-                json.dumps(result.rolls),
-                result.total,
-                int(result.has_match),
-                result.outcome,
-                result.points_delta,
-                result.points_total,
-            ),
-        )
+            {"game_session_id": game_session_id},
+        ).fetchone()
+        return {
+            "records": int(row["records"]),
+            "first_id": row["first_id"],
+            "last_id": row["last_id"],
+            "last_time": row["last_time"],
+        }
+
+
+def _write_rows_to_csv(rows: Iterable[Sequence[Any]], file_path: str) -> int:
+    count = 0
+    with open(file_path, mode="w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+
+        for row in rows:
+            writer.writerow(csv_export_row(row))
+            count += 1
+
+    return count
+
+
+_INSERT_ROLL_SQL = """
+    INSERT INTO rolls (
+        game_session_id,
+        time,
+        mode,
+        dice,
+        dice_type,
+        sides,
+        rolls,
+        total,
+        has_match,
+        outcome,
+        points_delta,
+        points_total
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+RollRow = tuple[str, str, str, int, str, int, bytes, int, int, str, int, int]
+
+
+def roll_row(result: RollResult, *, time: str | None = None) -> RollRow:
+    """Insert parameters for ``result``; ``time`` defaults to now."""
+    return (
+        result.context.game_session_id,
+        time if time is not None else utc_now_iso(),
+        result.context.mode.name.lower(),
+        result.context.num_dice,
+        result.context.dice_type,
+        result.context.sides,
+        encode_rolls(result.rolls),
+        result.total,
+        int(result.has_match),
+        result.outcome,
+        result.points_delta,
+        result.points_total,
+    )
+
+
+def save_roll(result: RollResult, *, conn: sqlite3.Connection | None = None) -> None:
+    with optional_connection(conn) as db:
+        db.execute(_INSERT_ROLL_SQL, roll_row(result))
+
+
+def save_roll_rows(
+    rows: Iterable[RollRow], *, conn: sqlite3.Connection | None = None
+) -> int:
+    """Inserts prepared rows with one ``executemany``; returns the row count."""
+    with optional_connection(conn) as db:
+        return db.executemany(_INSERT_ROLL_SQL, rows).rowcount
+
+
+def save_rolls(
+    results: Iterable[RollResult], *, conn: sqlite3.Connection | None = None
+) -> int:
+    return save_roll_rows((roll_row(result) for result in results), conn=conn)
 
 
 def _row_to_database_record(row: sqlite3.Row) -> DatabaseRecord:
     item = dict(row)
-    item["rolls"] = json.loads(item["rolls"])
+    item["rolls"] = decode_rolls(item["rolls"])
     return cast(DatabaseRecord, item)
 
 
@@ -107,8 +241,14 @@ def last_rolls(n: int) -> list[DatabaseRecord]:
 
 
 def best_roll() -> DatabaseRecord | None:
+    """Highest-total roll (newest on ties), found via ``roll_summary``."""
     with connection() as conn:
-        cur = conn.execute("SELECT * FROM rolls ORDER BY total DESC LIMIT 1")
+        cur = conn.execute("""
+            SELECT rolls.*
+            FROM roll_summary
+            JOIN rolls ON rolls.id = roll_summary.best_roll_id
+            WHERE roll_summary.id = 1
+            """)
         row = cur.fetchone()
         return _row_to_database_record(row) if row else None
 
@@ -141,6 +281,7 @@ def clear_rolls(*, reset_ids: bool = False, vacuum: bool = True) -> int:
         row = cur.fetchone()
         count = int(row["count"]) if row else 0
 
+        conn.execute("DELETE FROM session_stats")
         conn.execute("DELETE FROM rolls")
 
         if reset_ids:
@@ -171,13 +312,38 @@ def count_rolls(*, sides: int | None = None, dice: int | None = None) -> int:
         return int(row["count"]) if row else 0
 
 
+def _keyset_clause(
+    before_id: int | None, after_id: int | None
+) -> tuple[str, list[int], str]:
+    """SQL filter, params and id ordering for cursor-based paging.
+
+    ``before_id`` pages towards older rows; ``after_id`` pages back towards
+    newer ones, so it scans ascending and the caller reverses the page.
+    """
+    if before_id is not None and after_id is not None:
+        raise ValueError("Pass at most one of before_id and after_id")
+    if before_id is not None:
+        return " AND id < ?", [before_id], "DESC"
+    if after_id is not None:
+        return " AND id > ?", [after_id], "ASC"
+    return "", [], "DESC"
+
+
 def paginated_rolls(
     *,
     limit: int,
-    offset: int,
+    offset: int = 0,
     sides: int | None = None,
     dice: int | None = None,
+    before_id: int | None = None,
+    after_id: int | None = None,
 ) -> list[DatabaseRecord]:
+    """Newest-first page of rolls.
+
+    Prefer ``before_id``/``after_id`` (the id of the last/first row of the
+    current page) over ``offset``: keyset pages cost the same at any depth,
+    while ``OFFSET`` walks every skipped row.
+    """
     query = "SELECT * FROM rolls WHERE 1=1"
     params: list[int] = []
 
@@ -189,12 +355,15 @@ def paginated_rolls(
         query += " AND dice = ?"
         params.append(dice)
 
-    query += " ORDER BY id DESC LIMIT ? OFFSET ?"
-    params.extend([limit, offset])
+    keyset, keyset_params, order = _keyset_clause(before_id, after_id)
+    query += keyset + f" ORDER BY id {order} LIMIT ? OFFSET ?"
+    params.extend([*keyset_params, limit, offset])
 
     with connection() as conn:
         cur = conn.execute(query, params)
         rows = cur.fetchall()
+        if order == "ASC":
+            rows.reverse()
         return [_row_to_database_record(row) for row in rows]
 
 
@@ -202,24 +371,33 @@ def paginated_rolls_by_session(
     game_session_id: str,
     *,
     limit: int,
-    offset: int,
+    offset: int = 0,
+    before_id: int | None = None,
+    after_id: int | None = None,
 ) -> list[DatabaseRecord]:
-    query = """
+    keyset, keyset_params, order = _keyset_clause(before_id, after_id)
+    query = f"""
         SELECT *
         FROM rolls
-        WHERE game_session_id = ?
-        ORDER BY id DESC
+        WHERE game_session_id = ?{keyset}
+        ORDER BY id {order}
         LIMIT ? OFFSET ?
     """
 
     with connection() as conn:
-        cur = conn.execute(query, (game_session_id, limit, offset))
+        cur = conn.execute(query, (game_session_id, *keyset_params, limit, offset))
         rows = cur.fetchall()
+        if order == "ASC":
+            rows.reverse()
         return [_row_to_database_record(row) for row in rows]
 
 
 def clear_rolls_by_session(game_session_id: str) -> int:
     with connection() as conn:
+        conn.execute(
+            "DELETE FROM session_stats WHERE game_session_id = ?",
+            (game_session_id,),
+        )
         deleted = conn.execute(
             "DELETE FROM rolls WHERE game_session_id = ?",
             (game_session_id,),
@@ -229,15 +407,15 @@ def clear_rolls_by_session(game_session_id: str) -> int:
 
 
 def session_stats(game_session_id: str) -> SessionStatsRecord:
+    """Stats from the trigger-maintained ``session_stats`` row (O(1))."""
     query = """
     SELECT
-        COUNT(*) AS total_rolls,
-        COALESCE(SUM(total), 0) AS total_roll_value,
-        MAX(total) AS highest_roll,
-        MIN(total) AS lowest_roll,
-        AVG(total) AS average_roll,
-        COALESCE(SUM(has_match), 0) AS total_matches
-    FROM rolls
+        total_rolls,
+        total_roll_value,
+        highest_roll,
+        lowest_roll,
+        total_matches
+    FROM session_stats
     WHERE game_session_id = ?
     """
 
@@ -255,33 +433,33 @@ def session_stats(game_session_id: str) -> SessionStatsRecord:
             "total_matches": 0,
         }
 
+    total_rolls = int(row["total_rolls"])
+    total_roll_value = int(row["total_roll_value"])
     return {
-        "total_rolls": int(row["total_rolls"]),
-        "total_roll_value": int(row["total_roll_value"]),
+        "total_rolls": total_rolls,
+        "total_roll_value": total_roll_value,
         "highest_roll": (
             int(row["highest_roll"]) if row["highest_roll"] is not None else None
         ),
         "lowest_roll": (
             int(row["lowest_roll"]) if row["lowest_roll"] is not None else None
         ),
-        "average_roll": (
-            round(float(row["average_roll"]), 2)
-            if row["average_roll"] is not None
-            else None
-        ),
+        "average_roll": round(total_roll_value / total_rolls, 2),
         "total_matches": int(row["total_matches"]),
     }
 
 
 def overall_stats() -> OverallStats:
+    """Global stats from the trigger-maintained ``roll_summary`` row (O(1))."""
     query = """
     SELECT
-        COUNT(*) AS total_rolls,
-        AVG(total) AS average_total,
-        SUM(has_match) AS total_matches,
-        MAX(total) AS highest_total,
-        MIN(total) AS lowest_total
-    FROM rolls
+        total_rolls,
+        total_sum,
+        total_matches,
+        highest_total,
+        lowest_total
+    FROM roll_summary
+    WHERE id = 1
     """
 
     with connection() as conn:
@@ -297,16 +475,11 @@ def overall_stats() -> OverallStats:
             lowest_total=None,
         )
 
+    total_rolls = int(row["total_rolls"])
     return OverallStats(
-        total_rolls=int(row["total_rolls"]),
-        average_total=(
-            round(float(row["average_total"]), 2)
-            if row["average_total"] is not None
-            else None
-        ),
-        total_matches=(
-            int(row["total_matches"]) if row["total_matches"] is not None else 0
-        ),
+        total_rolls=total_rolls,
+        average_total=round(int(row["total_sum"]) / total_rolls, 2),
+        total_matches=int(row["total_matches"]),
         highest_total=(
             int(row["highest_total"]) if row["highest_total"] is not None else None
         ),
@@ -321,29 +494,7 @@ def export_rolls_to_csv(file_path: str | None = None) -> int:
         config = GameConfig()
         file_path = config.exports.export_path
 
-    query = """
-        SELECT
-            id,
-            game_session_id,
-            time,
-            mode,
-            dice,
-            dice_type,
-            sides,
-            rolls,
-            total,
-            has_match,
-            outcome,
-            points_delta,
-            points_total
-        FROM rolls
-        ORDER BY id DESC
-    """
-
-    with connection() as conn:
-        rows = conn.execute(query).fetchall()
-
-    return _write_rows_to_csv(rows, file_path)
+    return _write_rows_to_csv(iter_export_rows(), file_path)
 
 
 def export_rolls_to_csv_by_session(
@@ -355,27 +506,28 @@ def export_rolls_to_csv_by_session(
         base_path = Path(config.exports.export_path)
         file_path = str(base_path.with_name(f"roll_history_{game_session_id}.csv"))
 
-    query = """
-        SELECT
-            id,
-            game_session_id,
-            time,
-            mode,
-            dice,
-            dice_type,
-            sides,
-            rolls,
-            total,
-            has_match,
-            outcome,
-            points_delta,
-            points_total
-        FROM rolls
-        WHERE game_session_id = ?
-        ORDER BY id DESC
-    """
+    return _write_rows_to_csv(iter_export_rows(game_session_id), file_path)
 
-    with connection() as conn:
-        rows = conn.execute(query, (game_session_id,)).fetchall()
 
-    return _write_rows_to_csv(rows, file_path)
+def columnar_export_path(
+    fmt: ColumnarFormat = "auto", game_session_id: str | None = None
+) -> str:
+    """Default columnar export path: the CSV export path with a new suffix."""
+    config = GameConfig()
+    base_path = Path(config.exports.export_path)
+    if game_session_id is not None:
+        base_path = base_path.with_name(f"roll_history_{game_session_id}.csv")
+    return str(base_path.with_suffix(COLUMNAR_EXTENSIONS[resolve_columnar_format(fmt)]))
+
+
+def export_rolls_columnar(
+    file_path: str | None = None,
+    *,
+    game_session_id: str | None = None,
+    fmt: ColumnarFormat = "auto",
+) -> int:
+    """Columnar counterpart of `export_rolls_to_csv` (Parquet or ``dcol``)."""
+    if file_path is None:
+        file_path = columnar_export_path(fmt, game_session_id)
+
+    return write_columnar(iter_export_rows(game_session_id), file_path, fmt)
@@ -1,7 +1,13 @@
+import os
+import sqlite3
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import TypedDict, cast
 
-from .connection import connection, utc_now_iso
+from .connection import connection, optional_connection, utc_now_iso
 
 
 class GameSessionRecord(TypedDict):
@@ -12,6 +18,132 @@ class GameSessionRecord(TypedDict):
     updated_at: str
 
 
+class SessionCacheStats(TypedDict):
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass(frozen=True)
+class SessionCacheConfig:
+    """Configuration for the in-process game session cache.
+
+    The cache only sees writes made by this process, so multi-process
+    deployments (e.g. several uvicorn workers) should disable it.
+
+    Attributes:
+        size: Maximum cached sessions, evicted least recently used first.
+              ``0`` disables the cache. Overridable with
+              ``DICE_GAME_SESSION_CACHE_SIZE``.
+        ttl: Seconds a cached session is served before it is re-read.
+             Overridable with ``DICE_GAME_SESSION_CACHE_TTL``.
+    """
+
+    size: int = field(
+        default_factory=lambda: int(os.getenv("DICE_GAME_SESSION_CACHE_SIZE", "1024"))
+    )
+    ttl: float = field(
+        default_factory=lambda: float(os.getenv("DICE_GAME_SESSION_CACHE_TTL", "30"))
+    )
+
+
+class SessionCache:
+    """Bounded LRU cache of session records with a time-to-live.
+
+    Every invalidation bumps a version number. A reader takes the version
+    before querying and `put` drops its record if the version moved, so a
+    row read just before a concurrent write commits is never cached.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, GameSessionRecord]] = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def get(self, session_id: str) -> GameSessionRecord | None:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or time.monotonic() >= entry[0]:
+                self._entries.pop(session_id, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return cast(GameSessionRecord, dict(entry[1]))
+
+    def put(self, record: GameSessionRecord, *, version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[record["id"]] = (
+                time.monotonic() + self.ttl,
+                cast(GameSessionRecord, dict(record)),
+            )
+            self._entries.move_to_end(record["id"])
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+            self._version += 1
+
+
+_cache: SessionCache | None = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache() -> SessionCache | None:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            config = SessionCacheConfig()
+            if config.size <= 0:
+                return None
+            _cache = SessionCache(max_size=config.size, ttl=config.ttl)
+        return _cache
+
+
+def session_cache_stats() -> SessionCacheStats:
+    """Hit/miss counters and current size of the session cache."""
+    cache = _get_cache()
+    if cache is None:
+        return {"hits": 0, "misses": 0, "size": 0}
+    return {"hits": cache.hits, "misses": cache.misses, "size": len(cache)}
+
+
+def clear_session_cache() -> None:
+    """Drops the cache (and its counters); the next lookup re-reads the config."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def invalidate_game_session(session_id: str) -> None:
+    """Evicts ``session_id`` from the session cache.
+
+    Writes made with a caller's ``conn`` invalidate as they execute, but
+    only the caller knows when its transaction commits; it should call this
+    again afterwards.
+    """
+    cache = _get_cache()
+    if cache is not None:
+        cache.invalidate(session_id)
+
+
 def create_game_session() -> GameSessionRecord:
     session_id = str(uuid.uuid4())
     now = utc_now_iso()
@@ -40,9 +172,22 @@ def create_game_session() -> GameSessionRecord:
     }
 
 
-def get_game_session(session_id: str) -> GameSessionRecord | None:
-    with connection() as conn:
-        row = conn.execute(
+def get_game_session(
+    session_id: str, *, conn: sqlite3.Connection | None = None
+) -> GameSessionRecord | None:
+    """Looks a session up, from the session cache when possible.
+
+    Reads on a caller's ``conn`` always hit the database, so a transaction
+    sees its own writes and the latest committed points.
+    """
+    cache = _get_cache() if conn is None else None
+    if cache is not None:
+        version = cache.version
+        if (cached := cache.get(session_id)) is not None:
+            return cached
+
+    with optional_connection(conn) as db:
+        row = db.execute(
             """
             SELECT
                 id,
@@ -59,14 +204,19 @@ def get_game_session(session_id: str) -> GameSessionRecord | None:
     if row is None:
         return None
 
-    return cast(GameSessionRecord, dict(row))
+    record = cast(GameSessionRecord, dict(row))
+    if cache is not None:
+        cache.put(record, version=version)
+    return record
 
 
-def update_game_session_points(session_id: str, player_points: int) -> None:
+def update_game_session_points(
+    session_id: str, player_points: int, *, conn: sqlite3.Connection | None = None
+) -> None:
     now = utc_now_iso()
 
-    with connection() as conn:
-        conn.execute(
+    with optional_connection(conn) as db:
+        db.execute(
             """
             UPDATE game_sessions
             SET player_points = ?, updated_at = ?
@@ -74,6 +224,7 @@ def update_game_session_points(session_id: str, player_points: int) -> None:
             """,
             (player_points, now, session_id),
         )
+    invalidate_game_session(session_id)
 
 
 def reset_game_session_points(session_id: str) -> None:
@@ -88,6 +239,7 @@ def reset_game_session_points(session_id: str) -> None:
             """,
             (0, now, session_id),
         )
+    invalidate_game_session(session_id)
 
 
 def delete_game_session(session_id: str) -> int:
@@ -96,5 +248,6 @@ def delete_game_session(session_id: str) -> int:
             "DELETE FROM game_sessions WHERE id = ?",
             (session_id,),
         ).rowcount
+    invalidate_game_session(session_id)
 
     return deleted
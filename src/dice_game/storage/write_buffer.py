@@ -0,0 +1,248 @@
+import atexit
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Literal, cast
+
+from ..domain.models import RollResult
+from .connection import transaction
+from .roll_repository import RollRow, roll_row, save_roll, save_roll_rows
+
+logger = logging.getLogger(__name__)
+
+WriteMode = Literal["strict", "group"]
+
+MAX_FLUSH_ATTEMPTS = 5
+
+
+@dataclass(frozen=True)
+class WriteBufferConfig:
+    """Configuration for persisting rolls.
+
+    Attributes:
+        mode: ``strict`` commits every roll as it happens. ``group`` buffers
+              rolls and commits them in batches: much higher throughput, but
+              a crash loses up to one batch, and readers see a roll only
+              after its batch is flushed. Overridable with
+              ``DICE_GAME_WRITE_MODE``.
+        max_rolls: Flush once this many rolls are pending. Overridable with
+                   ``DICE_GAME_WRITE_BUFFER_SIZE``.
+        max_delay: Flush once the oldest pending roll is this many seconds
+                   old. Overridable with ``DICE_GAME_WRITE_BUFFER_DELAY``.
+    """
+
+    mode: str = field(
+        default_factory=lambda: os.getenv("DICE_GAME_WRITE_MODE", "strict")
+    )
+    max_rolls: int = field(
+        default_factory=lambda: int(os.getenv("DICE_GAME_WRITE_BUFFER_SIZE", "256"))
+    )
+    max_delay: float = field(
+        default_factory=lambda: float(os.getenv("DICE_GAME_WRITE_BUFFER_DELAY", "0.05"))
+    )
+
+
+class RollWriteBuffer:
+    """Write-behind buffer that group-commits rolls with ``executemany``.
+
+    Rows keep the timestamp of when they were added. A background thread
+    flushes on the time threshold; `add` flushes inline on the size one.
+    Flushes are serialized, so rows land in the order they were added.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_rolls: int,
+        max_delay: float,
+        max_attempts: int = MAX_FLUSH_ATTEMPTS,
+    ) -> None:
+        if max_rolls < 1:
+            raise ValueError("max_rolls must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_rolls = max_rolls
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self._failed_attempts = 0
+        self._pending: list[RollRow] = []
+        self._oldest: float | None = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._closed = False
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="roll-write-buffer", daemon=True
+        )
+        self._flusher.start()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def add(self, result: RollResult) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Roll write buffer is closed")
+            self._pending.append(roll_row(result))
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._wakeup.notify()
+            full = len(self._pending) >= self.max_rolls
+
+        if full:
+            # The caller has already committed the turn's points, so failing
+            # here would invite a retry that plays it twice. flush() logs the
+            # error, and the background flusher retries any rows it kept.
+            with contextlib.suppress(Exception):
+                self.flush()
+
+    def flush(self) -> int:
+        """Commits every pending roll in one transaction; returns the count saved.
+
+        If the batch breaks a constraint, say because its session was deleted
+        while a roll was buffered, the rows are inserted one by one and those
+        that fail are logged and dropped.
+
+        A transient error (e.g. a locked database) puts the batch back for a
+        later flush, up to `max_attempts` failures in a row; the batch is then
+        logged and dropped. Any other error also logs and drops the batch, so
+        one bad row cannot block the buffer. Either way the error is re-raised.
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                self._oldest = None
+            if not rows:
+                return 0
+            try:
+                try:
+                    with transaction() as conn:
+                        saved = save_roll_rows(rows, conn=conn)
+                except sqlite3.IntegrityError:
+                    saved = self._save_valid_rows(rows)
+            except sqlite3.OperationalError:
+                self._failed_attempts += 1
+                if self._failed_attempts >= self.max_attempts:
+                    self._failed_attempts = 0
+                    logger.exception(
+                        "Dropped %d buffered rolls after %d failed flushes",
+                        len(rows),
+                        self.max_attempts,
+                    )
+                    raise
+                logger.warning(
+                    "Flush of %d buffered rolls failed (attempt %d of %d)",
+                    len(rows),
+                    self._failed_attempts,
+                    self.max_attempts,
+                    exc_info=True,
+                )
+                # Put the batch back in front so a later flush retries it.
+                with self._lock:
+                    self._pending[:0] = rows
+                    self._oldest = self._oldest or time.monotonic()
+                    self._wakeup.notify()
+                raise
+            except Exception:
+                self._failed_attempts = 0
+                logger.exception("Dropped %d buffered rolls", len(rows))
+                raise
+            self._failed_attempts = 0
+            return saved
+
+    @staticmethod
+    def _save_valid_rows(rows: list[RollRow]) -> int:
+        saved = 0
+        with transaction() as conn:
+            for row in rows:
+                try:
+                    saved += save_roll_rows([row], conn=conn)
+                except sqlite3.IntegrityError as e:
+                    # A failed INSERT only undoes itself; the rest still commit.
+                    logger.warning(
+                        "Dropped buffered roll for session %s: %s", row[0], e
+                    )
+        return saved
+
+    def close(self) -> int:
+        """Stops the background flusher and flushes what is left."""
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        self._flusher.join()
+        return self.flush()
+
+    def _flush_periodically(self) -> None:
+        while True:
+            with self._lock:
+                while not self._closed and (
+                    self._oldest is None
+                    or time.monotonic() - self._oldest < self.max_delay
+                ):
+                    timeout = (
+                        None
+                        if self._oldest is None
+                        else self.max_delay - (time.monotonic() - self._oldest)
+                    )
+                    self._wakeup.wait(timeout)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001 - logged by flush()
+                # Back off before retrying whatever flush() kept.
+                time.sleep(self.max_delay)
+
+
+_buffer: RollWriteBuffer | None = None
+_buffer_lock = threading.Lock()
+
+
+def _get_buffer() -> RollWriteBuffer:
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            config = WriteBufferConfig()
+            _buffer = RollWriteBuffer(
+                max_rolls=config.max_rolls, max_delay=config.max_delay
+            )
+        return _buffer
+
+
+def write_mode() -> WriteMode:
+    """Mode named by ``DICE_GAME_WRITE_MODE`` (default ``strict``)."""
+    mode = WriteBufferConfig().mode
+    if mode not in ("strict", "group"):
+        raise ValueError(f"Unknown write mode: {mode!r}")
+    return cast(WriteMode, mode)
+
+
+def record_roll(result: RollResult) -> None:
+    """Persists ``result`` now (strict) or via the write-behind buffer (group)."""
+    if write_mode() == "group":
+        _get_buffer().add(result)
+    else:
+        save_roll(result)
+
+
+def flush_rolls() -> int:
+    """Commits buffered rolls; call before reading history in group mode."""
+    with _buffer_lock:
+        buffer = _buffer
+    return buffer.flush() if buffer is not None else 0
+
+
+def close_roll_buffer() -> int:
+    """Flushes and stops the process buffer; call on shutdown."""
+    global _buffer
+    with _buffer_lock:
+        buffer, _buffer = _buffer, None
+    return buffer.close() if buffer is not None else 0
+
+
+atexit.register(close_roll_buffer)
@@ -1,23 +1,27 @@
 import sys
 import uuid
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
 from dice_game.api.app import create_app
-from dice_game.storage.connection import connection
+from dice_game.storage.connection import close_pools, connection
 from dice_game.storage.db_init import init_db
+from dice_game.storage.session_repository import clear_session_cache
+from dice_game.storage.write_buffer import close_roll_buffer
 
 
 @pytest.fixture(autouse=True)
-def test_db(tmp_path: Path, monkeypatch) -> None:
+def test_db(tmp_path: Path, monkeypatch) -> Iterator[None]:
     """Automatically set up isolated test database for each test."""
     test_db_path = tmp_path / f"test_rolls_{uuid.uuid4().hex[:8]}.db"
 
     # Access the connection module directly from sys.modules
     connection_module = sys.modules["dice_game.storage.connection"]
     monkeypatch.setattr(connection_module, "DB_PATH", test_db_path)
+    clear_session_cache()
     init_db()
 
     # Ensure foreign keys are enabled
@@ -25,6 +29,12 @@ def test_db(tmp_path: Path, monkeypatch) -> None:
         conn.execute("PRAGMA foreign_keys = ON")
         conn.commit()
 
+    yield
+
+    close_roll_buffer()
+    close_pools()
+    clear_session_cache()
+
 
 @pytest.fixture
 def client() -> TestClient:
@@ -1,12 +1,18 @@
+import csv
+import io
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from dice_game.services import game_session_service
+from dice_game.storage.write_buffer import flush_rolls
 from src.dice_game.api.schemas import (
+    BulkRollResponse,
     DeleteHistoryResponse,
     DeleteSessionResponse,
     ExportHistoryResponse,
     HistoryItemResponse,
+    HistoryPageResponse,
     RollResponse,
     SessionResponse,
     StatsResponse,
@@ -393,6 +399,26 @@ def test_export_history_success(client: TestClient) -> None:
             csv_file.unlink()  # Delete the file
 
 
+def test_export_history_columnar_format(client: TestClient) -> None:
+    session_id = create_session(client)
+    client.post(
+        f"/sessions/{session_id}/roll",
+        json={"mode": "classic", "dice_type": "D6", "num_dice": 2},
+    )
+
+    response = client.get(f"/sessions/{session_id}/history/export?format=columnar")
+    assert response.status_code == 200
+
+    export_result = ExportHistoryResponse.model_validate(response.json())
+    exported_file = Path("src/dice_game/exports") / export_result.file
+    try:
+        assert export_result.records == 1
+        assert exported_file.suffix in {".parquet", ".dcol"}
+        assert exported_file.exists()
+    finally:
+        exported_file.unlink(missing_ok=True)
+
+
 def test_get_session_with_invalid_id_returns_404(client: TestClient) -> None:
     response = client.get("/sessions/not-a-real-session")
 
@@ -430,6 +456,47 @@ def test_history_rejects_invalid_limit(client: TestClient) -> None:
     assert response.status_code == 422
 
 
+def test_history_page_follows_cursor_to_the_end(client: TestClient) -> None:
+    session_id = create_session(client)
+    for _ in range(5):
+        response = client.post(
+            f"/sessions/{session_id}/roll",
+            json={"mode": "classic", "dice_type": "D6", "num_dice": 2},
+        )
+        assert response.status_code == 200
+
+    history = client.get(f"/sessions/{session_id}/history").json()
+
+    items: list[dict] = []
+    params: dict[str, str | int] = {"limit": 2}
+    while True:
+        response = client.get(f"/sessions/{session_id}/history/page", params=params)
+        assert response.status_code == 200
+
+        page = HistoryPageResponse.model_validate(response.json())
+        items.extend(item.model_dump() for item in page.items)
+        if page.next_cursor is None:
+            break
+        params["cursor"] = page.next_cursor
+
+    assert items == history
+
+
+def test_history_page_rejects_invalid_cursor(client: TestClient) -> None:
+    session_id = create_session(client)
+
+    response = client.get(f"/sessions/{session_id}/history/page?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_history_page_with_invalid_session_returns_404(client: TestClient) -> None:
+    response = client.get("/sessions/not-a-real-session/history/page")
+
+    assert response.status_code == 404
+
+
 def test_delete_history_resets_points_and_clears_rolls(client: TestClient) -> None:
     session_id = create_session(client)
 
@@ -460,3 +527,178 @@ def test_delete_history_resets_points_and_clears_rolls(client: TestClient) -> No
     # Schema validation for updated session
     session = SessionResponse.model_validate(session_response.json())
     assert session.player_points == 0  # Confirm points were reset
+
+
+def roll_many(client: TestClient, session_id: str, count: int) -> None:
+    for _ in range(count):
+        response = client.post(
+            f"/sessions/{session_id}/roll",
+            json={"mode": "classic", "dice_type": "D6", "num_dice": 2},
+        )
+        assert response.status_code == 200
+
+
+def test_download_history_streams_csv_oldest_first(client: TestClient) -> None:
+    session_id = create_session(client)
+    roll_many(client, session_id, 3)
+
+    response = client.get(f"/sessions/{session_id}/history/download")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert f"roll_history_{session_id}.csv" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    history = client.get(f"/sessions/{session_id}/history").json()
+    assert [int(row["id"]) for row in rows] == [
+        item["id"] for item in reversed(history)
+    ]
+
+
+def test_download_history_gzip_matches_plain(client: TestClient) -> None:
+    session_id = create_session(client)
+    roll_many(client, session_id, 3)
+
+    plain = client.get(f"/sessions/{session_id}/history/download")
+    compressed = client.get(f"/sessions/{session_id}/history/download?gzip=true")
+
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.content == plain.content  # httpx decodes the gzip stream
+
+
+def test_download_history_resumes_from_range(client: TestClient) -> None:
+    session_id = create_session(client)
+    roll_many(client, session_id, 3)
+    full = client.get(f"/sessions/{session_id}/history/download")
+    etag = full.headers["etag"]
+
+    response = client.get(
+        f"/sessions/{session_id}/history/download",
+        headers={"Range": "bytes=40-", "If-Range": etag},
+    )
+
+    size = len(full.content)
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 40-{size - 1}/{size}"
+    assert response.content == full.content[40:]
+
+    unsatisfiable = client.get(
+        f"/sessions/{session_id}/history/download",
+        headers={"Range": f"bytes={size}-"},
+    )
+    assert unsatisfiable.status_code == 416
+
+
+def test_download_history_ignores_range_for_stale_etag(client: TestClient) -> None:
+    session_id = create_session(client)
+    roll_many(client, session_id, 1)
+    stale = client.get(f"/sessions/{session_id}/history/download").headers["etag"]
+    roll_many(client, session_id, 1)
+
+    response = client.get(
+        f"/sessions/{session_id}/history/download",
+        headers={"Range": "bytes=10-", "If-Range": stale},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != stale
+
+
+def test_download_history_with_invalid_session_returns_404(client: TestClient) -> None:
+    response = client.get("/sessions/not-a-real-session/history/download")
+
+    assert response.status_code == 404
+
+
+def test_bulk_roll_applies_points_cumulatively(client: TestClient) -> None:
+    session_id = create_session(client)
+
+    response = client.post(
+        f"/sessions/{session_id}/rolls",
+        json={"mode": "classic", "dice_type": "D6", "num_dice": 2, "count": 5},
+    )
+    assert response.status_code == 200
+
+    bulk = BulkRollResponse.model_validate(response.json())
+    assert bulk.turns == 5
+    assert bulk.totals == [sum(rolls) for rolls in bulk.rolls]
+    assert bulk.points_total == sum(bulk.points_deltas)
+    assert not any(bulk.extra_turns)
+
+    session = SessionResponse.model_validate(
+        client.get(f"/sessions/{session_id}").json()
+    )
+    assert session.player_points == bulk.points_total
+
+    history = client.get(f"/sessions/{session_id}/history").json()
+    assert [item["total"] for item in reversed(history)] == bulk.totals
+
+
+def test_bulk_roll_plays_lucky_extra_turns(client: TestClient, monkeypatch) -> None:
+    sequence = iter([[3, 3], [1, 2], [2, 5]])
+    monkeypatch.setattr(
+        game_session_service, "roll_dice", lambda context: next(sequence)
+    )
+    session_id = create_session(client)
+
+    response = client.post(
+        f"/sessions/{session_id}/rolls",
+        json={"mode": "lucky", "dice_type": "D6", "num_dice": 2, "count": 2},
+    )
+
+    bulk = BulkRollResponse.model_validate(response.json())
+    assert bulk.turns == 3
+    assert bulk.rolls == [[3, 3], [1, 2], [2, 5]]
+    assert bulk.extra_turns == [True, False, False]
+
+
+def test_bulk_roll_rejects_oversized_batch(client: TestClient) -> None:
+    session_id = create_session(client)
+
+    response = client.post(
+        f"/sessions/{session_id}/rolls",
+        json={"mode": "classic", "dice_type": "D6", "num_dice": 2, "count": 1001},
+    )
+
+    assert response.status_code == 422
+
+
+def test_bulk_roll_with_invalid_session_returns_404(client: TestClient) -> None:
+    response = client.post(
+        "/sessions/not-a-real-session/rolls",
+        json={"mode": "classic", "dice_type": "D6", "num_dice": 2, "count": 3},
+    )
+
+    assert response.status_code == 404
+
+
+def test_group_mode_history_sees_buffered_rolls(
+    client: TestClient, monkeypatch
+) -> None:
+    monkeypatch.setenv("DICE_GAME_WRITE_MODE", "group")
+    monkeypatch.setenv("DICE_GAME_WRITE_BUFFER_DELAY", "60")
+    session_id = create_session(client)
+    roll_many(client, session_id, 2)
+
+    history = client.get(f"/sessions/{session_id}/history")
+    assert len(history.json()) == 2
+    stats = StatsResponse.model_validate(
+        client.get(f"/sessions/{session_id}/stats").json()
+    )
+    assert stats.total_rolls == 2
+
+
+def test_group_mode_deleted_history_stays_deleted(
+    client: TestClient, monkeypatch
+) -> None:
+    monkeypatch.setenv("DICE_GAME_WRITE_MODE", "group")
+    monkeypatch.setenv("DICE_GAME_WRITE_BUFFER_DELAY", "60")
+    session_id = create_session(client)
+    roll_many(client, session_id, 1)
+
+    response = client.delete(f"/sessions/{session_id}/history")
+    assert response.status_code == 200
+    assert DeleteHistoryResponse.model_validate(response.json()).deleted_records == 1
+
+    assert flush_rolls() == 0
+    assert client.get(f"/sessions/{session_id}/history").json() == []
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+import pytest
+
+from dice_game.domain.models import RollContext, RollResult
+from dice_game.domain.modes import GameMode
+from dice_game.storage import aio
+from dice_game.storage.aio import close_db_executor, run_in_db
+
+
+def make_result(session_id: str) -> RollResult:
+    return RollResult(
+        context=RollContext(session_id, GameMode.CLASSIC, "D6", 2, 6),
+        rolls=[3, 4],
+        outcome="draw",
+        points_delta=0,
+        points_total=0,
+    )
+
+
+def test_async_repository_round_trip() -> None:
+    async def scenario() -> None:
+        session = await aio.create_game_session()
+        await aio.save_rolls([make_result(session["id"])] * 3)
+        await aio.update_game_session_points(session["id"], 5)
+
+        stored = await aio.get_game_session(session["id"])
+        assert stored is not None
+        assert stored["player_points"] == 5
+        assert await aio.count_rolls() == 3
+        assert (await aio.session_stats(session["id"]))["total_rolls"] == 3
+
+        page = await aio.paginated_rolls_by_session(session["id"], limit=2)
+        assert [row["rolls"] for row in page] == [[3, 4], [3, 4]]
+
+        assert await aio.delete_game_session(session["id"]) == 1
+        assert await aio.get_game_session(session["id"]) is None
+
+    asyncio.run(scenario())
+
+
+def test_calls_run_on_dedicated_database_thread() -> None:
+    async def scenario() -> set[str]:
+        names = await asyncio.gather(
+            *(run_in_db(lambda: threading.current_thread().name) for _ in range(20))
+        )
+        return set(names)
+
+    close_db_executor()
+    try:
+        assert asyncio.run(scenario()) == {"dice-game-db_0"}
+    finally:
+        close_db_executor()
+
+
+def test_exceptions_propagate_to_awaiting_caller() -> None:
+    def fail() -> None:
+        raise LookupError("missing")
+
+    with pytest.raises(LookupError, match="missing"):
+        asyncio.run(run_in_db(fail))
+
+
+def test_executor_restarts_after_close() -> None:
+    asyncio.run(aio.create_game_session())
+    close_db_executor()
+
+    assert asyncio.run(aio.count_rolls()) == 0
+
+
+def test_file_exports_do_not_block_the_database_thread(monkeypatch) -> None:
+    export_started = threading.Event()
+    release_export = threading.Event()
+    export_threads: list[str] = []
+
+    def slow_export(game_session_id: str, file_path: str | None = None) -> int:
+        export_threads.append(threading.current_thread().name)
+        export_started.set()
+        assert release_export.wait(5)
+        return 0
+
+    monkeypatch.setattr(
+        aio.roll_repository, "export_rolls_to_csv_by_session", slow_export
+    )
+
+    async def scenario() -> int:
+        export = asyncio.create_task(aio.export_rolls_to_csv_by_session("s"))
+        await asyncio.to_thread(export_started.wait, 5)
+        try:
+            # Served while the export is still writing.
+            return await asyncio.wait_for(aio.count_rolls(), timeout=5)
+        finally:
+            release_export.set()
+            await export
+
+    assert asyncio.run(scenario()) == 0
+    assert not export_threads[0].startswith("dice-game-db")
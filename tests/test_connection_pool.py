@@ -0,0 +1,75 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from dice_game.storage.connection import (
+    ConnectionPool,
+    _get_pool,
+    close_pools,
+    connection,
+)
+
+
+def test_connection_reuses_pooled_connection() -> None:
+    with connection() as first:
+        first_id = id(first)
+    with connection() as second:
+        second_id = id(second)
+
+    assert first_id == second_id
+
+
+def test_pool_size_zero_disables_pooling(monkeypatch) -> None:
+    monkeypatch.setenv("DICE_GAME_DB_POOL_SIZE", "0")
+
+    with connection() as conn:
+        conn.execute("SELECT 1")
+
+    assert _get_pool() is None
+
+
+def test_pool_replaces_unhealthy_connection(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "pool.db", size=1, timeout=1)
+
+    broken = pool.acquire()
+    pool.release(broken)
+    broken.close()  # e.g. closed behind the pool's back
+
+    replacement = pool.acquire()
+    assert replacement is not broken
+    assert replacement.execute("SELECT 1").fetchone()[0] == 1
+    pool.release(replacement)
+    pool.close()
+
+
+def test_exhausted_pool_times_out(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "pool.db", size=1, timeout=0.05)
+    held = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    pool.release(held)
+    pool.close()
+
+
+def test_failed_block_rolls_back_before_reuse() -> None:
+    with pytest.raises(RuntimeError), connection() as conn:
+        conn.execute(
+            "INSERT INTO game_sessions VALUES ('s', 0, 'active', 'now', 'now')"
+        )
+        raise RuntimeError("boom")
+
+    with connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM game_sessions").fetchone()[0] == 0
+
+
+def test_close_pools_closes_idle_connections() -> None:
+    with connection() as conn:
+        pooled = conn
+
+    close_pools()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        pooled.execute("SELECT 1")
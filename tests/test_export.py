@@ -1,5 +1,10 @@
-from dice_game.storage import roll_repository
-from dice_game.storage.connection import connection
+import csv
+
+import pytest
+
+from dice_game.services import export_service
+from dice_game.storage import columnar, roll_repository
+from dice_game.storage.connection import close_pools, connection
 
 
 def test_csv_export_creates_file(tmp_path):
@@ -84,3 +89,154 @@ def test_csv_export_contains_expected_rows(tmp_path, unique_session_id):
     assert "LUCKY" in content
     assert "D8" in content
     assert "[8, 8]" in content
+
+
+def insert_rolls(session_id: str, rolls: list[str]) -> None:
+    with connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO game_sessions (
+                id, player_points, status, created_at, updated_at
+            )
+            VALUES (?, 0, 'active', '2026-03-08T09:59:00+00:00',
+                    '2026-03-08T10:00:00+00:00')
+            """,
+            (session_id,),
+        )
+        conn.executemany(
+            """
+            INSERT INTO rolls (
+                game_session_id, time, mode, dice, dice_type, sides, rolls,
+                total, has_match, outcome, points_delta, points_total
+            )
+            VALUES (?, '2026-03-08T10:00:00+00:00', 'classic', 2, 'D6', 6,
+                    ?, 7, 0, 'lose', -3, -3)
+            """,
+            [(session_id, value) for value in rolls],
+        )
+
+
+def test_csv_export_streams_in_batches(tmp_path, unique_session_id, monkeypatch):
+    csv_path = tmp_path / "rolls_export.csv"
+    insert_rolls(unique_session_id, [f"[{i}, {7 - i}]" for i in range(1, 6)])
+    monkeypatch.setattr(roll_repository, "EXPORT_BATCH_ROWS", 2)
+
+    exported = roll_repository.export_rolls_to_csv_by_session(
+        unique_session_id, str(csv_path)
+    )
+
+    with csv_path.open(newline="", encoding="utf-8") as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    assert exported == 5
+    assert [row["rolls"] for row in rows] == [
+        f"[{i}, {7 - i}]" for i in range(5, 0, -1)
+    ]
+    assert list(rows[0]) == roll_repository.CSV_FIELDNAMES
+
+
+def test_dcol_export_round_trips_typed_columns(
+    tmp_path, unique_session_id, monkeypatch
+):
+    path = tmp_path / "rolls_export.dcol"
+    insert_rolls(unique_session_id, [f"[{i}, {7 - i}]" for i in range(1, 6)])
+    monkeypatch.setattr(columnar, "COLUMNAR_ROW_GROUP_ROWS", 2)
+
+    exported = roll_repository.export_rolls_columnar(
+        str(path), game_session_id=unique_session_id, fmt="dcol"
+    )
+
+    table = columnar.read_dcol(str(path))
+    assert exported == 5
+    assert list(table) == roll_repository.CSV_FIELDNAMES
+    assert table["rolls"] == [[i, 7 - i] for i in range(5, 0, -1)]
+    assert table["total"] == [7] * 5
+    assert table["game_session_id"] == [unique_session_id] * 5
+    assert len(list(columnar.iter_dcol_row_groups(str(path)))) == 3
+
+
+def test_parquet_export_writes_list_column(tmp_path, unique_session_id):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "rolls_export.parquet"
+    insert_rolls(unique_session_id, ["[8, 8]", "[1, 2]"])
+
+    exported = roll_repository.export_rolls_columnar(str(path), fmt="parquet")
+
+    table = pq.read_table(path)
+    assert exported == 2
+    assert table.column_names == roll_repository.CSV_FIELDNAMES
+    assert table.column("rolls").to_pylist() == [[1, 2], [8, 8]]
+
+
+def test_columnar_export_path_uses_format_suffix():
+    assert roll_repository.columnar_export_path("dcol").endswith(".dcol")
+
+
+def test_export_rows_release_the_connection_between_batches(
+    unique_session_id, monkeypatch
+):
+    monkeypatch.setenv("DICE_GAME_DB_POOL_SIZE", "1")
+    monkeypatch.setenv("DICE_GAME_DB_POOL_TIMEOUT", "0.05")
+    close_pools()
+    insert_rolls(unique_session_id, [f"[{i}, {7 - i}]" for i in range(1, 6)])
+    monkeypatch.setattr(roll_repository, "EXPORT_BATCH_ROWS", 2)
+
+    rows = roll_repository.iter_export_rows(unique_session_id, newest_first=False)
+    first = next(rows)
+
+    # The only pooled connection is free while the consumer is paused.
+    assert roll_repository.export_bounds(unique_session_id)["records"] == 5
+    assert [first[0], *(row[0] for row in rows)] == sorted(
+        row[0] for row in roll_repository.iter_export_rows(unique_session_id)
+    )
+
+
+def test_download_etag_changes_when_reset_ids_reuse_ids(unique_session_id):
+    insert_rolls(unique_session_id, ["[1, 6]", "[2, 5]"])
+    before = export_service.plan_history_download(unique_session_id)
+
+    roll_repository.clear_rolls(reset_ids=True, vacuum=False)
+    with connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO rolls (
+                game_session_id, time, mode, dice, dice_type, sides, rolls,
+                total, has_match, outcome, points_delta, points_total
+            )
+            VALUES (?, '2026-03-09T08:00:00+00:00', 'classic', 2, 'D6', 6,
+                    '[3, 3]', 6, 1, 'win', 5, 5)
+            """,
+            [(unique_session_id,), (unique_session_id,)],
+        )
+    after = export_service.plan_history_download(unique_session_id)
+
+    assert (after.records, after.first_id, after.up_to_id) == (
+        before.records,
+        before.first_id,
+        before.up_to_id,
+    )
+    assert after.etag != before.etag
+
+
+def test_resumed_download_restarts_from_a_checkpoint(unique_session_id, monkeypatch):
+    insert_rolls(unique_session_id, [f"[{i}, {7 - i}]" for i in range(1, 6)] * 4)
+    monkeypatch.setattr(export_service, "DOWNLOAD_CHUNK_BYTES", 100)
+    download = export_service.plan_history_download(unique_session_id)
+    full = b"".join(export_service.iter_history_csv(download))
+
+    resumed_after: list[int | None] = []
+    real_iter_export_rows = export_service.iter_export_rows
+
+    def tracking_iter_export_rows(*args, **kwargs):
+        resumed_after.append(kwargs.get("after_id"))
+        return real_iter_export_rows(*args, **kwargs)
+
+    monkeypatch.setattr(export_service, "iter_export_rows", tracking_iter_export_rows)
+
+    assert export_service.history_csv_size(download) == len(full)
+    start = len(full) - 30
+    tail = b"".join(export_service.iter_history_csv(download, start=start))
+
+    assert tail == full[start:]
+    # The size came from the first stream; the resume skipped most rows.
+    assert len(resumed_after) == 1
+    assert resumed_after[0] is not None
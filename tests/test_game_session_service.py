@@ -0,0 +1,53 @@
+import threading
+from itertools import pairwise
+
+import pytest
+
+from dice_game.services.exceptions import InvalidDiceTypeError
+from dice_game.services.game_session_service import play_session_turn
+from dice_game.storage.roll_repository import count_rolls, paginated_rolls_by_session
+from dice_game.storage.session_repository import create_game_session, get_game_session
+
+
+def test_concurrent_turns_on_one_session_do_not_lose_points() -> None:
+    session = create_game_session()
+    turns_per_thread = 15
+
+    def play_many() -> None:
+        for _ in range(turns_per_thread):
+            play_session_turn(
+                game_session_id=session["id"],
+                mode_name="classic",
+                dice_type="D6",
+                num_dice=2,
+            )
+
+    threads = [threading.Thread(target=play_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    rows = paginated_rolls_by_session(session["id"], limit=100, offset=0)
+    fetched = get_game_session(session["id"])
+
+    assert len(rows) == 4 * turns_per_thread
+    assert fetched is not None
+    assert fetched["player_points"] == sum(row["points_delta"] for row in rows)
+    # Each roll's running total builds on the previous one.
+    for newer, older in pairwise(rows):
+        assert newer["points_total"] == older["points_total"] + newer["points_delta"]
+
+
+def test_failed_turn_writes_nothing() -> None:
+    session = create_game_session()
+
+    with pytest.raises(InvalidDiceTypeError):
+        play_session_turn(
+            game_session_id=session["id"],
+            mode_name="classic",
+            dice_type="D7",
+            num_dice=2,
+        )
+
+    assert count_rolls() == 0
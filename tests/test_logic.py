@@ -1,12 +1,25 @@
-from dice_game.domain.config import GameConfig
+import dataclasses
+import itertools
+import random
+
+import pytest
+
+from dice_game.domain.config import GameConfig, PointsConfig
 from dice_game.domain.models import RollContext, RollResult, TurnState
 from dice_game.domain.modes import GameMode
 from dice_game.domain.stats import Stats
 from dice_game.services.logic import (
     apply_turn_effects,
     build_temp_result,
+    evaluate_turn,
+    finalize_result,
+    outcome_table,
     resolve_turn,
+    roll_dice_batch,
+    score_total,
+    take_turn,
 )
+from dice_game.services.rng import StdlibRollBackend, default_roll_backend
 
 
 def test_roll_result_total():
@@ -54,6 +67,28 @@ def test_no_match():
     assert result.has_match is False
 
 
+def test_roll_result_is_slotted_and_stores_rolls_as_tuple():
+    context = RollContext("test-session", GameMode.CLASSIC, "D6", 3, 6)
+    rolls = [2, 2, 2]
+
+    result = RollResult(context, rolls, "lose", -1, 0)
+    rolls.append(6)
+
+    assert result.rolls == (2, 2, 2)
+    assert (result.total, result.has_match) == (6, True)
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.total = 7  # type: ignore[misc]
+
+
+def test_empty_roll_has_no_match():
+    context = RollContext("test-session", GameMode.CLASSIC, "D6", 0, 6)
+
+    result = RollResult(context, [], "lose", 0, 0)
+
+    assert (result.total, result.has_match) == (0, False)
+
+
 def test_lucky_mode_match_grants_extra_turn():
     state = TurnState(
         game_config=GameConfig(),
@@ -77,3 +112,105 @@ def test_lucky_mode_match_grants_extra_turn():
 
     assert temp_result.is_lucky_match is True
     assert extra_turn is True
+
+
+def test_roll_dice_batch_returns_compact_rows_in_range():
+    context = RollContext(
+        game_session_id="test-session",
+        mode=GameMode.CLASSIC,
+        dice_type="D8",
+        num_dice=3,
+        sides=8,
+    )
+
+    batch = roll_dice_batch(context, 500, backend=StdlibRollBackend(random.Random(42)))
+    rows = list(batch)
+
+    assert len(batch) == 500
+    assert len(batch.values) == 1_500
+    assert all(len(row) == 3 for row in rows)
+    assert all(1 <= value <= 8 for row in rows for value in row)
+    assert batch.row(499) == rows[-1]
+
+
+def test_roll_dice_batch_is_reproducible_with_seeded_backend():
+    context = RollContext(
+        game_session_id="test-session",
+        mode=GameMode.CLASSIC,
+        dice_type="D6",
+        num_dice=2,
+        sides=6,
+    )
+
+    first = roll_dice_batch(context, 50, backend=default_roll_backend(seed=7))
+    second = roll_dice_batch(context, 50, backend=default_roll_backend(seed=7))
+
+    assert list(first) == list(second)
+
+
+def test_outcome_table_is_memoized_per_scoring_config():
+    context = RollContext(
+        game_session_id="test-session",
+        mode=GameMode.RISK,
+        dice_type="D6",
+        num_dice=2,
+        sides=6,
+    )
+    default_config = GameConfig()
+    generous_config = GameConfig(points=PointsConfig(win=50))
+
+    table = outcome_table(default_config, context)
+
+    assert outcome_table(GameConfig(), context) is table
+    assert outcome_table(generous_config, context) is not table
+    assert outcome_table(generous_config, context).lookup(12, True) == ("win", 50)
+    for total in range(2, 13):
+        assert table.lookup(total, False) == score_total(
+            default_config, context, total, False
+        )
+
+
+@pytest.mark.parametrize("mode", list(GameMode))
+def test_take_turn_matches_the_multi_step_pipeline(mode):
+    context = RollContext("test-session", mode, "D6", 2, 6)
+    config = GameConfig()
+
+    for rolls in itertools.product(range(1, 7), repeat=2):
+        legacy_state = TurnState(config, "test-session", 10, Stats())
+        temp_result = build_temp_result(context, list(rolls), 10)
+        outcome, delta = resolve_turn(config, temp_result)
+        legacy_extra = apply_turn_effects(legacy_state, temp_result, delta)
+        legacy = finalize_result(temp_result, outcome, delta, 10 + delta)
+
+        state = TurnState(config, "test-session", 10, Stats())
+        turn = take_turn(state, context, rolls)
+
+        assert evaluate_turn(config, context, rolls) == (
+            legacy.total,
+            legacy.has_match,
+            outcome,
+            delta,
+        )
+        assert turn.result == legacy
+        assert turn.extra_turn is legacy_extra
+        assert state == legacy_state
+
+
+def test_scored_results_are_not_derived_again(monkeypatch):
+    context = RollContext("test-session", GameMode.LUCKY, "D6", 3, 6)
+    temp_result = build_temp_result(context, [5, 5, 5], 0)
+    _, _, outcome, delta = evaluate_turn(GameConfig(), context, [5, 5, 5])
+    expected = RollResult(context, [5, 5, 5], outcome, delta, delta)
+
+    def derive_again(self):
+        raise AssertionError("total and has_match were derived again")
+
+    monkeypatch.setattr(RollResult, "__post_init__", derive_again)
+    state = TurnState(GameConfig(), "test-session", 0, Stats())
+    turn = take_turn(state, context, [5, 5, 5])
+    assert resolve_turn(state.game_config, temp_result) == (outcome, delta)
+    finalized = finalize_result(temp_result, outcome, delta, delta)
+
+    assert turn.result == finalized == expected
+    assert turn.result.rolls == (5, 5, 5)
+    assert finalized.rolls is temp_result.rolls
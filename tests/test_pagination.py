@@ -1,7 +1,12 @@
 import uuid
 
+import pytest
+
 from dice_game.storage.connection import connection
-from dice_game.storage.roll_repository import paginated_rolls
+from dice_game.storage.roll_repository import (
+    paginated_rolls,
+    paginated_rolls_by_session,
+)
 
 
 def test_first_page_returns_rows():
@@ -86,3 +91,55 @@ def test_paginated_rolls_returns_remaining_rows_on_last_page():
     # Test pagination: get remaining row (should be 1)
     second_page = paginated_rolls(offset=10, limit=10)
     assert len(second_page) == 1
+
+
+def test_keyset_pages_walk_rows_without_gaps_or_repeats():
+    with connection() as conn:
+        session_id = f"test-session-{uuid.uuid4().hex[:8]}"
+        conn.execute(
+            """
+            INSERT INTO game_sessions (
+                id,
+                player_points,
+                status,
+                created_at,
+                updated_at
+            )
+            VALUES (?, 0, 'active', '2026-03-08T10:00:00+00:00',
+                    '2026-03-08T10:00:00+00:00')
+            """,
+            (session_id,),
+        )
+        conn.executemany(
+            """
+            INSERT INTO rolls (
+                game_session_id, time, mode, dice, dice_type, sides, rolls,
+                total, has_match, outcome, points_delta, points_total
+            )
+            VALUES (?, '2026-03-08T10:00:00+00:00', 'classic', 2, 'D6', 6,
+                    '[3, 4]', 7, 0, 'lose', -3, -3)
+            """,
+            [(session_id,)] * 7,
+        )
+
+    expected = [row["id"] for row in paginated_rolls_by_session(session_id, limit=10)]
+
+    seen: list[int] = []
+    before_id = None
+    while True:
+        page = paginated_rolls_by_session(session_id, limit=3, before_id=before_id)
+        if not page:
+            break
+        seen.extend(row["id"] for row in page)
+        before_id = page[-1]["id"]
+
+    assert seen == expected
+
+    # Paging back from the last page returns the middle page, newest first.
+    middle = paginated_rolls_by_session(session_id, limit=3, after_id=expected[6])
+    assert [row["id"] for row in middle] == expected[3:6]
+
+
+def test_keyset_rejects_both_directions():
+    with pytest.raises(ValueError):
+        paginated_rolls(limit=10, before_id=5, after_id=1)
@@ -0,0 +1,83 @@
+import sqlite3
+from collections.abc import Callable
+
+import pytest
+
+from dice_game.storage import roll_repository
+from dice_game.storage.connection import connection
+from dice_game.storage.db_init import MIGRATIONS, init_db
+
+SESSION_ID = "plan-session"
+
+REPOSITORY_QUERIES: dict[str, Callable[[], object]] = {
+    "paginated_rolls_by_session": lambda: roll_repository.paginated_rolls_by_session(
+        SESSION_ID, limit=10, offset=0
+    ),
+    "session_stats": lambda: roll_repository.session_stats(SESSION_ID),
+    "clear_rolls_by_session": lambda: roll_repository.clear_rolls_by_session(
+        SESSION_ID
+    ),
+    "count_rolls(sides)": lambda: roll_repository.count_rolls(sides=6),
+    "count_rolls(dice)": lambda: roll_repository.count_rolls(dice=2),
+    "count_rolls(sides, dice)": lambda: roll_repository.count_rolls(sides=6, dice=2),
+    "paginated_rolls(sides)": lambda: roll_repository.paginated_rolls(
+        limit=10, offset=0, sides=6
+    ),
+    "paginated_rolls(dice)": lambda: roll_repository.paginated_rolls(
+        limit=10, offset=0, dice=2
+    ),
+    "filter_rolls(sides, dice)": lambda: roll_repository.filter_rolls(sides=6, dice=2),
+    "best_roll": roll_repository.best_roll,
+    "overall_stats": roll_repository.overall_stats,
+}
+
+
+def traced_statements(call: Callable[[], object]) -> list[str]:
+    statements: list[str] = []
+    with connection() as conn:
+        # Pooled connections are reused, so the repository call below runs
+        # on this same connection.
+        conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        with connection() as conn:
+            conn.set_trace_callback(None)
+
+    return [
+        sql
+        for sql in statements
+        if "rolls" in sql and sql.lstrip().upper().startswith(("SELECT", "DELETE"))
+    ]
+
+
+def query_plan(conn: sqlite3.Connection, sql: str) -> list[str]:
+    return [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+@pytest.mark.parametrize("name", list(REPOSITORY_QUERIES))
+def test_repository_query_uses_an_index(name: str) -> None:
+    statements = traced_statements(REPOSITORY_QUERIES[name])
+    assert statements, f"{name} issued no rolls query"
+
+    with connection() as conn:
+        for sql in statements:
+            plan = query_plan(conn, sql)
+            assert any(
+                "USING" in detail and ("INDEX" in detail or "PRIMARY KEY" in detail)
+                for detail in plan
+            ), (name, plan)
+            assert "SCAN rolls" not in plan, (name, plan)
+            assert not any("TEMP B-TREE" in detail for detail in plan), (name, plan)
+
+
+def test_migrations_are_recorded_once() -> None:
+    init_db()  # already run by the fixture; must be a no-op the second time
+
+    with connection() as conn:
+        versions = [
+            row["version"]
+            for row in conn.execute("SELECT version FROM schema_migrations")
+        ]
+
+    assert versions == [migration.version for migration in MIGRATIONS]
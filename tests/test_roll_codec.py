@@ -0,0 +1,54 @@
+import pytest
+
+from dice_game.storage import db_init
+from dice_game.storage.connection import connection
+from dice_game.storage.db_init import init_db
+from dice_game.storage.roll_codec import BYTES, NIBBLES, decode_rolls, encode_rolls
+from dice_game.storage.roll_repository import paginated_rolls_by_session
+from dice_game.storage.session_repository import create_game_session
+
+
+@pytest.mark.parametrize(
+    "rolls",
+    [[1], [3, 4], [6, 6, 6], [12, 1, 7, 9, 2], [20, 1], [15, 16], list(range(1, 21))],
+)
+def test_encode_decode_round_trip(rolls: list[int]) -> None:
+    assert decode_rolls(encode_rolls(rolls)) == rolls
+
+
+def test_small_faces_pack_two_dice_per_byte() -> None:
+    encoded = encode_rolls([3, 4, 5])
+
+    assert encoded[0] == NIBBLES
+    assert len(encoded) == 3
+    assert encode_rolls([20, 3])[0] == BYTES
+
+
+def test_decode_accepts_legacy_json_text() -> None:
+    assert decode_rolls("[8, 8]") == [8, 8]
+
+
+def test_migration_converts_json_rows_in_batches(monkeypatch) -> None:
+    session_id = create_game_session()["id"]
+    with connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO rolls (
+                game_session_id, time, mode, dice, dice_type, sides, rolls,
+                total, has_match, outcome, points_delta, points_total
+            )
+            VALUES (?, '2026-03-08T10:00:00+00:00', 'classic', 2, 'D20', 20,
+                    ?, 0, 0, 'lose', -3, -3)
+            """,
+            [(session_id, f"[{i}, {21 - i}]") for i in range(1, 6)],
+        )
+        conn.execute("DELETE FROM schema_migrations WHERE version = 2")
+    before = paginated_rolls_by_session(session_id, limit=10)
+    monkeypatch.setattr(db_init, "MIGRATION_BATCH_ROWS", 2)
+
+    init_db()
+
+    with connection() as conn:
+        kinds = {row[0] for row in conn.execute("SELECT typeof(rolls) FROM rolls")}
+    assert kinds == {"blob"}
+    assert paginated_rolls_by_session(session_id, limit=10) == before
@@ -0,0 +1,78 @@
+import random
+
+from dice_game.domain.models import RollContext, RollResult
+from dice_game.domain.modes import GameMode
+from dice_game.storage.connection import connection
+from dice_game.storage.maintenance import check_roll_summary, rebuild_roll_summary
+from dice_game.storage.roll_repository import (
+    best_roll,
+    clear_rolls,
+    clear_rolls_by_session,
+    overall_stats,
+    save_roll,
+)
+from dice_game.storage.session_repository import (
+    create_game_session,
+    delete_game_session,
+)
+
+
+def save(session_id: str, rolls: list[int]) -> None:
+    save_roll(
+        RollResult(
+            context=RollContext(session_id, GameMode.CLASSIC, "D6", len(rolls), 6),
+            rolls=rolls,
+            outcome="draw",
+            points_delta=0,
+            points_total=0,
+        )
+    )
+
+
+def test_summary_tracks_inserts_and_ties_prefer_newest() -> None:
+    session_id = create_game_session()["id"]
+    for rolls in ([1, 2], [6, 6], [3, 1], [6, 6]):
+        save(session_id, rolls)
+
+    stats = overall_stats()
+    best = best_roll()
+
+    assert stats.total_rolls == 4
+    assert stats.average_total == 7.75
+    assert stats.total_matches == 2
+    assert (stats.lowest_total, stats.highest_total) == (3, 12)
+    assert best is not None
+    with connection() as conn:
+        newest_id = conn.execute("SELECT MAX(id) FROM rolls").fetchone()[0]
+    assert best["id"] == newest_id
+
+
+def test_summary_follows_session_deletes_and_clears() -> None:
+    rng = random.Random(7)
+    sessions = [create_game_session()["id"] for _ in range(3)]
+    for _ in range(30):
+        save(rng.choice(sessions), [rng.randint(1, 6), rng.randint(1, 6)])
+
+    clear_rolls_by_session(sessions[0])
+    assert check_roll_summary()
+    delete_game_session(sessions[1])
+    assert check_roll_summary()
+
+    clear_rolls(vacuum=False)
+    assert check_roll_summary()
+    assert overall_stats().total_rolls == 0
+    assert best_roll() is None
+
+
+def test_rebuild_repairs_drifted_summary() -> None:
+    session_id = create_game_session()["id"]
+    save(session_id, [2, 3])
+    with connection() as conn:
+        conn.execute("UPDATE roll_summary SET total_rolls = 42, best_roll_id = NULL")
+
+    assert not check_roll_summary()
+    rebuild_roll_summary()
+
+    assert check_roll_summary()
+    assert overall_stats().total_rolls == 1
+    assert best_roll() is not None
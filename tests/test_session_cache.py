@@ -0,0 +1,148 @@
+import pytest
+
+from dice_game.services.game_session_service import play_session_turn
+from dice_game.storage.connection import connection
+from dice_game.storage.session_repository import (
+    GameSessionRecord,
+    SessionCache,
+    clear_session_cache,
+    create_game_session,
+    delete_game_session,
+    get_game_session,
+    reset_game_session_points,
+    session_cache_stats,
+    update_game_session_points,
+)
+
+
+def make_record(session_id: str) -> GameSessionRecord:
+    return {
+        "id": session_id,
+        "player_points": 0,
+        "status": "active",
+        "created_at": "t",
+        "updated_at": "t",
+    }
+
+
+def set_points_behind_cache(session_id: str, points: int) -> None:
+    with connection() as conn:
+        conn.execute(
+            "UPDATE game_sessions SET player_points = ? WHERE id = ?",
+            (points, session_id),
+        )
+
+
+def test_repeated_lookups_hit_the_cache() -> None:
+    session_id = create_game_session()["id"]
+
+    get_game_session(session_id)
+    get_game_session(session_id)
+    get_game_session(session_id)
+
+    assert session_cache_stats() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_cached_record_is_served_without_querying() -> None:
+    session_id = create_game_session()["id"]
+    get_game_session(session_id)
+
+    set_points_behind_cache(session_id, 42)
+
+    cached = get_game_session(session_id)
+    assert cached is not None
+    assert cached["player_points"] == 0
+
+
+@pytest.mark.parametrize(
+    ("write", "expected_points"),
+    [
+        (lambda session_id: update_game_session_points(session_id, 7), 7),
+        (reset_game_session_points, 0),
+    ],
+)
+def test_writes_invalidate_the_cached_session(write, expected_points) -> None:
+    session_id = create_game_session()["id"]
+    get_game_session(session_id)
+    set_points_behind_cache(session_id, 3)
+
+    write(session_id)
+
+    session = get_game_session(session_id)
+    assert session is not None
+    assert session["player_points"] == expected_points
+    assert session_cache_stats()["misses"] == 2
+
+
+def test_delete_invalidates_the_cached_session() -> None:
+    session_id = create_game_session()["id"]
+    get_game_session(session_id)
+
+    assert delete_game_session(session_id) == 1
+    assert get_game_session(session_id) is None
+
+
+def test_turn_transaction_invalidates_after_commit() -> None:
+    session_id = create_game_session()["id"]
+    get_game_session(session_id)
+
+    turn = play_session_turn(
+        game_session_id=session_id, mode_name="classic", dice_type="D6", num_dice=2
+    )
+
+    session = get_game_session(session_id)
+    assert session is not None
+    assert session["player_points"] == turn.result.points_total
+
+
+def test_mutating_a_returned_record_does_not_touch_the_cache() -> None:
+    session_id = create_game_session()["id"]
+    record = get_game_session(session_id)
+    assert record is not None
+    record["player_points"] = 99
+
+    cached = get_game_session(session_id)
+    assert cached is not None
+    assert cached["player_points"] == 0
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = SessionCache(max_size=2, ttl=60)
+    cache.put(make_record("a"), version=cache.version)
+    cache.put(make_record("b"), version=cache.version)
+    assert cache.get("a") is not None
+    cache.put(make_record("c"), version=cache.version)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_entries_expire_after_ttl() -> None:
+    cache = SessionCache(max_size=8, ttl=0)
+    cache.put(make_record("a"), version=cache.version)
+
+    assert cache.get("a") is None
+
+
+def test_put_is_dropped_when_an_invalidation_raced_the_read() -> None:
+    cache = SessionCache(max_size=8, ttl=60)
+    version = cache.version
+    cache.invalidate("a")
+    cache.put(make_record("a"), version=version)
+
+    assert len(cache) == 0
+
+
+def test_cache_can_be_disabled(monkeypatch) -> None:
+    monkeypatch.setenv("DICE_GAME_SESSION_CACHE_SIZE", "0")
+    clear_session_cache()
+    session_id = create_game_session()["id"]
+    get_game_session(session_id)
+
+    set_points_behind_cache(session_id, 5)
+
+    session = get_game_session(session_id)
+    assert session is not None
+    assert session["player_points"] == 5
+    assert session_cache_stats() == {"hits": 0, "misses": 0, "size": 0}
@@ -0,0 +1,93 @@
+from dice_game.domain.models import RollContext, RollResult
+from dice_game.domain.modes import GameMode
+from dice_game.storage.connection import connection
+from dice_game.storage.maintenance import (
+    check_session_stats,
+    main,
+    rebuild_session_stats,
+)
+from dice_game.storage.roll_repository import (
+    clear_rolls,
+    clear_rolls_by_session,
+    save_roll,
+    session_stats,
+)
+from dice_game.storage.session_repository import (
+    create_game_session,
+    delete_game_session,
+)
+
+
+def save(session_id: str, rolls: list[int]) -> None:
+    save_roll(
+        RollResult(
+            context=RollContext(session_id, GameMode.CLASSIC, "D6", len(rolls), 6),
+            rolls=rolls,
+            outcome="draw",
+            points_delta=0,
+            points_total=0,
+        )
+    )
+
+
+def test_stats_follow_each_saved_roll() -> None:
+    session_id = create_game_session()["id"]
+
+    for rolls in ([1, 2], [6, 6], [3, 1]):
+        save(session_id, rolls)
+
+    stats = session_stats(session_id)
+    assert stats["total_rolls"] == 3
+    assert stats["total_roll_value"] == 19
+    assert stats["highest_roll"] == 12
+    assert stats["lowest_roll"] == 3
+    assert stats["average_roll"] == 6.33
+    assert stats["total_matches"] == 1
+    assert check_session_stats() == []
+
+
+def test_clearing_rolls_resets_stats() -> None:
+    session_id = create_game_session()["id"]
+    save(session_id, [6, 6])
+
+    clear_rolls_by_session(session_id)
+    assert session_stats(session_id)["total_rolls"] == 0
+
+    save(session_id, [1, 2])
+    assert session_stats(session_id)["highest_roll"] == 3
+
+    clear_rolls(vacuum=False)
+    assert session_stats(session_id)["total_rolls"] == 0
+    assert check_session_stats() == []
+
+
+def test_deleting_session_drops_its_stats_row() -> None:
+    session_id = create_game_session()["id"]
+    save(session_id, [2, 2])
+
+    delete_game_session(session_id)
+
+    with connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM session_stats").fetchone()[0]
+    assert count == 0
+
+
+def test_checker_detects_and_rebuilds_drift(capsys) -> None:
+    session_id = create_game_session()["id"]
+    save(session_id, [4, 5])
+    save(session_id, [1, 1])
+    with connection() as conn:
+        conn.execute(
+            "UPDATE session_stats SET total_rolls = 99, highest_roll = 2 "
+            "WHERE game_session_id = ?",
+            (session_id,),
+        )
+
+    assert check_session_stats() == [session_id]
+    assert main([]) == 1
+
+    assert rebuild_session_stats(session_id) == 1
+    assert check_session_stats() == []
+    assert session_stats(session_id)["highest_roll"] == 9
+    assert main(["--repair"]) == 0
+    assert "0 session(s) out of date" in capsys.readouterr().out
@@ -0,0 +1,333 @@
+import itertools
+import signal
+import threading
+
+import pytest
+
+from dice_game import main
+from dice_game.cli.printing import print_simulation_report
+from dice_game.domain.config import GameConfig
+from dice_game.domain.models import RollContext, TurnState
+from dice_game.domain.modes import GameMode
+from dice_game.domain.stats import Stats
+from dice_game.services import simulation
+from dice_game.services.simulation import (
+    SimulationProgress,
+    SimulationTally,
+    _tally_roll_matrix,
+    _tally_rolls,
+    exact_simulation,
+    iter_simulation,
+    simulate,
+    total_ways,
+)
+
+
+def make_context(mode: GameMode = GameMode.CLASSIC, num_dice: int = 2, sides: int = 6):
+    return RollContext(
+        game_session_id="simulation",
+        mode=mode,
+        dice_type=f"D{sides}",
+        num_dice=num_dice,
+        sides=sides,
+    )
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_simulate_report_is_consistent(engine: str) -> None:
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    report = simulate(
+        game_config=GameConfig(),
+        context=make_context(),
+        trials=2_000,
+        engine=engine,  # type: ignore[arg-type]
+    )
+
+    assert report.config.trials == 2_000
+    assert sum(report.counts.outcome_counts.values()) == 2_000
+    assert sum(report.counts.total_distribution.values()) == 2_000
+    assert set(report.counts.total_distribution) <= set(range(2, 13))
+    assert 2 <= report.averages.avg_total <= 12
+
+
+def test_simulate_with_zero_trials_returns_empty_report() -> None:
+    report = simulate(game_config=GameConfig(), context=make_context(), trials=0)
+
+    assert report.config.trials == 0
+    assert report.counts.total_distribution == {}
+    assert report.match_probability == 0.0
+
+
+def test_simulate_rejects_unknown_engine() -> None:
+    with pytest.raises(ValueError):
+        simulate(
+            game_config=GameConfig(),
+            context=make_context(),
+            trials=10,
+            engine="fortran",  # type: ignore[arg-type]
+        )
+
+
+@pytest.mark.parametrize("mode", list(GameMode))
+def test_vectorized_engine_matches_python_engine_on_same_rolls(
+    mode: GameMode,
+) -> None:
+    np = pytest.importorskip("numpy")
+    context = make_context(mode=mode, num_dice=3, sides=4)
+    every_roll = [list(rolls) for rolls in itertools.product(range(1, 5), repeat=3)]
+
+    python_tally = SimulationTally()
+    _tally_rolls(GameConfig(), context, every_roll, python_tally)
+
+    numpy_tally = SimulationTally()
+    matrix = np.array(every_roll, dtype=np.uint8)
+    _tally_roll_matrix(GameConfig(), context, matrix, numpy_tally)
+
+    assert numpy_tally == python_tally
+
+
+def test_total_ways_for_two_d6() -> None:
+    ways = total_ways(2, 6)
+
+    assert ways[7] == 6
+    assert ways[2] == ways[12] == 1
+    assert sum(ways.values()) == 36
+
+
+@pytest.mark.parametrize("mode", list(GameMode))
+def test_exact_simulation_matches_full_enumeration(mode: GameMode) -> None:
+    context = make_context(mode=mode, num_dice=3, sides=4)
+    every_roll = [list(rolls) for rolls in itertools.product(range(1, 5), repeat=3)]
+
+    enumerated = SimulationTally()
+    _tally_rolls(GameConfig(), context, every_roll, enumerated)
+
+    assert exact_simulation(
+        game_config=GameConfig(), context=context
+    ) == enumerated.to_report(context, exact=True)
+
+
+def test_simulate_exact_method_reports_exact_probabilities() -> None:
+    report = simulate(
+        game_config=GameConfig(),
+        context=make_context(),
+        trials=0,
+        method="exact",
+    )
+
+    assert report.config.exact is True
+    assert report.config.trials == 36
+    assert report.match_probability == pytest.approx(1 / 6)
+    assert report.averages.avg_total == pytest.approx(7.0)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_seeded_simulation_is_reproducible_across_worker_counts(
+    engine: str, monkeypatch
+) -> None:
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(simulation, "SIMULATION_BLOCK_TRIALS", 500)
+
+    def run(workers: int):
+        return simulate(
+            game_config=GameConfig(),
+            context=make_context(mode=GameMode.LUCKY),
+            trials=2_200,
+            engine=engine,  # type: ignore[arg-type]
+            seed=1234,
+            workers=workers,
+        )
+
+    serial = run(1)
+
+    assert serial == run(1)
+    assert serial == run(3)
+    assert serial.config.trials == 2_200
+
+
+def test_simulate_rejects_non_positive_workers() -> None:
+    with pytest.raises(ValueError):
+        simulate(game_config=GameConfig(), context=make_context(), trials=10, workers=0)
+
+
+def test_adaptive_simulation_stops_once_precise_enough() -> None:
+    report = simulate(
+        game_config=GameConfig(),
+        context=make_context(mode=GameMode.LUCKY),
+        trials=1_000_000,
+        engine="python",
+        seed=7,
+        epsilon=0.01,
+    )
+
+    assert report.precision is not None
+    assert report.precision.converged is True
+    assert report.precision.half_width <= 0.01
+    assert report.precision.max_trials == 1_000_000
+    assert report.config.trials < 1_000_000
+    assert report.config.trials % simulation.ADAPTIVE_BLOCK_TRIALS == 0
+
+
+def test_adaptive_simulation_respects_the_trial_cap(monkeypatch) -> None:
+    monkeypatch.setattr(simulation, "ADAPTIVE_BLOCK_TRIALS", 100)
+
+    report = simulate(
+        game_config=GameConfig(),
+        context=make_context(),
+        trials=250,
+        engine="python",
+        seed=7,
+        epsilon=0.0001,
+    )
+
+    assert report.config.trials == 250
+    assert report.precision is not None
+    assert report.precision.converged is False
+    assert report.precision.half_width > 0.0001
+
+
+def test_fixed_simulation_reports_its_precision() -> None:
+    report = simulate(
+        game_config=GameConfig(),
+        context=make_context(),
+        trials=4_000,
+        engine="python",
+        seed=7,
+        confidence=0.99,
+    )
+
+    assert report.precision is not None
+    assert report.precision.epsilon is None
+    assert report.precision.confidence == 0.99
+    assert 0 < report.precision.half_width < 0.05
+
+
+def test_wilson_half_width_stays_positive_for_unseen_outcomes() -> None:
+    tally = SimulationTally(trials=1_000, match_count=0)
+    tally.outcome_counter.update({"win": 0, "draw": 0, "lose": 1_000})
+
+    assert tally.half_width(1.96) > 0
+    assert SimulationTally().half_width(1.96) == float("inf")
+
+
+@pytest.mark.parametrize("kwargs", [{"epsilon": 0}, {"confidence": 1.0}])
+def test_simulate_rejects_invalid_precision_targets(kwargs) -> None:
+    with pytest.raises(ValueError):
+        simulate(game_config=GameConfig(), context=make_context(), trials=10, **kwargs)
+
+
+def test_iter_simulation_streams_partial_snapshots(monkeypatch) -> None:
+    monkeypatch.setattr(simulation, "SIMULATION_BLOCK_TRIALS", 100)
+    reports = list(
+        iter_simulation(
+            game_config=GameConfig(),
+            context=make_context(),
+            trials=1_000,
+            engine="python",
+            seed=5,
+            report_every=300,
+        )
+    )
+
+    *snapshots, final = reports
+    assert [report.config.trials for report in snapshots] == [300, 600, 900]
+    assert all(report.partial for report in snapshots)
+    assert final.partial is False
+    assert final == simulate(
+        game_config=GameConfig(),
+        context=make_context(),
+        trials=1_000,
+        engine="python",
+        seed=5,
+    )
+
+
+def test_progress_callback_sees_every_report(monkeypatch) -> None:
+    monkeypatch.setattr(simulation, "SIMULATION_BLOCK_TRIALS", 100)
+    seen: list[SimulationProgress] = []
+
+    simulate(
+        game_config=GameConfig(),
+        context=make_context(),
+        trials=250,
+        engine="python",
+        seed=5,
+        on_progress=seen.append,
+    )
+
+    assert [progress.trials for progress in seen] == [100, 200, 250]
+    assert seen[-1].fraction == 1.0
+    assert all(progress.max_trials == 250 for progress in seen)
+    assert all(progress.trials_per_second > 0 for progress in seen)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cancelled_simulation_keeps_completed_trials(monkeypatch, workers) -> None:
+    monkeypatch.setattr(simulation, "SIMULATION_BLOCK_TRIALS", 100)
+    cancel = threading.Event()
+
+    def stop_after_two_blocks(progress: SimulationProgress) -> None:
+        if progress.trials >= 200:
+            cancel.set()
+
+    report = simulate(
+        game_config=GameConfig(),
+        context=make_context(),
+        trials=10_000,
+        engine="python",
+        seed=5,
+        workers=workers,
+        cancel=cancel,
+        on_progress=stop_after_two_blocks,
+    )
+
+    assert report.partial is True
+    assert report.config.trials == 300
+    assert sum(report.counts.outcome_counts.values()) == 300
+    assert report.precision is not None
+
+
+def test_simulate_rejects_non_positive_report_interval() -> None:
+    with pytest.raises(ValueError):
+        simulate(
+            game_config=GameConfig(), context=make_context(), trials=10, report_every=0
+        )
+
+
+def test_ctrl_c_in_the_cli_prints_a_partial_report(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(simulation, "SIMULATION_BLOCK_TRIALS", 100)
+    progress_lines: list[int] = []
+
+    def interrupt_once(progress: SimulationProgress) -> None:
+        progress_lines.append(progress.trials)
+        if len(progress_lines) == 1:
+            signal.raise_signal(signal.SIGINT)
+
+    monkeypatch.setattr(main, "print_simulation_progress", interrupt_once)
+    state = TurnState(GameConfig(), "simulation", 0, Stats())
+    previous = signal.getsignal(signal.SIGINT)
+
+    report = main.run_simulation(state, make_context(), 1_000_000, None)
+
+    assert signal.getsignal(signal.SIGINT) is previous
+    assert report.partial is True
+    assert report.config.trials == 200
+    assert progress_lines == [100, 200]
+
+    print_simulation_report(report)
+    assert "Stopped early: partial results from the first 200 trials" in (
+        capsys.readouterr().out
+    )
+
+
+def test_progress_line_shows_rate() -> None:
+    report = simulate(
+        game_config=GameConfig(), context=make_context(), trials=50, engine="python"
+    )
+    progress = SimulationProgress(report, max_trials=200, elapsed=0.5)
+
+    assert progress.fraction == 0.25
+    assert progress.trials_per_second == 100.0
@@ -0,0 +1,46 @@
+import pytest
+
+from dice_game.storage.connection import (
+    close_pools,
+    connection,
+    storage_profile,
+    transaction,
+)
+from dice_game.storage.db_init import init_db
+
+
+def test_performance_profile_is_applied_by_default() -> None:
+    with connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 10_000
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+
+def test_default_profile_keeps_rollback_journal(monkeypatch) -> None:
+    monkeypatch.setenv("DICE_GAME_DB_PROFILE", "default")
+    close_pools()
+    init_db()
+
+    with connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
+
+def test_unknown_profile_is_rejected(monkeypatch) -> None:
+    monkeypatch.setenv("DICE_GAME_DB_PROFILE", "turbo")
+
+    with pytest.raises(ValueError):
+        storage_profile()
+
+
+def test_reads_proceed_while_a_write_is_open() -> None:
+    with transaction() as writer:
+        writer.execute(
+            "INSERT INTO game_sessions VALUES ('s', 0, 'active', 'now', 'now')"
+        )
+
+        with connection() as reader:
+            count = reader.execute("SELECT COUNT(*) FROM game_sessions").fetchone()
+
+        assert count[0] == 0  # reader sees the last committed snapshot
@@ -0,0 +1,181 @@
+import csv
+from typing import Any
+
+import pytest
+
+from dice_game.domain.config import GameConfig
+from dice_game.domain.constants import DICE_TYPES
+from dice_game.domain.models import RollContext
+from dice_game.domain.modes import GameMode
+from dice_game.services.simulation import exact_simulation
+from dice_game.services.sweep import (
+    SWEEP_FIELDNAMES,
+    main,
+    sweep,
+    write_sweep,
+)
+from dice_game.storage.columnar import read_dcol
+
+
+def test_default_sweep_covers_the_full_grid() -> None:
+    cells = sweep(game_config=GameConfig())
+
+    assert len(cells) == len(DICE_TYPES) * 19 * len(GameMode)
+    assert {(cell.dice_type, cell.dice, cell.mode) for cell in cells} == {
+        (dice_type, dice, mode)
+        for dice_type in DICE_TYPES
+        for dice in range(2, 21)
+        for mode in GameMode
+    }
+
+
+@pytest.mark.parametrize(
+    ("dice_type", "dice", "mode"),
+    [
+        ("D6", 2, GameMode.CLASSIC),
+        ("D4", 5, GameMode.LUCKY),
+        ("D10", 3, GameMode.RISK),
+    ],
+)
+def test_exact_cells_match_exact_simulation(dice_type, dice, mode) -> None:
+    [cell] = sweep(
+        game_config=GameConfig(),
+        dice_types=[dice_type],
+        dice_counts=[dice],
+        modes=[mode],
+    )
+    context = RollContext("sweep", mode, dice_type, dice, DICE_TYPES[dice_type])
+
+    assert cell.report == exact_simulation(game_config=GameConfig(), context=context)
+    assert cell.report.config.exact
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_monte_carlo_sweep_is_close_to_exact(engine: str) -> None:
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+
+    grid: dict[str, Any] = {"dice_types": ["D6", "D8"], "dice_counts": [2, 3, 4]}
+    exact = sweep(game_config=GameConfig(), **grid)
+    sampled = sweep(
+        game_config=GameConfig(),
+        method="monte_carlo",
+        trials=20_000,
+        engine=engine,  # type: ignore[arg-type]
+        seed=3,
+        **grid,
+    )
+
+    for expected, cell in zip(exact, sampled, strict=True):
+        assert cell.report.config.trials == 20_000
+        for outcome in ("win", "draw", "lose"):
+            assert cell.probability(outcome) == pytest.approx(
+                expected.probability(outcome), abs=0.02
+            )
+        assert cell.report.match_probability == pytest.approx(
+            expected.report.match_probability, abs=0.02
+        )
+
+
+def test_seeded_sweep_is_reproducible_across_workers() -> None:
+    kwargs: dict[str, Any] = {
+        "game_config": GameConfig(),
+        "method": "monte_carlo",
+        "trials": 5_000,
+        "seed": 11,
+        "dice_types": ["D4", "D6", "D12"],
+        "dice_counts": [2, 7],
+    }
+
+    serial = sweep(**kwargs)
+    assert sweep(**kwargs) == serial
+    assert sweep(workers=2, **kwargs) == serial
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"method": "bogus"},
+        {"workers": 0},
+        {"dice_types": ["D7"]},
+        {"dice_counts": []},
+        {"dice_counts": [0, 2]},
+        {"method": "monte_carlo", "trials": 0},
+    ],
+)
+def test_sweep_rejects_invalid_arguments(kwargs) -> None:
+    with pytest.raises(ValueError):
+        sweep(game_config=GameConfig(), **kwargs)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_duplicate_sweep_values_are_counted_once(engine: str) -> None:
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    kwargs: dict[str, Any] = {
+        "game_config": GameConfig(),
+        "method": "monte_carlo",
+        "trials": 2_000,
+        "engine": engine,
+        "seed": 4,
+        "dice_types": ["D6"],
+        "modes": [GameMode.RISK],
+    }
+
+    cells = sweep(dice_counts=[3, 3, 2, 3], **kwargs)
+
+    assert [cell.dice for cell in cells] == [3, 2]
+    assert all(cell.report.config.trials == 2_000 for cell in cells)
+    assert cells == sweep(dice_counts=[3, 2], **kwargs)
+
+
+def test_write_sweep_csv(tmp_path) -> None:
+    cells = sweep(game_config=GameConfig(), dice_types=["D6"], dice_counts=[2, 3])
+    file_path = tmp_path / "sweep.csv"
+
+    assert write_sweep(cells, str(file_path)) == len(cells)
+
+    with open(file_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == SWEEP_FIELDNAMES
+    assert [row["mode"] for row in rows[:3]] == [m.name.lower() for m in GameMode]
+    first = cells[0]
+    assert float(rows[0]["expected_points"]) == pytest.approx(first.expected_points)
+    assert float(rows[0]["p_match"]) == pytest.approx(1 / 6)
+    assert rows[0]["trials"] == "0"
+
+
+def test_write_sweep_dcol_round_trips(tmp_path) -> None:
+    cells = sweep(game_config=GameConfig(), dice_types=["D4", "D20"])
+    file_path = tmp_path / "sweep.dcol"
+
+    assert write_sweep(cells, str(file_path), "columnar") == len(cells)
+
+    columns = read_dcol(str(file_path))
+    assert list(columns) == SWEEP_FIELDNAMES
+    assert columns["dice_type"][:1] == ["D4"]
+    assert columns["expected_points"] == [cell.expected_points for cell in cells]
+    assert columns["p_match"] == [cell.report.match_probability for cell in cells]
+
+
+def test_main_writes_the_sweep(tmp_path, capsys) -> None:
+    file_path = tmp_path / "out.csv"
+
+    assert main(["--out", str(file_path)]) == 0
+
+    with open(file_path, newline="", encoding="utf-8") as f:
+        assert sum(1 for _ in f) == 1 + len(DICE_TYPES) * 19 * len(GameMode)
+    assert "Wrote 342 sweep cells" in capsys.readouterr().out
+
+
+def test_write_sweep_parquet(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    cells = sweep(game_config=GameConfig(), dice_types=["D8"], dice_counts=[4])
+    file_path = tmp_path / "sweep.parquet"
+
+    assert write_sweep(cells, str(file_path), "columnar") == len(cells)
+
+    table = pq.read_table(file_path)
+    assert table.column_names == SWEEP_FIELDNAMES
+    assert str(table.schema.field("p_win").type) == "double"
+    assert table.column("mode").to_pylist() == [m.name.lower() for m in GameMode]
@@ -0,0 +1,192 @@
+import logging
+import sqlite3
+import time
+
+import pytest
+
+from dice_game.domain.models import RollContext, RollResult
+from dice_game.domain.modes import GameMode
+from dice_game.services.game_session_service import play_session_turn
+from dice_game.storage import write_buffer
+from dice_game.storage.roll_repository import count_rolls
+from dice_game.storage.session_repository import (
+    create_game_session,
+    delete_game_session,
+    get_game_session,
+)
+from dice_game.storage.write_buffer import (
+    RollWriteBuffer,
+    flush_rolls,
+    record_roll,
+    write_mode,
+)
+
+
+def make_result(session_id: str) -> RollResult:
+    return RollResult(
+        context=RollContext(session_id, GameMode.CLASSIC, "D6", 2, 6),
+        rolls=[3, 4],
+        outcome="draw",
+        points_delta=0,
+        points_total=0,
+    )
+
+
+def test_buffer_flushes_when_full() -> None:
+    result = make_result(create_game_session()["id"])
+    buffer = RollWriteBuffer(max_rolls=3, max_delay=60)
+    try:
+        buffer.add(result)
+        buffer.add(result)
+        assert count_rolls() == 0
+        assert len(buffer) == 2
+
+        buffer.add(result)
+        assert count_rolls() == 3
+        assert len(buffer) == 0
+    finally:
+        buffer.close()
+
+
+def test_buffer_flushes_after_max_delay() -> None:
+    buffer = RollWriteBuffer(max_rolls=1_000, max_delay=0.02)
+    try:
+        buffer.add(make_result(create_game_session()["id"]))
+
+        deadline = time.monotonic() + 5
+        while count_rolls() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert count_rolls() == 1
+    finally:
+        buffer.close()
+
+
+def test_close_flushes_pending_rolls_and_rejects_new_ones() -> None:
+    result = make_result(create_game_session()["id"])
+    buffer = RollWriteBuffer(max_rolls=1_000, max_delay=60)
+    buffer.add(result)
+
+    assert buffer.close() == 1
+    assert count_rolls() == 1
+    with pytest.raises(RuntimeError):
+        buffer.add(result)
+
+
+def test_record_roll_is_immediate_in_strict_mode() -> None:
+    record_roll(make_result(create_game_session()["id"]))
+
+    assert write_mode() == "strict"
+    assert count_rolls() == 1
+
+
+def test_group_mode_defers_session_turn_rolls(monkeypatch) -> None:
+    monkeypatch.setenv("DICE_GAME_WRITE_MODE", "group")
+    monkeypatch.setenv("DICE_GAME_WRITE_BUFFER_DELAY", "60")
+    session_id = create_game_session()["id"]
+
+    outcome = play_session_turn(
+        game_session_id=session_id, mode_name="classic", dice_type="D6", num_dice=2
+    )
+
+    session = get_game_session(session_id)
+    assert session is not None
+    assert session["player_points"] == outcome.result.points_total
+    assert count_rolls() == 0
+    assert flush_rolls() == 1
+    assert count_rolls() == 1
+
+
+def test_unknown_write_mode_is_rejected(monkeypatch) -> None:
+    monkeypatch.setenv("DICE_GAME_WRITE_MODE", "eventually")
+
+    with pytest.raises(ValueError):
+        write_mode()
+
+
+def test_roll_for_a_deleted_session_is_dropped_not_retried(monkeypatch, caplog) -> None:
+    monkeypatch.setenv("DICE_GAME_WRITE_MODE", "group")
+    monkeypatch.setenv("DICE_GAME_WRITE_BUFFER_DELAY", "60")
+    deleted_id = create_game_session()["id"]
+    kept_id = create_game_session()["id"]
+
+    record_roll(make_result(deleted_id))
+    assert delete_game_session(deleted_id) == 1
+    for _ in range(5):
+        record_roll(make_result(kept_id))
+
+    with caplog.at_level(logging.WARNING, logger="dice_game.storage.write_buffer"):
+        assert flush_rolls() == 5
+
+    assert count_rolls() == 5
+    assert flush_rolls() == 0
+    assert deleted_id in caplog.text
+
+
+def test_transient_errors_keep_the_batch_for_the_next_flush(monkeypatch) -> None:
+    result = make_result(create_game_session()["id"])
+    buffer = RollWriteBuffer(max_rolls=1_000, max_delay=60)
+    real_save_roll_rows = write_buffer.save_roll_rows
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    try:
+        buffer.add(result)
+        buffer.add(result)
+        monkeypatch.setattr(write_buffer, "save_roll_rows", locked)
+        with pytest.raises(sqlite3.OperationalError):
+            buffer.flush()
+        assert len(buffer) == 2
+
+        monkeypatch.setattr(write_buffer, "save_roll_rows", real_save_roll_rows)
+        assert buffer.flush() == 2
+        assert count_rolls() == 2
+    finally:
+        buffer.close()
+
+
+def test_failed_inline_flush_does_not_fail_the_add(monkeypatch) -> None:
+    result = make_result(create_game_session()["id"])
+    buffer = RollWriteBuffer(max_rolls=2, max_delay=60)
+    real_save_roll_rows = write_buffer.save_roll_rows
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    try:
+        monkeypatch.setattr(write_buffer, "save_roll_rows", locked)
+        buffer.add(result)
+        buffer.add(result)
+        assert len(buffer) == 2
+
+        monkeypatch.setattr(write_buffer, "save_roll_rows", real_save_roll_rows)
+        assert buffer.flush() == 2
+    finally:
+        buffer.close()
+
+
+def test_batch_is_dropped_after_max_attempts(monkeypatch, caplog) -> None:
+    result = make_result(create_game_session()["id"])
+    buffer = RollWriteBuffer(max_rolls=1_000, max_delay=60, max_attempts=3)
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    try:
+        buffer.add(result)
+        monkeypatch.setattr(write_buffer, "save_roll_rows", locked)
+        for _ in range(2):
+            with pytest.raises(sqlite3.OperationalError):
+                buffer.flush()
+            assert len(buffer) == 1
+
+        with (
+            caplog.at_level(logging.ERROR, logger="dice_game.storage.write_buffer"),
+            pytest.raises(sqlite3.OperationalError),
+        ):
+            buffer.flush()
+        assert len(buffer) == 0
+        assert "after 3 failed flushes" in caplog.text
+    finally:
+        buffer.close()